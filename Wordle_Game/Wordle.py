@@ -1,118 +1,54 @@
-import random
 import sys
-import time
-import json
-from datetime import datetime
 from pathlib import Path
 
+from wordle_core import (
+    ABSENT,
+    PRESENT,
+    CORRECT,
+    Dictionary,
+    WordListError,
+    open_leaderboard,
+    score_guess,
+)
+from wordle_core.candidates import CandidateTracker
+from wordle_core.hints import prepare_in_background
+from wordle_core.multiboard import BASE_MODE, BOARD_MODES, MultiBoardSession, board_attempts
+from wordle_core.ranking import format_rank
+from wordle_core.replay import save_replay
+from wordle_core.rotation import RotationStore, next_targets
+from wordle_core.session import GameSession, InvalidGuess
+from wordle_core.stats import format_stats
+
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent 
-# File paths
-WORDS_EASY_FILE = SCRIPT_DIR / "words_easy_mode.txt"
-WORDS_MEDIUM_FILE = SCRIPT_DIR / "words_medium_mode.txt"
-ALL_WORDS_FILE = SCRIPT_DIR / "All_the_Words.txt"
+# File paths (word lists are resolved by wordle_core)
 PLACEMATE_FILE = SCRIPT_DIR / "placemate.json"
+# Every finished game, guess by guess (see wordle_core/replay.py)
+REPLAY_FILE = SCRIPT_DIR / "replays.wrl"
+# Which answers each player has had (see wordle_core/rotation.py)
+ROTATION_FILE = SCRIPT_DIR / "rotation.sqlite3"
 
 GREEN = "\x1b[42m\x1b[30m"   # green bg, black text
 YELLOW = "\x1b[43m\x1b[30m"  # yellow bg, black text
 GRAY = "\x1b[100m\x1b[37m"   # dark gray bg, white text
 RESET = "\x1b[0m"
 
-def load_words(path):
-    if not path.exists(): # back up if the file is missing
-        print(f"words file not found: {path}")
-        sys.exit(1)
-    words = []
-    with path.open(encoding="utf-8") as f:
-        # loop through each line in the file
-        for line in f:
-            w = line.strip().lower()
-            # check if the word is 5 letters and alphabetic
-            if len(w) == 5 and w.isalpha():
-              words.append(w)
-    # add to the list
-    if not words:
-        print("No valid 5-letter words found in words.txt")
-        sys.exit(1)
-    return words
-
+STYLES = {CORRECT: GREEN, PRESENT: YELLOW, ABSENT: GRAY}
 
-def load_placemate(path: Path):
-    """Load the leaderboard from placemate.json.
-
-    Returns a list of dicts.
-    """
-    if not path.exists():
-        return []
-    try:
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-        return []
-    except Exception:
-        return []
 
-
-def save_placemate(path: Path, name: str, seconds: float, mode: str):
-    """Save or update a player's best time in the leaderboard for a specific mode.
-    
-    Now includes 'mode' (Easy/Medium) to distinguish records.
-    """
-    leaderboard = load_placemate(path)
-    
-    # Find if player already exists for this specific mode
-    player_index = None
-    for i, entry in enumerate(leaderboard):
-        # We assume entries without a 'mode' key are 'Easy' (legacy support)
-        entry_mode = entry.get("mode", "Easy")
-        if entry.get("name") == name and entry_mode == mode:
-            player_index = i
-            break
-    
-    # Create new entry
-    new_entry = {
-        "name": name,
-        "time": float(seconds),
-        "date": datetime.utcnow().isoformat() + "Z",
-        "mode": mode  # Save the difficulty mode
-    }
-    
-    if player_index is not None:
-        # Player exists in this mode; update only if new time is faster
-        if seconds < leaderboard[player_index].get("time", float("inf")):
-            leaderboard[player_index] = new_entry
-    else:
-        # New player for this mode
-        leaderboard.append(new_entry)
-    
-    try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(leaderboard, f, indent=2)
-    except Exception:
-        print("Warning: could not save placemate record.")
-
-
-def display_top_10(leaderboard, mode):
+def display_top_10(board, mode):
     """Display the top 10 fastest times for the specific difficulty mode."""
-    # Filter leaderboard for the requested mode
-    # We treat missing 'mode' keys as 'Easy' so old records still show up in Easy
-    filtered_board = [
-        entry for entry in leaderboard 
-        if entry.get("mode", "Easy") == mode
-    ]
-    
-    # Sort by time
-    filtered_board.sort(key=lambda x: x.get("time", float("inf")))
+    # The store filters by mode (legacy records count as Easy) and sorts
+    top_10 = board.top(mode, 10)
 
     print("\n" + "="*60)
     print(f"TOP 10 FASTEST TIMES - {mode.upper()} MODE")
     print("="*60)
     
-    if not filtered_board:
+    if not top_10:
         print(f"No records for {mode} mode yet.")
     
-    for i, entry in enumerate(filtered_board[:10], 1):
+    for i, entry in enumerate(top_10, 1):
         name = entry.get("name", "Unknown")
         time_sec = entry.get("time", 0)
         date = entry.get("date", "unknown")
@@ -121,31 +57,46 @@ def display_top_10(leaderboard, mode):
     print("="*60 + "\n")
 
 
+def save_result(board, name, seconds, mode):
+    try:
+        board.record(name, seconds, mode)
+    except Exception:
+        print("Warning: could not save placemate record.")
+
+
 def format_feedback(guess, target):
-    # Standard Wordle marking
-    feedback = [""] * 5
-    target_chars = list(target)
-    used = [False] * 5
-
-    # Greens
-    for i, ch in enumerate(guess):
-        if ch == target[i]:
-            feedback[i] = GREEN + ch.upper() + RESET
-            used[i] = True
-            target_chars[i] = None
-
-    # Yellows and grays
-    for i, ch in enumerate(guess): 
-        if feedback[i]:
-            continue
-        if ch in target_chars:
-            j = target_chars.index(ch) 
-            target_chars[j] = None
-            feedback[i] = YELLOW + ch.upper() + RESET
+    # Standard Wordle marking, coloured with ANSI escapes
+    marks = score_guess(guess, target)
+    return "".join(STYLES[m] + ch.upper() + RESET for ch, m in zip(guess, marks))
+
+def format_boards(guess, board_marks, solved_before):
+    """One guess on every board, side by side.
+
+    ``board_marks`` holds the marks of each board (from one batched
+    score); boards solved by an earlier guess are left blank.
+    """
+    cells = []
+    for marks, done in zip(board_marks, solved_before):
+        if done or marks is None:
+            cells.append(" " * len(guess))
         else:
-            feedback[i] = GRAY + ch.upper() + RESET
+            cells.append("".join(STYLES[m] + ch.upper() + RESET for ch, m in zip(guess, marks)))
+    return "  ".join(cells)
 
-    return "".join(feedback)
+def show_invalid(error):
+    """Print why a guess was rejected, with "did you mean" words if any."""
+    print(error)
+    if error.suggestions:
+        print("Did you mean: " + ", ".join(w.upper() for w in error.suggestions) + "?")
+
+def show_hint(hints):
+    """Print the hint engine's suggestion for the next guess."""
+    suggestion = hints.best_guess()
+    if suggestion is None:
+        print("No word in the list matches the feedback so far.")
+        return
+    left = hints.remaining()
+    print(f"Hint: try {suggestion.upper()} ({left} possible {'word' if left == 1 else 'words'} left)")
 
 def get_difficulty():
     """Ask user to select difficulty."""
@@ -153,86 +104,178 @@ def get_difficulty():
         print("\nSelect Difficulty:")
         print("1. Easy (6 attempts)")
         print("2. Medium (4 attempts)")
-        choice = input("Enter 1 or 2: ").strip()
+        print("3. Hard (6 attempts, every revealed hint must be used)")
+        for i, (name, boards) in enumerate(BOARD_MODES.items(), 4):
+            print(f"{i}. {name} ({boards} words at once, {board_attempts(boards)} attempts)")
+        choice = input("Enter 1-6: ").strip()
         if choice == "1":
             return 6, "Easy"
         elif choice == "2":
             return 4, "Medium"
+        elif choice == "3":
+            return 6, "Hard"
+        elif choice in ("4", "5", "6"):
+            name = list(BOARD_MODES)[int(choice) - 4]
+            return board_attempts(BOARD_MODES[name]), name
         else:
-            print("Invalid choice. Please enter 1 or 2.")
+            print("Invalid choice. Please enter a number from 1 to 6.")
+
+def report_win(board, player, mode_name, elapsed):
+    """Save a winning time and print the player's best and rank."""
+    # Best time for this specific mode (indexed lookup in the store)
+    player_best = board.best(player, mode_name)
+    
+    # Check if record
+    if player_best is None:
+        save_result(board, player, elapsed, mode_name)
+        print(f"🎉 New {mode_name} record! Saved {player} - {elapsed:.2f}s")
+    elif elapsed < player_best:
+        save_result(board, player, elapsed, mode_name)
+        print(f"🎉 New {mode_name} personal best! {player} - {elapsed:.2f}s (was {player_best:.2f}s)")
+    else:
+        print(f"Good game! Your {mode_name} best is still {player_best:.2f}s")
+    
+    rank = board.rank(player, mode_name)
+    if rank is not None:
+        print(f"Your {mode_name} rank: {format_rank(*rank)}")
+
+def report_stats(board, player, mode_name, won, tries):
+    """Count a finished game in the player's stats and print them."""
+    try:
+        stats = board.record_game(player, mode_name, won, tries)
+    except Exception:
+        print("Warning: could not save player stats.")
+        return
+    print(f"\nYour {mode_name} stats:")
+    for line in format_stats(stats):
+        print("  " + line)
+
+def play_multiboard(dictionary, board, player, mode_name, attempts_allowed):
+    """Play a Dordle/Quordle/Octordle game; every guess goes to all unsolved boards."""
+    targets = next_targets(RotationStore(ROTATION_FILE), player, mode_name,
+                           dictionary.targets(BASE_MODE), BOARD_MODES[mode_name])
+    session = MultiBoardSession.start(dictionary, mode_name, targets=targets, max_attempts=attempts_allowed)
+    length = session.length
+    print(f"Guess {session.boards} {length}-letter words. You have {attempts_allowed} tries ({mode_name} Mode).")
+    print(" " * 9 + "  ".join(f"#{b + 1:<{length - 1}}" for b in range(session.boards)))
+
+    while not session.over:
+        turn = session.attempt
+        solved_before = session.solved
+        while True:
+            guess = input(f"[{turn}/{attempts_allowed}] Enter guess: ").strip().lower()
+            try:
+                result = session.guess(guess)
+            except InvalidGuess as e:
+                show_invalid(e)
+                continue
+            break
+        print(" " * 9 + format_boards(result.guess, result.marks, solved_before))
+        for b in result.solved:
+            print(f"Board #{b + 1} solved!")
+        if session.over:
+            save_replay(REPLAY_FILE, session)
+
+    if session.won:
+        elapsed = session.elapsed()
+        print(f"Correct! You found all {session.boards} words in {session.attempt - 1} tries.")
+        print(f"Your time: {elapsed:.2f} seconds")
+        report_win(board, player, mode_name, elapsed)
+    else:
+        words = ", ".join(w.upper() for w in session.targets)
+        print(f"Out of tries. Solved {sum(session.solved)}/{session.boards}. The words were: {words}")
+    report_stats(board, player, mode_name, session.won, session.attempt - 1)
 
 def main():
     # Select difficulty first
     attempts_allowed, mode_name = get_difficulty()
     
-    # Load the correct word list based on difficulty
-    if mode_name == "Easy":
-        target_words = load_words(WORDS_EASY_FILE)
-    else:  # Medium
-        target_words = load_words(WORDS_MEDIUM_FILE)
-    
-    # Load all valid words for guess validation
-    valid_words = load_words(ALL_WORDS_FILE)
-    
-    target = random.choice(target_words)
-    # Uncomment for debugging:
-    # print("(debug) target:", target)
+    # Load all valid words and the answer lists once
+    try:
+        dictionary = Dictionary.load()
+    except WordListError as e:
+        print(e)
+        sys.exit(1)
 
-    # Load and display leaderboard for the selected mode
-    leaderboard = load_placemate(PLACEMATE_FILE)
-    display_top_10(leaderboard, mode_name)
+    # Open the leaderboard (JSON or SQLite, see WORDLE_LEADERBOARD) and show this mode
+    board = open_leaderboard(PLACEMATE_FILE)
+    display_top_10(board, mode_name)
 
     # Ask for player name
     player = input("Enter your name (used for the leaderboard): ").strip()
     if not player:
         player = "Anonymous"
 
-    print(f"Guess the 5-letter word. You have {attempts_allowed} tries ({mode_name} Mode).")
+    if mode_name in BOARD_MODES:
+        play_multiboard(dictionary, board, player, mode_name, attempts_allowed)
+        return
+
+    print(f"Guess the {dictionary.length(mode_name)}-letter word. You have {attempts_allowed} tries ({mode_name} Mode).")
+    print("Type ':hint' for a suggested next guess, ':list' to see possible answers.")
 
-    start_time = time.perf_counter()
+    # The player's next unseen target; the session checks guesses and keeps the clock
+    targets = next_targets(RotationStore(ROTATION_FILE), player, mode_name, dictionary.targets(mode_name))
+    session = GameSession.start(dictionary, mode_name, target=targets[0] if targets else None,
+                                max_attempts=attempts_allowed)
+    # Uncomment for debugging:
+    # print("(debug) target:", session.target)
+    # The matrix and opening table build while the player types
+    hint_future = prepare_in_background(dictionary, mode_name, hard=session.rules is not None)
+    hints = None  # taken from hint_future on the first hint request
+    remaining = CandidateTracker(dictionary.candidate_index(mode_name))
 
-    for turn in range(1, attempts_allowed + 1):
+    while not session.over:
+        turn = session.attempt
         while True:         
             guess = input(f"[{turn}/{attempts_allowed}] Enter guess: ").strip().lower()
-            if len(guess) != 5 or not guess.isalpha():
-                print("Please enter exactly 5 letters.")
+            # Commands start with ":" so they never shadow a word ("hint" and "list" are both valid guesses)
+            if guess == ":hint":
+                if hints is None:
+                    if not hint_future.done():
+                        print("Preparing hints...")
+                    try:
+                        hints = hint_future.result()
+                    except Exception:
+                        print("Hints are not available.")
+                        continue
+                    for past_guess, past_marks in session.history:
+                        hints.update(past_guess, past_marks)
+                show_hint(hints)
+                continue
+            if guess == ":list":
+                sample = remaining.sample(10)
+                more = remaining.count() - len(sample)
+                print(", ".join(w.upper() for w in sample) + (f" and {more} more" if more > 0 else ""))
                 continue
-            if guess not in valid_words:
-                print("Word not in list.")
+            try:
+                result = session.guess(guess)
+            except InvalidGuess as e:
+                show_invalid(e)
                 continue
             break
         
-        print(format_feedback(guess, target))
+        print(format_feedback(result.guess, session.target))
+        if hints is not None:
+            hints.update(guess, result.marks)
+        remaining.update(guess, result.marks)
         
-        if guess == target:             
-            elapsed = time.perf_counter() - start_time
+        if session.over:
+            save_replay(REPLAY_FILE, session)
+
+        if result.solved:             
+            elapsed = session.elapsed()
             print(f"Correct! You found the word in {turn} {'try' if turn==1 else 'tries'}.")
             print(f"Your time: {elapsed:.2f} seconds")
-
-            # Reload to get latest data
-            leaderboard = load_placemate(PLACEMATE_FILE)
-            
-            # Find best time for this specific mode
-            player_best = None
-            for entry in leaderboard:
-                entry_mode = entry.get("mode", "Easy")
-                if entry.get("name") == player and entry_mode == mode_name:
-                    player_best = entry.get("time")
-                    break
-            
-            # Check if record
-            if player_best is None:
-                save_placemate(PLACEMATE_FILE, player, elapsed, mode_name)
-                print(f"🎉 New {mode_name} record! Saved {player} - {elapsed:.2f}s")
-            elif elapsed < player_best:
-                save_placemate(PLACEMATE_FILE, player, elapsed, mode_name)
-                print(f"🎉 New {mode_name} personal best! {player} - {elapsed:.2f}s (was {player_best:.2f}s)")
-            else:
-                print(f"Good game! Your {mode_name} best is still {player_best:.2f}s")
-            
+            report_win(board, player, mode_name, elapsed)
+            report_stats(board, player, mode_name, True, turn)
             return
 
-    print(f"Out of tries. The word was: {target.upper()}")
+        if not session.over:
+            left = remaining.count()
+            print(f"{left} possible {'word' if left == 1 else 'words'} left")
+
+    print(f"Out of tries. The word was: {session.target.upper()}")
+    report_stats(board, player, mode_name, False, attempts_allowed)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
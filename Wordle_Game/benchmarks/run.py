@@ -0,0 +1,312 @@
+"""Benchmarks for the hot paths, with a stored baseline to catch regressions.
+
+Run from the Wordle_Game directory:
+
+    python -m benchmarks.run                     # time everything, compare to baseline.json
+    python -m benchmarks.run --save-baseline     # store the results as the new baseline
+    python -m benchmarks.run --check             # differential feedback check on every pair
+    python -m benchmarks.run --sizes 10,1000,1000000 --only placemate
+
+Results are written as JSON (benchmarks/results.json by default).  Each
+benchmark is reported in seconds per operation (best of several rounds),
+except the *_bytes entries, which are bytes per object.
+A result slower than the baseline by more than its threshold counts as
+a regression and makes the run exit with status 1.  Thresholds are
+relative (0.5 = 50% slower) and can be set per benchmark in the
+baseline file's "thresholds" mapping, with "default" as the fallback.
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime
+from pathlib import Path
+
+from wordle_core import ALL_WORDS_FILE, MODES, Dictionary, load_words, score_guess
+from wordle_core.feedback import pattern_code, score_many
+from wordle_core.matrix import FeedbackMatrix, encode_words, np, pattern_codes
+from wordle_core.placemate import load_placemate, save_placemate
+from wordle_core.session import GameSession
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_FILE = BENCH_DIR / "baseline.json"
+RESULTS_FILE = BENCH_DIR / "results.json"
+DEFAULT_THRESHOLD = 0.5
+DEFAULT_SIZES = (10, 100, 1000, 10_000, 100_000)
+
+
+def reference_feedback(guess, target):
+    """The original per-pair marking from Wordle.py, kept as the oracle."""
+    feedback = [""] * 5
+    marks = [0] * 5
+    target_chars = list(target)
+
+    # Greens
+    for i, ch in enumerate(guess):
+        if ch == target[i]:
+            feedback[i] = "G"
+            marks[i] = 2
+            target_chars[i] = None
+
+    # Yellows and grays
+    for i, ch in enumerate(guess):
+        if feedback[i]:
+            continue
+        if ch in target_chars:
+            j = target_chars.index(ch)
+            target_chars[j] = None
+            feedback[i] = "Y"
+            marks[i] = 1
+        else:
+            feedback[i] = "-"
+    return tuple(marks)
+
+
+def measure(func, min_time=0.2, rounds=5):
+    """Seconds per call of ``func``: best of ``rounds`` timed loops."""
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        took = time.perf_counter() - start
+        if took >= min_time / rounds or number >= 1 << 20:
+            break
+        number *= 4
+    best = took / number
+    for _ in range(rounds - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, (time.perf_counter() - start) / number)
+    return best
+
+
+def bench_load_words(results):
+    for mode, (path, _) in MODES.items():
+        results[f"load_words[{path.name}]"] = measure(lambda p=path: load_words(p))
+    results[f"load_words[{ALL_WORDS_FILE.name}]"] = measure(lambda: load_words(ALL_WORDS_FILE))
+    Dictionary.load()  # make sure the cache exists before timing it
+    results["dictionary_load[cached]"] = measure(Dictionary.load)
+    results["dictionary_load[text]"] = measure(lambda: Dictionary.load(use_cache=False))
+
+
+def bench_feedback(results, dictionary):
+    rng = random.Random(0)
+    valid = list(dictionary.guesses("Medium"))
+    answers = list(dictionary.targets("Medium"))
+    pairs = [(rng.choice(valid), rng.choice(answers)) for _ in range(1000)]
+    n = len(pairs)
+    results["feedback[reference]"] = measure(lambda: [reference_feedback(g, t) for g, t in pairs]) / n
+    results["feedback[score_guess]"] = measure(lambda: [score_guess(g, t) for g, t in pairs]) / n
+    # One guess against 8 boards at a time, as in an Octordle game
+    boards = [(pairs[i][0], [t for _, t in pairs[i:i + 8]]) for i in range(0, n, 8)]
+    results["feedback[score_many]"] = measure(lambda: [score_many(g, ts) for g, ts in boards]) / n
+    if np is None:
+        return
+    matrix = FeedbackMatrix.for_mode(dictionary, "Medium")
+    results["feedback[matrix_lookup]"] = measure(lambda: [matrix.pattern(g, t) for g, t in pairs]) / n
+    rows = np.array([matrix.guesses.index(g) for g, _ in pairs])
+    cols = np.array([matrix.answers.index(t) for _, t in pairs])
+    results["feedback[matrix_gather]"] = measure(lambda: matrix.codes[rows, cols]) / n
+    g = encode_words(valid[:256])
+    a = encode_words(answers)
+    results["feedback[vectorized]"] = measure(lambda: pattern_codes(g, a), rounds=3) / (len(g) * len(a))
+
+
+def bench_validation(results, dictionary):
+    rng = random.Random(1)
+    word_list = load_words(ALL_WORDS_FILE)
+    guesses = [rng.choice(word_list) for _ in range(100)] + ["zzzzz"] * 100
+    n = len(guesses)
+    results["validate[list_scan]"] = measure(lambda: [g in word_list for g in guesses]) / n
+    results["validate[dictionary]"] = measure(lambda: [dictionary.is_valid(g) for g in guesses]) / n
+
+
+def bench_placemate(results, sizes):
+    rng = random.Random(2)
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "placemate.json"
+            entries = [
+                {"name": f"player{i}", "time": rng.uniform(5, 500), "date": "2025-01-01T00:00:00Z",
+                 "mode": rng.choice(list(MODES))}
+                for i in range(size)
+            ]
+            with path.open("w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            # Load first: the save benchmark grows the journal.
+            results[f"placemate_load[{size}]"] = measure(lambda: load_placemate(path), rounds=3)
+            counter = iter(range(10 ** 9))
+            results[f"placemate_save[{size}]"] = measure(
+                lambda: save_placemate(path, f"new{next(counter)}", 42.0, "Easy"), rounds=3)
+            # A growing journal starts background compactions; finish them
+            # before the directory is removed.
+            for thread in threading.enumerate():
+                if thread.name == "placemate-compact":
+                    thread.join()
+
+
+def bench_session(results, dictionary, count=100_000):
+    """Per-guess time and the memory cost of a game in progress."""
+    rng = random.Random(3)
+    answers = dictionary.targets("Medium")
+    # Never the target, so no game ends early
+    guesses = [w for w in ("aahed", "zymic", "xylyl") if w not in answers]
+
+    def play():
+        session = GameSession.start(dictionary, "Medium", rng=rng)
+        for guess in guesses:
+            session.guess(guess)
+
+    results["session[new+3_guesses]"] = measure(play)
+
+    sessions = []
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    for _ in range(count):
+        session = GameSession.start(dictionary, "Medium", rng=rng)
+        session.guess(guesses[0])
+        session.guess(guesses[1])
+        sessions.append(session)
+    used = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    # Leave out the list that holds the sessions
+    results["session_bytes[2_guesses]"] = (used - sys.getsizeof(sessions)) / count
+
+
+def check_feedback(dictionary):
+    """Compare every accelerated implementation with the reference on every pair.
+
+    Returns the number of mismatches (0 means all implementations agree).
+    """
+    mismatches = 0
+    seen = set()
+    for mode in MODES:
+        valid = list(dictionary.guesses(mode))
+        answers = list(dictionary.targets(mode))
+        key = (tuple(answers), dictionary.length(mode), dictionary.language(mode))
+        if key in seen:
+            continue
+        seen.add(key)
+        matrix = FeedbackMatrix.for_mode(dictionary, mode) if np is not None else None
+        start = time.perf_counter()
+        for gi, guess in enumerate(valid):
+            expected = [pattern_code(reference_feedback(guess, t)) for t in answers]
+            if [pattern_code(score_guess(guess, t)) for t in answers] != expected:
+                mismatches += 1
+                print(f"  score_guess differs for {guess!r} ({mode})")
+            if [pattern_code(m) for m in score_many(guess, answers)] != expected:
+                mismatches += 1
+                print(f"  score_many differs for {guess!r} ({mode})")
+            if matrix is not None:
+                if matrix.codes[gi].tolist() != expected:
+                    mismatches += 1
+                    print(f"  matrix differs for {guess!r} ({mode})")
+                if gi % 1000 == 0 and pattern_codes(encode_words([guess]), encode_words(answers))[0].tolist() != expected:
+                    mismatches += 1
+                    print(f"  pattern_codes differs for {guess!r} ({mode})")
+        pairs = len(valid) * len(answers)
+        print(f"{mode}: checked {pairs:,} guess/answer pairs in {time.perf_counter() - start:.1f}s")
+    return mismatches
+
+
+def compare(results, baseline, default_threshold):
+    """Regressions as (name, seconds, baseline seconds, allowed ratio)."""
+    thresholds = baseline.get("thresholds", {})
+    default = thresholds.get("default", default_threshold)
+    regressions = []
+    for name, seconds in results.items():
+        before = baseline.get("results", {}).get(name)
+        if before is None:
+            continue
+        allowed = 1.0 + thresholds.get(name, default)
+        if seconds > before * allowed:
+            regressions.append((name, seconds, before, allowed))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Wordle hot paths.")
+    parser.add_argument("--only", choices=["load", "feedback", "validate", "placemate", "session"], action="append",
+                        help="run only these groups (repeatable)")
+    parser.add_argument("--sizes", default=",".join(map(str, DEFAULT_SIZES)),
+                        help="leaderboard sizes for the placemate benchmarks")
+    parser.add_argument("--output", type=Path, default=RESULTS_FILE)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_FILE)
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="allowed relative slowdown when the baseline sets none")
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--check", action="store_true",
+                        help="differential check of every feedback implementation on every pair")
+    args = parser.parse_args(argv)
+
+    dictionary = Dictionary.load()
+    if args.check:
+        mismatches = check_feedback(dictionary)
+        print("All feedback implementations agree." if not mismatches else f"{mismatches} mismatches!")
+        return 1 if mismatches else 0
+
+    groups = args.only or ["load", "feedback", "validate", "placemate", "session"]
+    results = {}
+    if "load" in groups:
+        bench_load_words(results)
+    if "feedback" in groups:
+        bench_feedback(results, dictionary)
+    if "validate" in groups:
+        bench_validation(results, dictionary)
+    if "placemate" in groups:
+        bench_placemate(results, [int(s) for s in args.sizes.split(",") if s])
+    if "session" in groups:
+        bench_session(results, dictionary)
+
+    for name, value in results.items():
+        if "_bytes" in name:
+            print(f"{name:40s} {value:14.1f} B")
+        else:
+            print(f"{name:40s} {value * 1e6:14.3f} us")
+
+    report = {
+        "meta": {
+            "date": datetime.utcnow().isoformat() + "Z",
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "numpy": np.__version__ if np is not None else None,
+        },
+        "results": results,
+    }
+    with args.output.open("w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+
+    if args.save_baseline:
+        baseline = {"thresholds": {"default": args.threshold}}
+        if args.baseline.exists():
+            with args.baseline.open(encoding="utf-8") as f:
+                baseline["thresholds"] = json.load(f).get("thresholds", baseline["thresholds"])
+        baseline["meta"] = report["meta"]
+        baseline["results"] = results
+        with args.baseline.open("w", encoding="utf-8") as f:
+            json.dump(baseline, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("No baseline yet; run with --save-baseline to create one.")
+        return 0
+    with args.baseline.open(encoding="utf-8") as f:
+        baseline = json.load(f)
+    regressions = compare(results, baseline, args.threshold)
+    for name, seconds, before, allowed in regressions:
+        print(f"REGRESSION {name}: {seconds:.3g} vs {before:.3g} (allowed x{allowed:.2f})")
+    if not regressions:
+        print("No regressions against the baseline.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+"""Tests for wordle_core: python -m pytest -q (from this directory)."""
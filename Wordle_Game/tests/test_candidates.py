@@ -0,0 +1,35 @@
+"""CandidateIndex against filtering the answers one by one."""
+import random
+
+from wordle_core.candidates import CandidateIndex, CandidateTracker
+from wordle_core.feedback import score_guess
+from wordle_core.words import WORDS_EASY_FILE, load_words
+
+# Repeated letters exercise the minimum and maximum letter counts
+DUPLICATES = ["eerie", "geese", "speed", "abbey", "allee", "lolly", "sassy", "crane",
+              "error", "label", "belle", "ebbed", "level", "teeth", "otter", "tweet"]
+
+
+def test_candidate_index_matches_brute_force():
+    rng = random.Random(7)
+    answers = load_words(WORDS_EASY_FILE) + DUPLICATES
+    index = CandidateIndex(answers)
+    for _ in range(40):
+        target = rng.choice(answers)
+        mask = index.all
+        history = []
+        for guess in rng.sample(answers, 4):
+            marks = score_guess(guess, target)
+            history.append((guess, marks))
+            mask = index.apply(mask, guess, marks)
+            expected = [w for w in answers if all(score_guess(g, w) == m for g, m in history)]
+            assert index.words(mask) == expected
+
+
+def test_tracker_counts_and_samples():
+    tracker = CandidateTracker(CandidateIndex(DUPLICATES))
+    assert tracker.count() == len(DUPLICATES)
+    tracker.update("geese", score_guess("geese", "eerie"))
+    left = [w for w in DUPLICATES if score_guess("geese", w) == score_guess("geese", "eerie")]
+    assert tracker.count() == len(left)
+    assert tracker.sample(2) == left[:2]
@@ -0,0 +1,69 @@
+"""Packed DAWG against the sorted word list it was built from."""
+import random
+
+import pytest
+
+from wordle_core.dawg import Dawg
+from wordle_core.words import ALL_WORDS_FILE, LENGTHS, load_words
+
+
+@pytest.fixture(scope="module")
+def lexicon():
+    words = sorted(set(load_words(ALL_WORDS_FILE, LENGTHS)))
+    return words, Dawg.from_words(words)
+
+
+def test_membership_and_order(lexicon):
+    words, dawg = lexicon
+    assert len(dawg) == len(words)
+    assert list(dawg) == words
+    known = set(words)
+    for w in random.Random(9).sample(words, 500):
+        assert w in dawg
+        assert (w[:-1] in dawg) == (w[:-1] in known)
+        assert (w + "s" in dawg) == (w + "s" in known)
+    assert "" not in dawg
+    assert "crane" + "é" not in dawg
+
+
+def test_word_index_round_trip(lexicon):
+    words, dawg = lexicon
+    for i in list(range(20)) + random.Random(3).sample(range(len(words)), 500) + [len(words) - 1]:
+        assert dawg[i] == words[i]
+        assert dawg.index(words[i]) == i
+    assert dawg[-1] == words[-1]
+    with pytest.raises(IndexError):
+        dawg[len(words)]
+    with pytest.raises(ValueError):
+        dawg.index("zzzzq")
+
+
+def test_prefixes_and_lengths(lexicon):
+    words, dawg = lexicon
+    for prefix in ("cr", "st", "q", "xyl", "aard"):
+        expected = [w for w in words if w.startswith(prefix)]
+        assert list(dawg.words(prefix)) == expected
+        assert dawg.has_prefix(prefix) == bool(expected)
+        assert list(dawg.words(prefix, length=6)) == [w for w in expected if len(w) == 6]
+    assert not dawg.has_prefix("qqx")
+    assert list(dawg.words(length=5)) == [w for w in words if len(w) == 5]
+
+
+def test_duplicates_non_ascii_and_empty():
+    dawg = Dawg.from_words(["öl", "ohr", "öl", "ohren", "ähre"])
+    assert list(dawg) == ["ohr", "ohren", "ähre", "öl"]
+    assert dawg.index("öl") == 3 and dawg[2] == "ähre"
+    assert "oh" not in dawg and dawg.has_prefix("oh")
+    empty = Dawg.from_words([])
+    assert len(empty) == 0 and "a" not in empty and list(empty) == []
+    assert not empty.has_prefix("")
+
+
+def test_packed_bytes_load_back(lexicon, tmp_path):
+    words, _ = lexicon
+    path = tmp_path / "words.dawg"
+    path.write_bytes(Dawg.pack(words[:2000]))
+    dawg = Dawg(path.read_bytes())
+    assert list(dawg) == words[:2000]
+    with pytest.raises(ValueError):
+        Dawg(b"XXXX" + bytes(16))
@@ -0,0 +1,104 @@
+"""Hard-mode rules: revealed hints must be reused."""
+import random
+
+import pytest
+
+from wordle_core.feedback import CORRECT, PRESENT, score_guess
+from wordle_core.hardmode import HardModeRules
+from wordle_core.session import GameSession, InvalidGuess
+from wordle_core.words import WORDS_MEDIUM_FILE, Dictionary, load_words
+
+
+def _rules(target, *guesses):
+    rules = HardModeRules()
+    for guess in guesses:
+        rules.update(guess, score_guess(guess, target))
+    return rules
+
+
+def test_green_letters_must_stay():
+    rules = _rules("crane", "crown")  # C, R green
+    assert rules.check("crane") is None
+    assert rules.check("trace") == "1st letter must be C"
+    assert rules.check("cause") == "2nd letter must be R"
+    assert rules.fixed == {0: "c", 1: "r"}
+
+
+def test_yellow_letters_must_move():
+    rules = _rules("crane", "nasty")  # N, A yellow
+    assert rules.check("crane") is None
+    assert rules.check("champ") == "Guess must contain N"
+    assert rules.check("nomad") == "N can't be the 1st letter"
+    assert rules.check("banal") == "A can't be the 2nd letter"
+    assert rules.banned == {"a": {1}, "n": {0}}
+
+
+def test_repeated_letters_raise_the_minimum_count():
+    rules = _rules("speed", "geese")  # E green, E yellow, the third E gray
+    assert rules.min_counts == {"e": 2, "s": 1}
+    assert rules.check("sheep") is None
+    assert rules.check("shelf") == "Guess must contain 2 copies of E"
+    # The count is the most copies found in one guess, not a running total
+    rules.update("melon", score_guess("melon", "speed"))
+    assert rules.min_counts["e"] == 2
+
+
+def test_ordinals_past_three():
+    rules = _rules("abcdefgh", "xxxxxxxh")
+    assert rules.check("abcdefgz") == "8th letter must be H"
+
+
+def test_letters_outside_a_to_z():
+    rules = _rules("äpfel", "äsche", "kappe")
+    assert rules.fixed[0] == "ä"
+    assert rules.check("äpfel") is None
+    assert rules.check("apfel") == "1st letter must be Ä"
+    assert rules.check("äxxxx").startswith("Guess must contain")
+
+
+def _replayed(history):
+    """Reference check: every earlier guess's feedback, replayed against the candidate."""
+    def check(candidate):
+        for guess, marks in history:
+            found = {}
+            for pos, (ch, mark) in enumerate(zip(guess, marks)):
+                if mark == CORRECT and candidate[pos] != ch:
+                    return False
+                if mark == PRESENT and candidate[pos] == ch:
+                    return False
+                if mark:
+                    found[ch] = found.get(ch, 0) + 1
+            if any(candidate.count(ch) < n for ch, n in found.items()):
+                return False
+        return True
+    return check
+
+
+def test_incremental_state_matches_replaying_the_history():
+    words = load_words(WORDS_MEDIUM_FILE)
+    rng = random.Random(5)
+    for _ in range(200):
+        target = rng.choice(words)
+        rules, history = HardModeRules(), []
+        for guess in rng.sample(words, 3):
+            marks = score_guess(guess, target)
+            rules.update(guess, marks)
+            history.append((guess, marks))
+            reference = _replayed(history)
+            for candidate in rng.sample(words, 30):
+                assert (rules.check(candidate) is None) == reference(candidate), (history, candidate)
+
+
+def test_session_rejects_hard_mode_violations():
+    words = ["crane", "crown", "trace", "cramp", "crank"]
+    dictionary = Dictionary(words, {"Hard": words})
+    session = GameSession(dictionary, "Hard", "crane")
+    session.guess("crown")
+    with pytest.raises(InvalidGuess) as e:
+        session.guess("trace")
+    assert e.value.reason == "hard"
+    assert str(e.value) == "Hard mode: 1st letter must be C."
+    with pytest.raises(InvalidGuess, match="Guess must contain N"):
+        session.guess("cramp")
+    assert not session.guess("crank").solved
+    assert session.attempt == 3
@@ -0,0 +1,46 @@
+"""The vectorised feedback matrix against the scalar scorer."""
+import pytest
+
+from wordle_core.feedback import pattern_code, score_guess
+from wordle_core.words import Dictionary
+
+pytest.importorskip("numpy")
+
+from wordle_core.matrix import FeedbackMatrix, compute_matrix  # noqa: E402  (needs NumPy)
+
+# Words with repeated letters, where yellow/gray marking is easy to get wrong
+DUPLICATES = ["eerie", "geese", "speed", "abbey", "allee", "lolly", "sassy", "crane",
+              "error", "label", "belle", "ebbed", "level", "teeth", "otter", "tweet"]
+
+
+def test_pattern_codes_match_score_guess():
+    codes = compute_matrix(DUPLICATES, DUPLICATES, batch_size=5)
+    for g, guess in enumerate(DUPLICATES):
+        for a, answer in enumerate(DUPLICATES):
+            assert codes[g, a] == pattern_code(score_guess(guess, answer)), (guess, answer)
+
+
+def test_matrix_over_a_set_based_dictionary(tmp_path):
+    # Guesses held in a frozenset: rows must follow the sorted list
+    dictionary = Dictionary(DUPLICATES + ["zesty", "about"], {"Easy": DUPLICATES[:6]})
+    matrix = FeedbackMatrix.for_mode(dictionary, "Easy", tmp_path)
+    assert list(matrix.guesses) == sorted(dictionary.guesses("Easy"))
+    for guess in dictionary.guesses("Easy"):
+        for answer in dictionary.targets("Easy"):
+            assert matrix.pattern(guess, answer) == pattern_code(score_guess(guess, answer))
+    with pytest.raises(ValueError):
+        matrix.row("qqqqq")
+
+    # The cache key does not depend on the order the guesses came in
+    reordered = Dictionary(list(reversed(DUPLICATES)) + ["about", "zesty"], {"Easy": DUPLICATES[:6]})
+    assert FeedbackMatrix.for_mode(reordered, "Easy", tmp_path).key == matrix.key
+
+
+def test_new_matrix_prunes_stale_cache_files(tmp_path):
+    stale = [tmp_path / "patterns-0123456789abcdef.npy", tmp_path / "opener-0123456789abcdef.json"]
+    for path in stale:
+        path.write_bytes(b"")
+    dictionary = Dictionary(DUPLICATES, {"Easy": DUPLICATES[:4]})
+    matrix = FeedbackMatrix.for_mode(dictionary, "Easy", tmp_path)
+    assert not any(path.exists() for path in stale)
+    assert (tmp_path / f"patterns-{matrix.key}.npy").exists()
@@ -0,0 +1,78 @@
+"""Streaming leaderboard merge against an in-memory reference."""
+import collections
+import json
+import random
+
+from wordle_core import merge
+from wordle_core.merge import merge_records, write_json
+
+
+def _best(records):
+    """Best record per (mode, name), ties to the first, as merge_records keeps them."""
+    best = {}
+    for record in records:
+        mode = record.get("mode", "Easy")
+        key = (mode, record["name"])
+        if key not in best or record["time"] < best[key]["time"]:
+            best[key] = dict(record, mode=mode)
+    return [best[key] for key in sorted(best)]
+
+
+def test_merge_records_matches_reference(tmp_path):
+    rng = random.Random(11)
+    paths = []
+    everything = []
+    for f in range(5):
+        records = []
+        for _ in range(400):
+            record = {"name": f"p{rng.randrange(150)}", "time": float(rng.randrange(1, 60)),
+                      "date": f"file{f}"}
+            mode = rng.choice(["Easy", "Medium", "Hard", None])
+            if mode is not None:
+                record["mode"] = mode
+            records.append(record)
+        path = tmp_path / f"board{f}.json"
+        if f % 2:
+            write_json(records, path)
+        else:
+            path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+        paths.append(path)
+        everything += records
+
+    skipped = collections.Counter()
+    # A small run size spills several sorted runs to disk
+    merged = list(merge_records(paths, run_records=50, tmp_dir=tmp_path, skipped=skipped))
+    assert merged == _best(everything)
+    assert not skipped
+
+
+def test_malformed_elements_are_skipped_and_counted(tmp_path, monkeypatch):
+    good = [{"name": f"p{i}", "time": i + 0.5, "date": "d", "mode": "Easy"} for i in range(300)]
+    bad = ['{"name": "bad", "time": oops, "date": "x"}',  # invalid value
+           "}",                                            # stray bracket
+           '{"name": "torn\n',                             # string cut by a line break
+           '{"name": "open", "time": 3']                   # element never closed
+    parts = []
+    for i, record in enumerate(good):
+        parts.append(json.dumps(record, indent=2 if i % 2 else None))
+        if i % 37 == 5:
+            parts.append(bad[i % len(bad)])
+    path = tmp_path / "placemate.json"
+    path.write_text("[\n" + ",\n".join(parts) + "\n]", encoding="utf-8")
+    expected_bad = sum(1 for i in range(len(good)) if i % 37 == 5)
+
+    # Tiny reads put element boundaries everywhere across buffer refills
+    for chunk in (7, 64, merge.READ_CHUNK):
+        monkeypatch.setattr(merge, "READ_CHUNK", chunk)
+        skipped = collections.Counter()
+        merged = list(merge_records([path], tmp_dir=tmp_path, skipped=skipped))
+        assert merged == _best(good)
+        assert skipped == {str(path): expected_bad}
+
+
+def test_truncated_file_keeps_what_was_read(tmp_path):
+    records = [{"name": f"p{i}", "time": float(i), "date": None, "mode": "Easy"} for i in range(10)]
+    text = json.dumps(records)
+    path = tmp_path / "placemate.json"
+    path.write_text(text[:text.index('"p7"') + 2], encoding="utf-8")
+    assert list(merge_records([path], tmp_dir=tmp_path)) == _best(records[:7])
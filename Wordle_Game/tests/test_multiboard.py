@@ -0,0 +1,114 @@
+"""Multi-board games, their batch scoring and their replay records."""
+import random
+
+import pytest
+
+from wordle_core.feedback import pattern_code, score_guess, score_many
+from wordle_core.multiboard import BASE_MODE, BOARD_MODES, MultiBoardSession, board_attempts
+from wordle_core.replay import NO_CODE, ReplayLog, analyze, iter_games
+from wordle_core.session import InvalidGuess
+from wordle_core.words import WORDS_EASY_FILE, Dictionary, load_words
+
+
+@pytest.fixture(scope="module")
+def dictionary():
+    words = load_words(WORDS_EASY_FILE)
+    return Dictionary(words + ["geese", "eerie", "speed"], {BASE_MODE: words})
+
+
+def test_score_many_matches_score_guess(dictionary):
+    words = dictionary.guess_list(BASE_MODE)
+    targets = list(words) + ["geese", "eerie", "abbey", "sassy"]
+    for guess in list(words) + ["geese", "eerie", "speed", "sasss"]:
+        assert score_many(guess, targets) == [score_guess(guess, t) for t in targets], guess
+    assert score_many("crane", []) == []
+
+
+def test_boards_solve_one_by_one(dictionary):
+    answers = list(dictionary.targets(BASE_MODE))
+    targets = answers[:4]
+    other = next(w for w in dictionary.guess_list(BASE_MODE) if w not in targets)
+    session = MultiBoardSession(dictionary, "Quordle", targets)
+    assert session.max_attempts == board_attempts(4) == 9
+
+    turn = session.guess(other.upper())
+    assert turn.guess == other and turn.solved == [] and not turn.over
+    assert turn.marks == [score_guess(other, t) for t in targets]
+
+    turn = session.guess(targets[2])
+    assert turn.solved == [2] and session.solved == [False, False, True, False]
+    turn = session.guess(targets[0])
+    # A solved board takes no more guesses
+    assert turn.marks[2] is None and turn.solved == [0]
+    assert [g for g, _ in session.history(2)] == [other, targets[2]]
+
+    session.guess(targets[1])
+    turn = session.guess(targets[3])
+    assert turn.over and session.won and session.over
+    assert session.result()["solved"] == 4 and session.result()["tries"] == 5
+    with pytest.raises(RuntimeError):
+        session.guess(other)
+
+
+def test_losing_and_rejected_guesses(dictionary):
+    answers = list(dictionary.targets(BASE_MODE))
+    session = MultiBoardSession(dictionary, "Dordle", answers[:2])
+    with pytest.raises(InvalidGuess) as e:
+        session.guess("abc")
+    assert e.value.reason == "length"
+    with pytest.raises(InvalidGuess) as e:
+        session.guess("qqqqq")
+    assert e.value.reason == "unknown"
+    session.guess(answers[0])
+    while not session.over:
+        assert session.result() is None
+        session.guess(answers[2])
+    assert not session.won and session.solved == [True, False]
+    assert session.attempt == board_attempts(2) + 1
+    with pytest.raises(ValueError):
+        MultiBoardSession(dictionary, "Octordle", answers[:4])
+
+
+def test_random_starts_use_distinct_targets(dictionary):
+    rng = random.Random(5)
+    for mode, boards in BOARD_MODES.items():
+        session = MultiBoardSession.start(dictionary, mode, rng)
+        assert len(set(session.targets)) == boards == session.boards
+
+
+def _play(dictionary, rng, n):
+    guesses = dictionary.guess_list(BASE_MODE)
+    games = []
+    for _ in range(n):
+        session = MultiBoardSession.start(dictionary, rng.choice(list(BOARD_MODES)), rng)
+        while not session.over:
+            # Mostly targets, so some games are won
+            session.guess(rng.choice(session.targets if rng.random() < 0.6 else guesses))
+        games.append(session)
+    return games
+
+
+def test_replay_round_trip(tmp_path, dictionary):
+    games = _play(dictionary, random.Random(6), 40)
+    log = ReplayLog(tmp_path / "replays.wrl")
+    log.append_many(games)
+    for chunk in (9, 1 << 20):
+        records = list(iter_games(log.path, chunk))
+        assert len(records) == len(games)
+        for record, session in zip(records, games):
+            targets, guesses, codes, times = session.packed()
+            assert record.mode == session.mode and record.won == session.won
+            assert record.target == tuple(targets) and record.max_attempts == session.max_attempts
+            assert record.guesses == tuple(guesses) and record.times == tuple(times)
+            # One code per board per turn, NO_CODE once a board is solved
+            assert [list(c) for c in zip(*record.codes)] == [
+                list(board) + [NO_CODE] * (len(guesses) - len(board)) for board in codes]
+            for g, turn in zip(guesses, record.codes):
+                word = dictionary.word(g, BASE_MODE)
+                assert all(code in (NO_CODE, pattern_code(score_guess(word, t)))
+                           for code, t in zip(turn, session.targets))
+    report = analyze(iter_games(log.path))
+    for mode in BOARD_MODES:
+        played = [s for s in games if s.mode == mode]
+        assert report["modes"].get(mode, {"games": 0})["games"] == len(played)
+    assert report["hardest"] == []
@@ -0,0 +1,35 @@
+"""Leaderboard persistence: snapshot plus journal shared by many processes."""
+import json
+import multiprocessing
+
+from wordle_core.placemate import LeaderboardStore, read_journal
+
+PROCESSES = 4
+RECORDS_PER_PROCESS = 100
+
+
+def _append_records(path, worker):
+    board = LeaderboardStore(path)
+    for i in range(RECORDS_PER_PROCESS):
+        board.record(f"w{worker}-{i}", 10.0 + i, "Easy")
+
+
+def test_journal_appends_from_many_processes(tmp_path):
+    path = tmp_path / "placemate.json"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_append_records, args=(path, w)) for w in range(PROCESSES)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+        assert p.exitcode == 0
+
+    lines = path.with_name(path.name + ".journal").read_text(encoding="utf-8").splitlines()
+    # One whole JSON record per line: no append was torn or interleaved
+    assert len(lines) == PROCESSES * RECORDS_PER_PROCESS
+    assert all(isinstance(json.loads(line), dict) for line in lines)
+    entries, _ = read_journal(path.with_name(path.name + ".journal"))
+    assert len(entries) == len(lines)
+    names = {e["name"] for e in LeaderboardStore(path).entries()}
+    assert names == {f"w{w}-{i}" for w in range(PROCESSES) for i in range(RECORDS_PER_PROCESS)}
+
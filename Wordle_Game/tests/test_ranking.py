@@ -0,0 +1,96 @@
+"""Rank queries of both leaderboard backends against a brute-force rank."""
+import bisect
+import random
+import sqlite3
+
+import pytest
+
+from wordle_core.leaderboard_db import BUCKETS_PER_SECOND, RANK_BUCKETS, SQLiteLeaderboard
+from wordle_core.placemate import LeaderboardStore
+from wordle_core.ranking import format_rank
+
+# Last bucket: every time from here on shares it
+CLAMP = RANK_BUCKETS / BUCKETS_PER_SECOND
+
+
+def _times(rng):
+    edge = [b / BUCKETS_PER_SECOND for b in (0, 1, 2, 3, 7, 10, 99)]
+    return rng.choice([
+        rng.uniform(0, 120),
+        round(rng.uniform(0, 30), 1),         # exactly on bucket edges, many ties
+        rng.choice(edge),
+        rng.choice(edge) - 1e-9,              # just below an edge
+        float(rng.randrange(40)),
+        CLAMP - 0.1 + rng.choice([0.0, 0.05]),
+        CLAMP + rng.uniform(0, 5000),         # the clamped last bucket
+        1e9,
+    ])
+
+
+def _expected(best, name, mode):
+    times = sorted(t for (_, m), t in best.items() if m == mode)
+    return bisect.bisect_left(times, best[(name, mode)]) + 1, len(times)
+
+
+def _play(board, rng, games):
+    best = {}
+    for _ in range(games):
+        name, mode = f"p{rng.randrange(300)}", rng.choice(["Easy", "Hard"])
+        time = _times(rng)
+        board.record(name, time, mode)
+        best[(name, mode)] = min(time, best.get((name, mode), float("inf")))
+    return best
+
+
+def _check(board, best):
+    for name, mode in best:
+        assert board.rank(name, mode) == _expected(best, name, mode), (name, mode, best[(name, mode)])
+
+
+def test_sqlite_rank_matches_brute_force(tmp_path):
+    board = SQLiteLeaderboard(tmp_path / "board.sqlite3")
+    best = _play(board, random.Random(1), 1500)
+    _check(board, best)
+    assert board.rank("nobody", "Easy") is None
+
+    # Batched writes update the tree the same way
+    batch = [("p1", 0.05, "Easy"), ("new", CLAMP, "Hard"), ("p2", 0.1, "Easy")]
+    board.record_many(batch)
+    for name, time, mode in batch:
+        best[(name, mode)] = min(time, best.get((name, mode), float("inf")))
+    _check(board, best)
+
+    # A bulk import rebuilds the tree
+    board.import_entries([{"name": "imported", "time": 0.3, "mode": "Easy"}])
+    best[("imported", "Easy")] = 0.3
+    _check(board, best)
+
+
+def test_sqlite_rank_tree_is_rebuilt_for_an_old_database(tmp_path):
+    path = tmp_path / "board.sqlite3"
+    best = _play(SQLiteLeaderboard(path), random.Random(2), 400)
+    with sqlite3.connect(path) as db:
+        db.execute("DELETE FROM rank_tree")
+    _check(SQLiteLeaderboard(path), best)
+
+
+def test_json_rank_matches_brute_force(tmp_path):
+    board = LeaderboardStore(tmp_path / "placemate.json")
+    rng = random.Random(3)
+    best = _play(board, rng, 300)
+    _check(board, best)
+    # Later records reach an index that is already sorted
+    best.update((key, min(t, best.get(key, float("inf")))) for key, t in
+                [(("p5", "Easy"), 0.01), (("fresh", "Hard"), 12.0)])
+    board.record("p5", 0.01, "Easy")
+    board.record("fresh", 12.0, "Hard")
+    _check(board, best)
+
+
+@pytest.mark.parametrize("rank, total, shown", [
+    (1, 1, "#1 of 1 (top 100%)"),
+    (1_204, 380_000, "#1,204 of 380,000 (top 0.3%)"),
+    (1, 10_000, "#1 of 10,000 (top <0.1%)"),
+])
+def test_format_rank(rank, total, shown):
+    assert format_rank(rank, total) == shown
@@ -0,0 +1,111 @@
+"""Replay log: write, read back and analyze, including a torn last record."""
+import random
+from collections import Counter
+
+import pytest
+
+from wordle_core.replay import MAGIC, ReplayLog, ReplayLogError, analyze, encode, iter_games
+from wordle_core.session import GameSession
+from wordle_core.words import WORDS_EASY_FILE, Dictionary, load_words
+
+
+@pytest.fixture(scope="module")
+def dictionary():
+    words = load_words(WORDS_EASY_FILE)
+    return Dictionary(words, {"Easy": words, "Medium": words[:12]})
+
+
+def _play(dictionary, rng, n):
+    games = []
+    for _ in range(n):
+        mode = rng.choice(["Easy", "Medium"])
+        session = GameSession.start(dictionary, mode, rng)
+        guesses = dictionary.guess_list(mode)
+        while not session.over:
+            session.guess(rng.choice(guesses))
+        games.append(session)
+    return games
+
+
+def _expected(session):
+    target, guesses, codes, times = session.packed()
+    return session.mode, target, session.won, session.max_attempts, tuple(guesses), tuple(codes), tuple(times)
+
+
+def _read(path, chunk):
+    return [(g.mode, g.target, g.won, g.max_attempts, g.guesses, g.codes, g.times)
+            for g in iter_games(path, chunk)]
+
+
+def test_round_trip(tmp_path, dictionary):
+    games = _play(dictionary, random.Random(1), 60)
+    log = ReplayLog(tmp_path / "replays.wrl")
+    log.append(games[0])
+    log.append_many(games[1:])
+    log.append_many([])
+    assert (tmp_path / "replays.wrl").read_bytes().startswith(MAGIC)
+    expected = [_expected(s) for s in games]
+    for chunk in (7, 64, 1 << 20):
+        assert _read(log.path, chunk) == expected
+    started = encode(games[0], started=1_700_000_000.25)
+    log.path.unlink()
+    log.write([started])
+    assert next(iter(log)).started == 1_700_000_000.25
+
+
+def test_torn_last_record_is_ignored(tmp_path, dictionary):
+    games = _play(dictionary, random.Random(2), 10)
+    path = tmp_path / "replays.wrl"
+    ReplayLog(path).append_many(games)
+    whole = path.read_bytes()
+    with path.open("ab") as f:
+        f.write(encode(games[0])[:-3])
+    for chunk in (5, 64, 1 << 20):
+        assert _read(path, chunk) == [_expected(s) for s in games]
+    path.write_bytes(whole + encode(games[0])[:10])
+    assert len(_read(path, 16)) == len(games)
+
+
+def test_missing_empty_and_foreign_files(tmp_path):
+    assert list(iter_games(tmp_path / "missing.wrl")) == []
+    (tmp_path / "empty.wrl").write_bytes(b"")
+    assert list(iter_games(tmp_path / "empty.wrl")) == []
+    (tmp_path / "other.wrl").write_bytes(b"PK\x03\x04 not a log")
+    with pytest.raises(ReplayLogError):
+        list(iter_games(tmp_path / "other.wrl"))
+
+
+def test_analyze_matches_the_sessions(tmp_path, dictionary):
+    games = _play(dictionary, random.Random(3), 300)
+    log = ReplayLog(tmp_path / "replays.wrl")
+    log.append_many(games)
+    report = analyze(iter_games(log.path, 256), top=5, min_games=2)
+
+    assert report["games"] == len(games)
+    for mode in ("Easy", "Medium"):
+        played = [s for s in games if s.mode == mode]
+        won = [s for s in played if s.won]
+        m = report["modes"][mode]
+        assert (m["games"], m["wins"]) == (len(played), len(won))
+        assert m["average_tries"] == pytest.approx(sum(s.attempt - 1 for s in won) / len(won))
+
+    openers = Counter((s.mode, s.packed()[1][0]) for s in games)
+    assert [o["games"] for o in report["openers"]] == sorted(openers.values(), reverse=True)[:5]
+    for o in report["openers"]:
+        assert openers[(o["mode"], o["guess"])] == o["games"]
+
+    # Hardest: failure rate, then average tries (a loss counts attempts + 1)
+    per_target = {}
+    for s in games:
+        tries = s.attempt - 1 if s.won else s.max_attempts + 1
+        per_target.setdefault((s.mode, s.packed()[0]), []).append((not s.won, tries))
+    ranked = sorted(
+        ((sum(f for f, _ in v) / len(v), sum(t for _, t in v) / len(v)) for v in per_target.values()
+         if len(v) >= 2), reverse=True)[:5]
+    assert [(h["failure_rate"], round(h["average_tries"], 9)) for h in report["hardest"]] == [
+        (f, round(t, 9)) for f, t in ranked]
+    for h in report["hardest"]:
+        assert h["games"] == len(per_target[(h["mode"], h["target"])])
+
+    timing = report["guess_time"]
+    assert timing["guesses"] == sum(s.attempt - 1 for s in games) == sum(timing["buckets"])
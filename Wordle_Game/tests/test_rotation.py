@@ -0,0 +1,60 @@
+"""Per-player target rotation: every answer once per round, across list changes."""
+import pytest
+
+from wordle_core.rotation import Rotation, RotationStore, permute
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 7, 64, 100, 1000, 2315])
+def test_rotation_covers_every_answer_once(n):
+    assert sorted(permute(i, n, 12345) for i in range(n)) == list(range(n))
+    rotation = Rotation(n, seed=99)
+    assert sorted(rotation.next() for _ in range(n)) == list(range(n))
+    # The next round starts over with every answer unseen again
+    assert sorted(rotation.next() for _ in range(n)) == list(range(n))
+
+
+def test_take_gives_distinct_targets_across_rounds():
+    rotation = Rotation(5, seed=3)
+    for _ in range(20):
+        targets = rotation.take(4)
+        assert len(set(targets)) == 4
+
+
+def test_state_round_trip():
+    rotation = Rotation(100, seed=7, digest=b"12345678")
+    first = [rotation.next() for _ in range(30)]
+    restored = Rotation.from_bytes(rotation.to_bytes())
+    assert restored.digest == b"12345678"
+    rest = [restored.next() for _ in range(70)]
+    assert sorted(first + rest) == list(range(100))
+    # A state of an older layout is not read as a rotation
+    assert Rotation.from_bytes(b"\x00" * 12) is None
+
+
+def _draw_all(store, words, k):
+    return [store.draw("ann", "Easy", words)[0] for _ in range(k)]
+
+
+def test_store_round_covers_the_list(tmp_path):
+    store = RotationStore(tmp_path / "rotation.sqlite3")
+    words = [f"w{i:03d}" for i in range(50)]
+    assert sorted(_draw_all(store, words, 50)) == words
+
+
+def test_growing_list_keeps_seen_words(tmp_path):
+    store = RotationStore(tmp_path / "rotation.sqlite3")
+    words = ["bbbbb", "ccccc", "ddddd", "eeeee"]
+    seen = _draw_all(store, words, 3)
+    # An insert at the front shifts every index
+    grown = ["aaaaa"] + words
+    rest = _draw_all(store, grown, 2)
+    assert sorted(seen + rest) == grown
+
+
+def test_same_length_replacement_is_detected(tmp_path):
+    store = RotationStore(tmp_path / "rotation.sqlite3")
+    words = [f"w{i:02d}" for i in range(10)]
+    seen = _draw_all(store, words, 6)
+    changed = [w if w != seen[0] else "zzz" for w in words]
+    rest = _draw_all(store, changed, 5)
+    assert sorted(seen[1:] + rest) == sorted(changed)
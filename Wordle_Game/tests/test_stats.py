@@ -0,0 +1,142 @@
+"""Per-player statistics and the journal they are kept in."""
+import multiprocessing
+import threading
+import time
+
+from wordle_core import stats as stats_module
+from wordle_core.leaderboard_db import SQLiteLeaderboard
+from wordle_core.placemate import _FileLock
+from wordle_core.stats import PlayerStats, StatsStore, format_stats
+
+PROCESSES = 4
+GAMES_PER_PROCESS = 50
+
+
+def _games():
+    # (won, tries): two wins, a loss, three wins
+    return [(True, 3), (True, 4), (False, 6), (True, 3), (True, 1), (True, 3)]
+
+
+def test_streaks_win_rate_and_distribution():
+    stats = PlayerStats()
+    for won, tries in _games():
+        stats.add(won, tries)
+    assert stats.played == 6
+    assert stats.wins == 5
+    assert stats.win_rate == 5 / 6
+    assert stats.streak == 3
+    assert stats.max_streak == 3
+    assert stats.distribution == [1, 0, 3, 1]
+    stats.add(False, 6)
+    assert (stats.streak, stats.max_streak) == (0, 3)
+    assert PlayerStats().win_rate == 0.0
+    assert PlayerStats.from_dict(stats.to_dict()).to_dict() == stats.to_dict()
+
+
+def test_format_stats():
+    stats = PlayerStats()
+    for won, tries in _games():
+        stats.add(won, tries)
+    lines = format_stats(stats, width=6)
+    assert lines[0] == "Played 6  Won 83%  Streak 3  Best streak 3"
+    assert lines[1:] == [" 1:     1 ##", " 2:     0 ", " 3:     3 ######", " 4:     1 ##"]
+
+
+def test_store_folds_the_journal(tmp_path, monkeypatch):
+    path = tmp_path / "placemate.stats.json"
+    store = StatsStore(path)
+    for won, tries in _games():
+        last = store.record("ann", "Easy", won, tries)
+    store.record("bob", "Hard", False, 6)
+    assert last.to_dict() == {"played": 6, "wins": 5, "streak": 3, "max_streak": 3,
+                              "distribution": [1, 0, 3, 1]}
+    # Another process (a fresh store) reads the same totals
+    assert StatsStore(path).get("ann", "Easy").to_dict() == last.to_dict()
+    assert StatsStore(path).get("ann", "Hard") is None
+
+    # Compaction keeps every game counted exactly once
+    monkeypatch.setattr(stats_module, "COMPACT_BYTES", 200)
+    for _ in range(10):
+        store.record("ann", "Easy", True, 2)
+    if store._compactor is not None:
+        store._compactor.join()
+    store.compact()
+    assert path.with_name(path.name + ".journal").stat().st_size == 0
+    fresh = StatsStore(path)
+    assert fresh.get("ann", "Easy").played == 16
+    assert fresh.get("ann", "Easy").streak == 13
+    assert fresh.get("bob", "Hard").played == 1
+    assert store.get("ann", "Easy").played == 16
+
+
+def _record_games(path, worker):
+    store = StatsStore(path)
+    for i in range(GAMES_PER_PROCESS):
+        store.record(f"w{worker}", "Easy", i % 5 != 0, 1 + i % 6)
+
+
+def test_appends_from_many_processes(tmp_path):
+    path = tmp_path / "placemate.stats.json"
+    ctx = multiprocessing.get_context("spawn")
+    workers = [ctx.Process(target=_record_games, args=(path, w)) for w in range(PROCESSES)]
+    for p in workers:
+        p.start()
+    for p in workers:
+        p.join(60)
+        assert p.exitcode == 0
+    store = StatsStore(path)
+    for w in range(PROCESSES):
+        stats = store.get(f"w{w}", "Easy")
+        assert stats.played == GAMES_PER_PROCESS
+        assert stats.wins == GAMES_PER_PROCESS - GAMES_PER_PROCESS // 5
+
+
+def test_appends_and_compactions_from_many_threads(tmp_path, monkeypatch):
+    # Threads share one store, so one lock file handle: the thread lock must serialise them
+    monkeypatch.setattr(stats_module, "COMPACT_BYTES", 500)
+    store = StatsStore(tmp_path / "placemate.stats.json")
+
+    def play(n):
+        for _ in range(GAMES_PER_PROCESS):
+            store.record(f"t{n}", "Easy", True, 3)
+
+    threads = [threading.Thread(target=play, args=(n,)) for n in range(PROCESSES)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if store._compactor is not None:
+        store._compactor.join()
+    fresh = StatsStore(store.path)
+    assert [fresh.get(f"t{n}", "Easy").played for n in range(PROCESSES)] == [GAMES_PER_PROCESS] * PROCESSES
+
+
+def test_file_lock_serialises_threads(tmp_path):
+    lock = _FileLock(tmp_path / "x.lock")
+    inside = []
+    overlaps = []
+
+    def work():
+        for _ in range(20):
+            with lock:
+                inside.append(1)
+                if len(inside) > 1:
+                    overlaps.append(1)
+                time.sleep(0.0005)
+                inside.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert not overlaps
+
+
+def test_sqlite_stats(tmp_path):
+    board = SQLiteLeaderboard(tmp_path / "board.sqlite3")
+    for won, tries in _games():
+        last = board.record_game("ann", "Easy", won, tries)
+    assert board.player_stats("ann", "Easy").to_dict() == last.to_dict()
+    assert last.distribution == [1, 0, 3, 1]
+    assert board.player_stats("ann", "Hard") is None
@@ -0,0 +1,69 @@
+"""'Did you mean' index against a brute-force scan of the word list."""
+import random
+import string
+
+from wordle_core.suggest import deletions, distance, load_index
+from wordle_core.words import ALL_WORDS_FILE, load_words
+
+PROBES = 300
+
+
+def _one_edit(a, b):
+    """One substitution or one swap of neighbouring letters apart (brute force)."""
+    if a == b or len(a) != len(b):
+        return False
+    diffs = [i for i in range(len(a)) if a[i] != b[i]]
+    if len(diffs) == 1:
+        return True
+    return (len(diffs) == 2 and diffs[1] == diffs[0] + 1
+            and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]])
+
+
+def _probes(words, rng):
+    for _ in range(PROBES):
+        word = list(rng.choice(words))
+        edit = rng.randrange(3)
+        i = rng.randrange(len(word))
+        if edit == 0:
+            word[i] = rng.choice(string.ascii_lowercase)
+        elif edit == 1 and i + 1 < len(word):
+            word[i], word[i + 1] = word[i + 1], word[i]
+        else:
+            word = [rng.choice(string.ascii_lowercase) for _ in word]
+        yield "".join(word)
+
+
+def test_index_matches_brute_force(tmp_path):
+    words = load_words(ALL_WORDS_FILE, 5)
+    index = load_index(words, tmp_path)
+    keys_of = {w: deletions(w) for w in words}
+    for probe in _probes(words, random.Random(4)):
+        found = dict((w, d) for d, w in index.nearest(probe))
+        # Every word one edit away is found, at distance 1
+        assert {w for w in words if _one_edit(probe, w)} == {w for w, d in found.items() if d == 1}, probe
+        # And nothing but words sharing a deletion key comes back
+        keys = deletions(probe)
+        assert set(found) == {w for w in words if w != probe and keys & keys_of[w]}, probe
+
+
+def test_saved_index_is_reused(tmp_path):
+    words = ["crane", "crate", "trace", "caner", "react"]
+    first = load_index(words, tmp_path)
+    assert len(list(tmp_path.glob("neighbours-*.bin"))) == 1
+    second = load_index(words, tmp_path)
+    assert second.suggest("crame") == first.suggest("crame") == ["crane", "crate"]
+
+
+def test_suggest_prefers_answers_among_equals(tmp_path):
+    index = load_index(["baker", "bakes", "baked"], tmp_path)
+    assert index.suggest("bakex", limit=2) == ["baked", "baker"]
+    assert index.suggest("bakex", limit=2, prefer={"bakes"}) == ["bakes", "baked"]
+    assert distance("abcde", "bacde") == 1
+    assert distance("abcde", "bacdf") == 2
+
+
+def test_non_ascii_words(tmp_path):
+    words = ["äpfel", "apfel", "äffel"]
+    index = load_index(words, tmp_path)
+    assert index.suggest("äpfal") == ["äpfel"]
+    assert index.suggest("apfle") == ["apfel"]
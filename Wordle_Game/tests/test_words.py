@@ -0,0 +1,67 @@
+"""Word list headers, loading and per-mode settings."""
+import pytest
+
+from wordle_core.words import (
+    DEFAULT_LANGUAGE, WORD_LENGTH, Dictionary, WordListError, lexicon_file, load_words, mode_spec,
+    read_header,
+)
+
+
+def _write(path, text):
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_read_header(tmp_path):
+    assert read_header(_write(tmp_path / "a.txt", "# length=6 language=de\nbirnen\n")) == {
+        "length": 6, "language": "de"}
+    assert read_header(_write(tmp_path / "b.txt", "# LENGTH=4 source=wiki note\nbirn\n")) == {
+        "length": 4, "source": "wiki"}
+    assert read_header(_write(tmp_path / "c.txt", "crane\n# length=6\n")) == {}
+    assert read_header(tmp_path / "missing.txt") == {}
+
+
+@pytest.mark.parametrize("header", ["# length=3", "# length=9", "# length=five"])
+def test_bad_length(tmp_path, header):
+    path = _write(tmp_path / "bad.txt", header + "\nabc\n")
+    with pytest.raises(WordListError):
+        read_header(path)
+    with pytest.raises(WordListError):
+        mode_spec(path)
+
+
+def test_mode_spec_defaults(tmp_path):
+    assert mode_spec(_write(tmp_path / "plain.txt", "crane\n")) == (WORD_LENGTH, DEFAULT_LANGUAGE)
+    assert mode_spec(_write(tmp_path / "de.txt", "# language=de\napfel\n")) == (5, "de")
+    assert mode_spec(_write(tmp_path / "six.txt", "# length=6\nplanet\n")) == (6, DEFAULT_LANGUAGE)
+    assert lexicon_file("en", tmp_path / "All_the_Words.txt") == tmp_path / "All_the_Words.txt"
+    assert lexicon_file("de", tmp_path / "All_the_Words.txt") == tmp_path / "All_the_Words.de.txt"
+
+
+def test_load_words(tmp_path):
+    path = _write(tmp_path / "six.txt", "# length=6\nPlanet\nplane\nrocket\nno-way\n# comment\n")
+    assert load_words(path) == ["planet", "rocket"]
+    assert load_words(path, 5) == ["plane"]
+    assert load_words(path, range(5, 7)) == ["planet", "plane", "rocket"]
+    with pytest.raises(WordListError, match="4-letter"):
+        load_words(path, 4)
+    assert load_words(path, 4, allow_empty=True) == []
+    with pytest.raises(WordListError, match="not found"):
+        load_words(tmp_path / "missing.txt")
+
+
+def test_custom_modes(tmp_path):
+    lexicon = _write(tmp_path / "All_the_Words.txt", "crane\nslate\nplanet\nrocket\nbirn\n")
+    _write(tmp_path / "All_the_Words.de.txt", "apfel\nbirne\n")
+    modes = {
+        "Six": (_write(tmp_path / "six.txt", "# length=6\nplanet\n"), 5),
+        "German": (_write(tmp_path / "de.txt", "# language=de\nbirne\n"), 0),
+        "Easy": (_write(tmp_path / "easy.txt", "crane\nzzzzz\n"), 6),
+    }
+    d = Dictionary.load(lexicon, modes, use_cache=False)
+    assert d.length("Six") == 6 and d.language("German") == "de"
+    assert d.attempts == {"Six": 5, "German": 6, "Easy": 6}
+    assert d.is_valid("rocket", "Six") and not d.is_valid("crane", "Six")
+    assert d.is_valid("apfel", "German") and not d.is_valid("slate", "German")
+    # Answers are always valid guesses, even when the full list lacks them
+    assert d.is_valid("zzzzz", "Easy") and d.guess_list("Easy") == ["crane", "slate", "zzzzz"]
@@ -0,0 +1,22 @@
+"""Game core shared by the CLI (Wordle.py) and the GUI (wordle_gui.py)."""
+from .feedback import ABSENT, PRESENT, CORRECT, score_guess, pattern_code, decode_pattern
+from .words import (
+    DATA_DIR,
+    WORDS_EASY_FILE,
+    WORDS_MEDIUM_FILE,
+    ALL_WORDS_FILE,
+    WORD_LENGTH,
+    MIN_LENGTH,
+    MAX_LENGTH,
+    DEFAULT_LANGUAGE,
+    MODES,
+    HARD_MODE,
+    WordListError,
+    load_words,
+    read_header,
+    Dictionary,
+)
+from .dawg import Dawg
+from .hardmode import HardModeRules
+from .placemate import LeaderboardStore, open_leaderboard, load_placemate, save_placemate
+from .session import GameSession, InvalidGuess, Turn
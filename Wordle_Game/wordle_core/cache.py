@@ -0,0 +1,281 @@
+"""Compiled, memory-mapped word lists.
+
+Each text word list is compiled once into a ``.words`` file under
+CACHE_DIR: a small header followed by the words as sorted, de-duplicated,
+fixed-width records (5 bytes for the standard game).  Loading maps the
+file and reads records on demand, so startup does not parse or copy the
+lists.  The header remembers the mtime, size and SHA-1 of every source
+file; when a source changes the cache file is rebuilt automatically.
+Full dictionaries with words of every length are compiled the same way
+into ``.dawg`` files holding a packed wordle_core.dawg.Dawg.
+
+Run ``python -m wordle_core.cache`` to (re)build every cache file.
+"""
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from .dawg import Dawg
+from .words import DATA_DIR, LENGTHS, WORD_LENGTH, WordListError, describe_lengths, load_words
+
+CACHE_DIR = DATA_DIR / ".wordle_cache"
+
+MAGIC = b"WPK1"  # ASCII words, one byte per letter
+WIDE_MAGIC = b"WPK4"  # other alphabets, UTF-32-BE (sorts like str)
+ENCODINGS = {MAGIC: "utf-8", WIDE_MAGIC: "utf-32-be"}
+DAWG_MAGIC = b"WDG1"
+# magic, word length, number of sources, record count
+HEADER = struct.Struct("<4sBBI")
+# mtime_ns, size, sha1 of one source file
+SOURCE = struct.Struct("<qq20s")
+
+
+class PackedWordList:
+    """Read-only sorted word list backed by fixed-width records.
+
+    Behaves like a sequence of str; membership and index() are binary
+    searches over the records, so no per-word Python objects are created
+    up front.
+    """
+
+    def __init__(self, buf, width, count, offset=0, encoding="utf-8"):
+        self._buf = buf
+        self.width = width
+        self._count = count
+        self._offset = offset
+        self._encoding = encoding
+        # Bytes per record
+        self._size = width * (4 if encoding == "utf-32-be" else 1)
+
+    @classmethod
+    def from_words(cls, words, width=WORD_LENGTH):
+        """Build an in-memory list (no cache file) from any iterable of words."""
+        data, encoding = _pack(words, width)
+        return cls(data, width, len(data) // width // (4 if encoding == "utf-32-be" else 1), encoding=encoding)
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        start = self._offset + i * self._size
+        return self._buf[start:start + self._size].decode(self._encoding)
+
+    def __iter__(self):
+        for i in range(self._count):
+            yield self[i]
+
+    def _find(self, word):
+        """Binary search on the raw records; -1 if ``word`` is absent."""
+        if len(word) != self.width:
+            return -1
+        try:
+            key = word.encode(self._encoding)
+        except UnicodeEncodeError:
+            return -1
+        w = self._size
+        if len(key) != w:
+            return -1
+        buf, off = self._buf, self._offset
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = off + mid * w
+            if buf[start:start + w] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        start = off + lo * w
+        if lo < self._count and buf[start:start + w] == key:
+            return lo
+        return -1
+
+    def __contains__(self, word):
+        return self._find(word) >= 0
+
+    def index(self, word):
+        i = self._find(word)
+        if i < 0:
+            raise ValueError(f"{word!r} is not in the word list")
+        return i
+
+
+def _pack(words, width):
+    """Sorted, de-duplicated fixed-width records for ``words``, and their encoding.
+
+    ASCII lists take one byte per letter; any other letter switches the
+    whole list to UTF-32-BE, whose byte order matches str order.
+    """
+    words = {w for w in words if len(w) == width}
+    encoding = "utf-8" if all(w.isascii() for w in words) else "utf-32-be"
+    return b"".join(sorted(w.encode(encoding) for w in words)), encoding
+
+
+def _file_sha1(path):
+    h = hashlib.sha1()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            h.update(chunk)
+    return h.digest()
+
+
+def _source_info(path):
+    st = path.stat()
+    return st.st_mtime_ns, st.st_size
+
+
+def _write(target, width, count, infos, data, magic=MAGIC):
+    header = HEADER.pack(magic, width, len(infos), count)
+    header += b"".join(SOURCE.pack(*info) for info in infos)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp = target.with_name(target.name + f".{os.getpid()}.tmp")
+    with tmp.open("wb") as f:
+        f.write(header)
+        f.write(data)
+    os.replace(tmp, target)
+
+
+def compile_word_list(sources, target, width=WORD_LENGTH):
+    """Compile the union of ``sources`` into the packed file ``target``."""
+    sources = [Path(p) for p in sources]
+    words, infos = _read_sources(sources, width)
+    data, encoding = _pack(words, width)
+    magic = MAGIC if encoding == "utf-8" else WIDE_MAGIC
+    _write(Path(target), width, len(data) // (width * (4 if magic == WIDE_MAGIC else 1)), infos, data, magic)
+
+
+def compile_dawg(sources, target):
+    """Compile the union of ``sources`` (words of every length) into a ``.dawg`` file."""
+    words, infos = _read_sources([Path(p) for p in sources], LENGTHS)
+    data = Dawg.pack(words)
+    _write(Path(target), 0, len(set(words)), infos, data, DAWG_MAGIC)
+
+
+def _union(sources, length):
+    """Words of ``length`` letters in all of ``sources``.
+
+    A source may contribute nothing (a full list holding no words of a
+    custom mode's length, say); only an empty union is an error.
+    """
+    words = [w for path in sources for w in load_words(path, length, allow_empty=True)]
+    if not words:
+        names = ", ".join(Path(p).name for p in sources)
+        raise WordListError(f"No valid {describe_lengths(length)}-letter words found in {names}")
+    return words
+
+
+def _read_sources(sources, length):
+    words = _union(sources, length)
+    infos = [_source_info(path) + (_file_sha1(path),) for path in sources]
+    return words, infos
+
+
+def _read_header(f):
+    """(magic, width, count, source infos) of a cache file, or None."""
+    raw = f.read(HEADER.size)
+    if len(raw) != HEADER.size:
+        return None
+    magic, width, nsources, count = HEADER.unpack(raw)
+    infos = [SOURCE.unpack(f.read(SOURCE.size)) for _ in range(nsources)]
+    return magic, width, count, infos
+
+
+def _is_fresh(target, sources, width, magics=tuple(ENCODINGS)):
+    """Check a cache file against its sources.
+
+    Returns True if it can be used as is.  When only the mtime of a source
+    moved but its content hash still matches, the stored mtime is refreshed
+    in place so the next start skips hashing again.
+    """
+    try:
+        with target.open("r+b") as f:
+            header = _read_header(f)
+            if header is None or header[0] not in magics:
+                return False
+            _, cached_width, _, infos = header
+            if cached_width != width or len(infos) != len(sources):
+                return False
+            for n, (path, (mtime_ns, size, sha1)) in enumerate(zip(sources, infos)):
+                current = _source_info(path)
+                if current == (mtime_ns, size):
+                    continue
+                if current[1] != size or _file_sha1(path) != sha1:
+                    return False
+                f.seek(HEADER.size + n * SOURCE.size)
+                f.write(SOURCE.pack(current[0], size, sha1))
+    except (OSError, struct.error):
+        return False
+    return True
+
+
+def open_packed(path):
+    """Memory-map a compiled ``.words`` file."""
+    with Path(path).open("rb") as f:
+        magic, width, count, infos = _read_header(f)
+        offset = HEADER.size + len(infos) * SOURCE.size
+        if count == 0:
+            return PackedWordList(b"", width, 0)
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return PackedWordList(buf, width, count, offset, ENCODINGS[magic])
+
+
+def open_dawg(path):
+    """Memory-map a compiled ``.dawg`` file."""
+    with Path(path).open("rb") as f:
+        _, _, _, infos = _read_header(f)
+        offset = HEADER.size + len(infos) * SOURCE.size
+        buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return Dawg(buf, offset)
+
+
+def load_dawg(sources, name, cache_dir=CACHE_DIR):
+    """Load the DAWG of every word in ``sources``, compiling it if stale.
+
+    Falls back to an in-memory DAWG when the cache directory is not
+    writable.
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    sources = [Path(p) for p in sources]
+    target = Path(cache_dir) / f"{name}.dawg"
+    if not _is_fresh(target, sources, 0, (DAWG_MAGIC,)):
+        try:
+            compile_dawg(sources, target)
+        except OSError:
+            return Dawg.from_words(_union(sources, LENGTHS))
+    return open_dawg(target)
+
+
+def load_packed(sources, name, cache_dir=CACHE_DIR, width=WORD_LENGTH):
+    """Load the packed union of ``sources``, compiling it if stale.
+
+    Falls back to an in-memory list when the cache directory is not
+    writable.
+    """
+    if isinstance(sources, (str, Path)):
+        sources = [sources]
+    sources = [Path(p) for p in sources]
+    target = Path(cache_dir) / f"{name}.words"
+    if not _is_fresh(target, sources, width):
+        try:
+            compile_word_list(sources, target, width)
+        except OSError:
+            return PackedWordList.from_words(_union(sources, width), width)
+    return open_packed(target)
+
+
+if __name__ == "__main__":
+    from .words import Dictionary
+
+    d = Dictionary.load()
+    print(f"Word lists cached in {CACHE_DIR}")
+    for language, words in d.words.items():
+        print(f"  {language}: {len(words)} words")
+    for mode, words in d.answers.items():
+        length, language = d.specs[mode]
+        print(f"  {mode}: {len(words)} answers, {len(d.guesses(mode))} valid {length}-letter guesses ({language})")
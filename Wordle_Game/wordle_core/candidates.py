@@ -0,0 +1,78 @@
+"""Bitmask index of the answers still consistent with the feedback.
+
+Every answer list gets, once, an integer bitset (bit n = answer n) per
+(position, letter) and per (letter, minimum count).  Applying one row of
+feedback is then a handful of AND / AND-NOT operations on those bitsets,
+and the number of remaining candidates is a popcount.
+"""
+from .feedback import ABSENT, CORRECT
+
+
+class CandidateIndex:
+    """Precomputed bitsets for one answer list."""
+
+    def __init__(self, answers):
+        self.answers = answers
+        self.all = (1 << len(answers)) - 1
+        at = {}        # (position, letter) -> answers with letter there
+        at_least = {}  # (letter, n) -> answers with n or more copies
+        for n, word in enumerate(answers):
+            bit = 1 << n
+            counts = {}
+            for pos, ch in enumerate(word):
+                at[pos, ch] = at.get((pos, ch), 0) | bit
+                counts[ch] = counts.get(ch, 0) + 1
+            for ch, count in counts.items():
+                for k in range(1, count + 1):
+                    at_least[ch, k] = at_least.get((ch, k), 0) | bit
+        self._at = at
+        self._at_least = at_least
+
+    def apply(self, mask, guess, marks):
+        """Narrow ``mask`` with the feedback ``marks`` for ``guess``."""
+        seen = {}
+        for pos, (ch, mark) in enumerate(zip(guess, marks)):
+            if mark == CORRECT:
+                mask &= self._at.get((pos, ch), 0)
+            else:
+                # Yellow or gray: the letter is not at this position
+                mask &= ~self._at.get((pos, ch), 0)
+            found, gray = seen.get(ch, (0, False))
+            if mark == ABSENT:
+                gray = True
+            else:
+                found += 1
+            seen[ch] = (found, gray)
+        for ch, (found, gray) in seen.items():
+            if found:
+                mask &= self._at_least.get((ch, found), 0)
+            if gray:
+                # A gray copy caps the letter count at what was found
+                mask &= ~self._at_least.get((ch, found + 1), 0)
+        return mask
+
+    def words(self, mask, limit=None):
+        """Answers selected by ``mask``, in list order (up to ``limit``)."""
+        out = []
+        while mask and (limit is None or len(out) < limit):
+            low = mask & -mask
+            out.append(self.answers[low.bit_length() - 1])
+            mask ^= low
+        return out
+
+
+class CandidateTracker:
+    """Remaining-candidate bookkeeping for a single game."""
+
+    def __init__(self, index):
+        self.index = index
+        self.mask = index.all
+
+    def update(self, guess, marks):
+        self.mask = self.index.apply(self.mask, guess, marks)
+
+    def count(self):
+        return self.mask.bit_count()
+
+    def sample(self, limit=5):
+        return self.index.words(self.mask, limit)
@@ -0,0 +1,252 @@
+"""Minimised DAWG (directed acyclic word graph) for large word lists.
+
+A DAWG is a trie whose identical suffix trees are merged, so a list of
+a million words of mixed lengths shares almost all of its endings and
+takes a few bytes per word.  The graph is built once from a sorted list
+(incremental minimisation, Daciuk et al. 2000) and packed into flat
+arrays that can be written to disk and memory-mapped back, which is how
+wordle_core.cache stores the full dictionary of every language.
+
+Besides membership the packed graph answers prefix queries, iterates
+words in sorted order (optionally of one length only) and maps words to
+their sorted position and back, like PackedWordList does for a single
+word length.
+"""
+import struct
+from array import array
+from bisect import bisect_left, bisect_right
+
+MAGIC = b"DWG1"
+# magic, nodes, edges, words, alphabet bytes
+HEADER = struct.Struct("<4sIIII")
+
+
+class _BuildNode:
+    __slots__ = ("edges", "final", "key")
+
+    def __init__(self):
+        self.edges = {}
+        self.final = False
+        self.key = None
+
+
+def _minimise(unchecked, register, down_to):
+    """Merge the unchecked path below ``down_to`` into registered nodes."""
+    while len(unchecked) > down_to:
+        parent, ch, child = unchecked.pop()
+        # Children are already canonical, so their identity describes them
+        key = (child.final, tuple((c, id(n)) for c, n in child.edges.items()))
+        existing = register.get(key)
+        if existing is not None:
+            parent.edges[ch] = existing
+        else:
+            register[key] = child
+
+
+def _build_graph(words):
+    """Root of the minimised graph for ``words`` (any order, duplicates ok)."""
+    root = _BuildNode()
+    register = {}
+    unchecked = []  # (parent, letter, child) along the previous word
+    prev = ""
+    for word in sorted(set(words)):
+        common = 0
+        for a, b in zip(word, prev):
+            if a != b:
+                break
+            common += 1
+        _minimise(unchecked, register, common)
+        node = unchecked[-1][2] if unchecked else root
+        for ch in word[common:]:
+            child = _BuildNode()
+            node.edges[ch] = child
+            unchecked.append((node, ch, child))
+            node = child
+        node.final = True
+        prev = word
+    _minimise(unchecked, register, 0)
+    return root
+
+
+def _pad(data):
+    return data + b"\0" * (-len(data) % 4)
+
+
+class Dawg:
+    """Read-only packed DAWG.
+
+    Node n owns edges first[n]:first[n + 1], sorted by letter.  For every
+    edge, ``before`` holds how many words sort before the first word
+    reached through it from its node (the node's own word, if final,
+    plus all words under earlier edges), which makes word -> position
+    and position -> word one step per letter.
+    """
+
+    def __init__(self, buf, offset=0):
+        self._buf = buf
+        magic, nodes, edges, count, alpha_size = HEADER.unpack_from(buf, offset)
+        if magic != MAGIC:
+            raise ValueError("not a packed DAWG")
+        view = memoryview(buf)
+        pos = offset + HEADER.size
+        self.alphabet = bytes(view[pos:pos + alpha_size]).decode("utf-8")
+        pos += alpha_size + (-alpha_size % 4)
+        self._first = view[pos:pos + 4 * (nodes + 1)].cast("I")
+        pos += 4 * (nodes + 1)
+        self._labels = view[pos:pos + 2 * edges].cast("H")
+        pos += 2 * edges + (-2 * edges % 4)
+        self._targets = view[pos:pos + 4 * edges].cast("I")
+        pos += 4 * edges
+        self._before = view[pos:pos + 4 * edges].cast("I")
+        pos += 4 * edges
+        self._final = view[pos:pos + nodes]
+        self.nbytes = pos + nodes - offset
+        self.node_count = nodes
+        self.edge_count = edges
+        self._count = count
+        self._codes = {ch: i for i, ch in enumerate(self.alphabet)}
+
+    @classmethod
+    def from_words(cls, words):
+        """Build, minimise and pack a DAWG in memory."""
+        return cls(cls.pack(words))
+
+    @staticmethod
+    def pack(words):
+        """Packed bytes of the DAWG for ``words`` (see Dawg.__init__)."""
+        root = _build_graph(words)
+        # Number the nodes depth first so the root is node 0
+        order, ids = [], {}
+        stack = [root]
+        while stack:
+            node = stack.pop()
+            if id(node) in ids:
+                continue
+            ids[id(node)] = len(order)
+            order.append(node)
+            stack.extend(reversed(list(node.edges.values())))
+        alphabet = "".join(sorted({ch for node in order for ch in node.edges}))
+        codes = {ch: i for i, ch in enumerate(alphabet)}
+
+        # Words below every node, children first
+        below = [None] * len(order)
+        for n in range(len(order) - 1, -1, -1):
+            stack = [n]
+            while stack:
+                m = stack[-1]
+                if below[m] is not None:
+                    stack.pop()
+                    continue
+                pending = [ids[id(c)] for c in order[m].edges.values() if below[ids[id(c)]] is None]
+                if pending:
+                    stack.extend(pending)
+                    continue
+                below[m] = order[m].final + sum(below[ids[id(c)]] for c in order[m].edges.values())
+                stack.pop()
+
+        first, labels, targets, before = array("I"), array("H"), array("I"), array("I")
+        final = bytearray(len(order))
+        for n, node in enumerate(order):
+            first.append(len(labels))
+            final[n] = node.final
+            seen = node.final
+            for ch, child in node.edges.items():
+                labels.append(codes[ch])
+                targets.append(ids[id(child)])
+                before.append(seen)
+                seen += below[ids[id(child)]]
+        first.append(len(labels))
+
+        alpha = alphabet.encode("utf-8")
+        header = HEADER.pack(MAGIC, len(order), len(labels), below[0] if order else 0, len(alpha))
+        return b"".join([
+            header, _pad(alpha), first.tobytes(), _pad(labels.tobytes()),
+            targets.tobytes(), before.tobytes(), bytes(final),
+        ])
+
+    def __len__(self):
+        return self._count
+
+    def _edge(self, node, ch):
+        """Edge leaving ``node`` with letter ``ch``, or -1."""
+        code = self._codes.get(ch)
+        if code is None:
+            return -1
+        lo, hi = self._first[node], self._first[node + 1]
+        e = bisect_left(self._labels, code, lo, hi)
+        if e < hi and self._labels[e] == code:
+            return e
+        return -1
+
+    def _walk(self, prefix):
+        """Node reached by ``prefix``, or -1."""
+        node = 0
+        for ch in prefix:
+            e = self._edge(node, ch)
+            if e < 0:
+                return -1
+            node = self._targets[e]
+        return node
+
+    def __contains__(self, word):
+        if not self._count:
+            return False
+        node = self._walk(word)
+        return node >= 0 and bool(self._final[node])
+
+    def has_prefix(self, prefix):
+        """True if some word starts with ``prefix``."""
+        return bool(self._count) and self._walk(prefix) >= 0
+
+    def index(self, word):
+        """Position of ``word`` in sorted order."""
+        rank = 0
+        node = 0
+        for ch in word:
+            e = self._edge(node, ch) if self._count else -1
+            if e < 0:
+                break
+            rank += self._before[e]
+            node = self._targets[e]
+        else:
+            if self._count and self._final[node]:
+                return rank
+        raise ValueError(f"{word!r} is not in the word list")
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("word index out of range")
+        first, before, targets, labels = self._first, self._before, self._targets, self._labels
+        letters = []
+        node = 0
+        while True:
+            if self._final[node] and i == 0:
+                return "".join(letters)
+            e = bisect_right(before, i, first[node], first[node + 1]) - 1
+            i -= before[e]
+            letters.append(self.alphabet[labels[e]])
+            node = targets[e]
+
+    def words(self, prefix="", length=None):
+        """Words starting with ``prefix`` in sorted order, optionally of one length."""
+        if not self._count:
+            return
+        node = self._walk(prefix)
+        if node < 0:
+            return
+        first, labels, targets, final = self._first, self._labels, self._targets, self._final
+        alphabet = self.alphabet
+        stack = [(node, prefix)]
+        while stack:
+            node, word = stack.pop()
+            if final[node] and (length is None or len(word) == length):
+                yield word
+            if length is not None and len(word) >= length:
+                continue
+            for e in range(first[node + 1] - 1, first[node] - 1, -1):
+                stack.append((targets[e], word + alphabet[labels[e]]))
+
+    def __iter__(self):
+        return self.words()
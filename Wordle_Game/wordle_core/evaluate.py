@@ -0,0 +1,151 @@
+"""Exhaustive solver evaluation: play a strategy against every answer.
+
+Every target of each mode is played once with the strategy (the same
+interface as in wordle_core.simulate) until it is solved or MAX_GUESSES
+run out.  The report gives, per mode, the average and worst number of
+guesses and the failure rate under every attempt limit the game uses
+(4 and 6 by default, from MODES).
+
+The targets are split into fixed chunks of index ranges and spread over
+a process pool.  Workers load the word lists and feedback matrix
+themselves in the pool initializer; both are memory-mapped cache files
+(see wordle_core.cache and wordle_core.matrix), so every worker shares
+the same pages and a task is only (mode, start, stop).  Any randomness
+is reseeded per target from the seed and the target's index, and the
+chunks are merged in index order, so the result is the same for any
+number of workers.
+
+    python -m wordle_core.evaluate --strategy entropy --modes Easy Medium --workers 8
+"""
+import argparse
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .matrix import FeedbackMatrix, np
+from .session import GameSession
+from .simulate import STRATEGIES
+from .words import MODES, Dictionary
+
+# Guesses a strategy gets for one target before it counts as unsolved
+MAX_GUESSES = 20
+# Targets per task
+CHUNK = 64
+# Attempt limits reported by default (4 for Medium, 6 for Easy and Hard)
+LIMITS = tuple(sorted({attempts for _, attempts in MODES.values()}))
+
+# Per-process state set up by _init_worker: (dictionary, strategy name, seed, players by mode)
+_worker = None
+
+
+def _init_worker(strategy, seed):
+    global _worker
+    _worker = (Dictionary.load(), strategy, seed, {})
+
+
+def _player(mode):
+    """The worker's strategy for ``mode`` and the rng it draws from."""
+    dictionary, strategy, _, players = _worker
+    if mode not in players:
+        rng = random.Random()
+        players[mode] = (STRATEGIES[strategy](dictionary, mode, rng), rng)
+    return players[mode]
+
+
+def _play_range(mode, start, stop):
+    """Guesses needed for targets ``start:stop`` of ``mode`` (0 = unsolved)."""
+    dictionary, _, seed, _ = _worker
+    player, rng = _player(mode)
+    targets = dictionary.targets(mode)
+    tries = []
+    for i in range(start, stop):
+        rng.seed(f"{seed}:{mode}:{i}")
+        player.reset()
+        session = GameSession(dictionary, mode, targets[i], max_attempts=MAX_GUESSES)
+        while not session.over:
+            guess = player.best_guess()
+            if guess is None:
+                break
+            turn = session.guess(guess)
+            player.update(turn.guess, turn.marks)
+        tries.append(session.attempt - 1 if session.won else 0)
+    return tries
+
+
+def _prepare(dictionary, modes):
+    """Build the caches the workers map, so they don't all build them at once."""
+    if np is None:
+        return
+    from .hints import HintEngine
+
+    for mode in modes:
+        FeedbackMatrix.for_mode(dictionary, mode)
+        HintEngine(dictionary, mode).best_guess()  # opening table
+
+
+def evaluate(modes, strategy="entropy", workers=None, seed=0, limits=LIMITS, chunk=CHUNK):
+    """Play every target of ``modes`` and return a report dict.
+
+    ``workers`` defaults to the number of CPUs; 1 plays in this process.
+    The report has the wall time and, per mode, the guess counts of
+    every target in answer-list order (0 = unsolved), their average over
+    solved targets, the worst case and the failure rate per limit.
+    """
+    dictionary = Dictionary.load()
+    _prepare(dictionary, modes)
+    tasks = [(mode, start, min(start + chunk, len(dictionary.targets(mode))))
+             for mode in modes for start in range(0, len(dictionary.targets(mode)), chunk)]
+    workers = workers or os.cpu_count() or 1
+    start_time = time.perf_counter()
+    if workers == 1:
+        _init_worker(strategy, seed)
+        results = [_play_range(*task) for task in tasks]
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(strategy, seed)) as pool:
+            # map() hands results back in task order whatever finishes first
+            results = list(pool.map(_play_range, *zip(*tasks)))
+    seconds = time.perf_counter() - start_time
+
+    report = {"strategy": strategy, "seed": seed, "workers": workers, "seconds": seconds, "modes": {}}
+    for mode in modes:
+        tries = [n for (task_mode, _, _), chunk_tries in zip(tasks, results) if task_mode == mode
+                 for n in chunk_tries]
+        solved = [n for n in tries if n]
+        report["modes"][mode] = {
+            "targets": len(tries),
+            "average": sum(solved) / len(solved) if solved else None,
+            "worst": max(solved) if len(solved) == len(tries) and solved else None,
+            "failure_rate": {limit: sum(1 for n in tries if not n or n > limit) / max(len(tries), 1)
+                             for limit in limits},
+            "tries": tries,
+        }
+    return report
+
+
+def print_report(report):
+    games = sum(m["targets"] for m in report["modes"].values())
+    print(f"'{report['strategy']}' on every target (seed {report['seed']}, {report['workers']} workers): "
+          f"{games} games in {report['seconds']:.1f}s ({games / max(report['seconds'], 1e-9):.1f} games/sec)")
+    for mode, m in report["modes"].items():
+        average = f"{m['average']:.3f}" if m["average"] is not None else "-"
+        worst = m["worst"] if m["worst"] is not None else f">{MAX_GUESSES}"
+        failures = "  ".join(f"fail@{limit} {100.0 * rate:5.2f}%" for limit, rate in m["failure_rate"].items())
+        print(f"  {mode:8s} {m['targets']:6d} targets  average {average}  worst {worst}  {failures}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Evaluate a solving strategy against every answer of a mode.")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--modes", nargs="+", choices=sorted(MODES), default=["Easy", "Medium"])
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: one per CPU)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--limits", default=",".join(map(str, LIMITS)),
+                        help="comma-separated attempt limits to report failure rates for")
+    args = parser.parse_args(argv)
+    limits = tuple(int(n) for n in args.limits.split(","))
+    print_report(evaluate(args.modes, args.strategy, args.workers, args.seed, limits))
+
+
+if __name__ == "__main__":
+    main()
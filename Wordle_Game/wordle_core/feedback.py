@@ -0,0 +1,83 @@
+"""Wordle feedback scoring shared by every front-end."""
+from .metrics import timed
+
+# Marks for a single letter of a guess
+ABSENT = 0    # gray: letter not in the word (or all copies already used)
+PRESENT = 1   # yellow: letter in the word, wrong spot
+CORRECT = 2   # green: letter in the right spot
+
+
+@timed("score_guess")
+def score_guess(guess, target):
+    """Score ``guess`` against ``target`` with standard Wordle marking.
+
+    Returns a tuple with one of ABSENT/PRESENT/CORRECT per letter.
+    Duplicate letters are handled like the original game: greens are
+    taken first, then yellows are handed out left to right while unused
+    copies of the letter remain in the target.
+    """
+    marks = [ABSENT] * len(guess)
+    target_chars = list(target)
+
+    # Greens
+    for i, ch in enumerate(guess):
+        if ch == target[i]:
+            marks[i] = CORRECT
+            target_chars[i] = None
+
+    # Yellows and grays
+    for i, ch in enumerate(guess):
+        if marks[i] == CORRECT:
+            continue
+        if ch in target_chars:
+            j = target_chars.index(ch)
+            target_chars[j] = None
+            marks[i] = PRESENT
+
+    return tuple(marks)
+
+
+@timed("score_many")
+def score_many(guess, targets):
+    """Score ``guess`` against every word of ``targets``.
+
+    Returns one tuple of marks per target, the same as score_guess()
+    gives for each.  It is still a loop over the targets; the only work
+    shared across them is checking once whether the guess repeats a
+    letter.  Without repeats a non-green letter is yellow exactly when
+    the target contains it, so those targets skip the bookkeeping of
+    used copies.  Multi-board games score every guess against all their
+    boards with one call.
+    """
+    out = []
+    unique = len(set(guess)) == len(guess)
+    for target in targets:
+        if unique:
+            out.append(tuple([CORRECT if t == g else PRESENT if g in target else ABSENT
+                              for g, t in zip(guess, target)]))
+            continue
+        marks = [CORRECT if t == g else ABSENT for g, t in zip(guess, target)]
+        unused = [t for g, t in zip(guess, target) if g != t]
+        for i, g in enumerate(guess):
+            if marks[i] == ABSENT and g in unused:
+                unused.remove(g)
+                marks[i] = PRESENT
+        out.append(tuple(marks))
+    return out
+
+
+def pattern_code(marks):
+    """Pack a tuple of marks into a base-3 integer (first letter lowest)."""
+    code = 0
+    for mark in reversed(marks):
+        code = code * 3 + mark
+    return code
+
+
+def decode_pattern(code, length=5):
+    """Unpack a base-3 pattern code back into a tuple of marks."""
+    marks = []
+    for _ in range(length):
+        code, mark = divmod(code, 3)
+        marks.append(mark)
+    return tuple(marks)
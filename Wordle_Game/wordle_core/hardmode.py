@@ -0,0 +1,106 @@
+"""Hard-mode rules: every revealed hint must be used in later guesses."""
+from .feedback import ABSENT, CORRECT, PRESENT
+from .words import MAX_LENGTH
+
+# Layout of HardModeRules._state: min counts a-z, banned masks a-z, greens
+_BANNED = 26
+_FIXED = 52
+
+
+def _ordinal(n):
+    suffix = {1: "st", 2: "nd", 3: "rd"}.get(n if n < 20 else n % 10, "th")
+    return f"{n}{suffix}"
+
+
+class HardModeRules:
+    """Constraints revealed so far, kept up to date one guess at a time.
+
+    Everything lives in one small bytearray, so a Hard game carries under
+    200 bytes of rules: for each letter a-z the number of copies
+    every guess must contain and a bitmask of the positions where it
+    showed up yellow, then the green letter of each position (letter
+    index + 1, 0 while unknown).  Letters outside a-z (word lists in
+    other languages) go to a small dict instead.  check() reads these
+    directly; earlier feedback is never replayed.
+    """
+
+    __slots__ = ("_state", "_other")
+
+    def __init__(self):
+        self._state = bytearray(_FIXED + MAX_LENGTH)
+        # Other letters: letter -> [min count, banned mask], position -> green letter
+        self._other = None
+
+    def update(self, guess, marks):
+        """Fold the feedback for ``guess`` into the constraints."""
+        state = self._state
+        found = {}
+        for pos, (ch, mark) in enumerate(zip(guess, marks)):
+            if mark == ABSENT:
+                continue
+            found[ch] = found.get(ch, 0) + 1
+            i = ord(ch) - 97
+            if 0 <= i < 26:
+                if mark == CORRECT:
+                    state[_FIXED + pos] = i + 1
+                elif mark == PRESENT:
+                    state[_BANNED + i] |= 1 << pos
+            else:
+                other = self._other = self._other or {}
+                if mark == CORRECT:
+                    other[pos] = ch
+                elif mark == PRESENT:
+                    other.setdefault(ch, [0, 0])[1] |= 1 << pos
+        for ch, n in found.items():
+            i = ord(ch) - 97
+            if 0 <= i < 26:
+                if n > state[i]:
+                    state[i] = n
+            else:
+                entry = self._other.setdefault(ch, [0, 0])
+                entry[0] = max(entry[0], n)
+
+    def _letters(self):
+        """(letter, min count, banned positions mask) of every constrained letter."""
+        state = self._state
+        for i in range(26):
+            if state[i]:
+                yield chr(97 + i), state[i], state[_BANNED + i]
+        for key, value in (self._other or {}).items():
+            if isinstance(key, str):
+                yield key, value[0], value[1]
+
+    @property
+    def fixed(self):
+        """Position -> green letter."""
+        fixed = {pos: chr(96 + code) for pos, code in enumerate(self._state[_FIXED:]) if code}
+        fixed.update((key, ch) for key, ch in (self._other or {}).items() if isinstance(key, int))
+        return fixed
+
+    @property
+    def min_counts(self):
+        """Letter -> copies every guess must contain."""
+        return {ch: n for ch, n, _ in self._letters()}
+
+    @property
+    def banned(self):
+        """Letter -> positions where it showed up yellow."""
+        return {ch: {pos for pos in range(MAX_LENGTH) if mask >> pos & 1}
+                for ch, _, mask in self._letters() if mask}
+
+    def check(self, guess):
+        """Why ``guess`` breaks the rules, or None if it is allowed."""
+        for pos, ch in sorted(self.fixed.items()):
+            if guess[pos] != ch:
+                return f"{_ordinal(pos + 1)} letter must be {ch.upper()}"
+        letters = list(self._letters())
+        for ch, n, _ in letters:
+            if guess.count(ch) < n:
+                if n == 1:
+                    return f"Guess must contain {ch.upper()}"
+                return f"Guess must contain {n} copies of {ch.upper()}"
+        for ch, _, mask in letters:
+            for pos in range(len(guess)):
+                if mask >> pos & 1 and guess[pos] == ch:
+                    return f"{ch.upper()} can't be the {_ordinal(pos + 1)} letter"
+        return None
@@ -0,0 +1,236 @@
+"""Entropy-based hint engine.
+
+The suggested guess is the one whose feedback pattern splits the
+remaining answers most evenly (highest expected information).  With NumPy
+the candidates are narrowed and every allowed guess is scored against
+them with the feedback matrix, in row batches; the opening move of every
+mode is computed once and cached next to the matrix.  Without NumPy a
+smaller pure-Python search over the remaining answers is used instead.
+
+On a cold cache the matrix and opening table take seconds to build, so
+the front-ends call prepare_in_background() when a game starts and the
+first hint waits on that instead of building them itself.
+
+Run ``python -m wordle_core.hints`` to prebuild the opening tables.
+"""
+import json
+import math
+import os
+import threading
+from concurrent.futures import Future
+from pathlib import Path
+
+from .cache import CACHE_DIR
+from .feedback import pattern_code, score_guess
+from .matrix import FeedbackMatrix, np
+from .metrics import timed
+
+# Rows of the matrix scored per batch when ranking guesses
+HINT_BATCH = 2048
+# Most guess x candidate cells scored for one hint (about 30 ms)
+SCORE_BUDGET = 1_500_000
+# Fewest openers scored when the budget forces a reduced guess pool
+MIN_POOL = 256
+# Openers kept, best first, in the cached opening table
+OPENING_POOL = 3000
+# Fallback search size without NumPy (keeps a hint well under 100 ms)
+FALLBACK_POOL = 80
+
+
+class HintEngine:
+    """Suggests the next guess for one game of ``mode``.
+
+    Call update() after every guess; the candidate set shrinks
+    incrementally instead of replaying the whole history.  With ``hard``
+    only the remaining candidates are suggested after the first turn,
+    since those are exactly the guesses that reuse every revealed hint.
+    """
+
+    def __init__(self, dictionary, mode, matrix=None, cache_dir=CACHE_DIR, hard=False):
+        self.answers = dictionary.targets(mode)
+        # Feedback patterns a guess can produce
+        self.patterns = 3 ** dictionary.length(mode)
+        self.hard = hard
+        self.cache_dir = Path(cache_dir)
+        self.matrix = None
+        self._table = None
+        if np is not None:
+            self.matrix = matrix or FeedbackMatrix.for_mode(dictionary, mode, cache_dir)
+            guess_keys = np.array([w.encode("utf-8") for w in self.matrix.guesses])
+            answer_keys = np.array([w.encode("utf-8") for w in self.answers])
+            # Row of the matrix for every answer word
+            self._answer_rows = np.searchsorted(guess_keys, answer_keys)
+        self.reset()
+
+    def reset(self):
+        """Forget all guesses (start of a new game)."""
+        self.turns = 0
+        if self.matrix is not None:
+            self.candidates = np.arange(len(self.answers))
+        else:
+            self.candidates = list(self.answers)
+
+    def remaining(self):
+        """Number of answers still consistent with the feedback."""
+        return len(self.candidates)
+
+    def update(self, guess, marks):
+        """Narrow the candidates with the feedback for ``guess``."""
+        code = pattern_code(marks)
+        self.turns += 1
+        if self.matrix is not None:
+            row = self.matrix.row(guess)
+            self.candidates = self.candidates[row[self.candidates] == code]
+        else:
+            self.candidates = [w for w in self.candidates
+                               if pattern_code(score_guess(guess, w)) == code]
+
+    @timed("hint")
+    def best_guess(self):
+        """The suggested next guess, or None if no answer fits the feedback."""
+        if len(self.candidates) == 0:
+            return None
+        if len(self.candidates) <= 2:
+            return self._word(self.candidates[0])
+        if self.matrix is None:
+            return self._fallback_best()
+        if self.turns == 0:
+            return self._opening_table()["guess"]
+        return self.matrix.guesses[self._best_row()]
+
+    def _word(self, candidate):
+        if self.matrix is not None:
+            return self.answers[int(candidate)]
+        return candidate
+
+    def _rank(self, candidates, rows=None):
+        """Expected information (bits) of each guess row over ``candidates``.
+
+        ``rows`` limits the guesses scored (all matrix rows by default).
+        """
+        codes = self.matrix.codes
+        if rows is None:
+            rows = np.arange(codes.shape[0])
+        k = len(candidates)
+        # n*log2(n) for every possible bucket size
+        plogp = np.arange(k + 1, dtype=np.float64)
+        plogp[1:] *= np.log2(plogp[1:])
+        scores = np.empty(len(rows))
+        for start in range(0, len(rows), HINT_BATCH):
+            block = codes[rows[start:start + HINT_BATCH]][:, candidates].astype(np.int64)
+            block += (np.arange(len(block)) * self.patterns)[:, None]
+            counts = np.bincount(block.ravel(), minlength=len(block) * self.patterns)
+            scores[start:start + len(block)] = plogp[counts.reshape(-1, self.patterns)].sum(axis=1)
+        return math.log2(k) - scores / k
+
+    def _best_row(self):
+        """Matrix row of the best guess for the current candidates.
+
+        Cost grows with guesses x candidates, so while many candidates
+        remain only the strongest openers from the opening table (plus
+        the candidates themselves, when few enough) are scored, keeping a
+        hint within SCORE_BUDGET matrix cells.
+        """
+        candidates = self.candidates
+        k = len(candidates)
+        answer_rows = self._answer_rows[candidates]
+        if self.hard:
+            size = max(SCORE_BUDGET // k, MIN_POOL)
+            rows = np.unique(answer_rows[::max(1, k // size)])
+        elif k * self.matrix.codes.shape[0] <= SCORE_BUDGET:
+            rows = np.arange(self.matrix.codes.shape[0])
+        else:
+            size = max(SCORE_BUDGET // k, MIN_POOL)
+            rows = np.asarray(self._opening_table()["pool"][:size])
+            if k <= size:
+                rows = np.union1d(rows, answer_rows)
+        entropy = self._rank(candidates, rows)
+        # A guess that may be the answer also gets its chance of winning outright
+        entropy[np.isin(rows, answer_rows)] += 1.0 / k
+        return int(rows[np.argmax(entropy)])
+
+    def _opening_table(self):
+        """Best opener and the guesses ranked by first-turn information.
+
+        Read from the cache when present, otherwise computed once over
+        the whole matrix and written next to it.
+        """
+        if self._table is not None:
+            return self._table
+        path = self.cache_dir / f"opener-{self.matrix.key}.json"
+        try:
+            with path.open(encoding="utf-8") as f:
+                self._table = json.load(f)
+            return self._table
+        except (OSError, ValueError):
+            pass
+        candidates = np.arange(len(self.answers))
+        entropy = self._rank(candidates)
+        entropy[self._answer_rows] += 1.0 / len(candidates)
+        order = np.argsort(-entropy, kind="stable")[:OPENING_POOL]
+        self._table = {
+            "guess": self.matrix.guesses[int(order[0])],
+            "pool": [int(r) for r in order],
+        }
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(self._table, f)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+        return self._table
+
+    def _fallback_best(self):
+        """Pure-Python search among a spread-out sample of the candidates."""
+        candidates = self.candidates
+        step = max(1, len(candidates) // FALLBACK_POOL)
+        pool = candidates[::step]
+        best, best_score = None, None
+        for guess in pool:
+            buckets = {}
+            for target in pool:
+                code = pattern_code(score_guess(guess, target))
+                buckets[code] = buckets.get(code, 0) + 1
+            score = sum(n * n for n in buckets.values())
+            if best_score is None or score < best_score:
+                best, best_score = guess, score
+        return best
+
+
+def prepare_engine(dictionary, mode, hard=False):
+    """A HintEngine for ``mode`` with its matrix and opening table ready."""
+    engine = HintEngine(dictionary, mode, hard=hard)
+    engine.best_guess()
+    return engine
+
+
+def prepare_in_background(dictionary, mode, hard=False):
+    """Future of prepare_engine(), run in a daemon thread.
+
+    A daemon, so quitting never waits for a build; the cache files are
+    written with an atomic rename, so an interrupted build leaves none.
+    """
+    future = Future()
+
+    def run():
+        try:
+            future.set_result(prepare_engine(dictionary, mode, hard))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name=f"hints-{mode}", daemon=True).start()
+    return future
+
+
+if __name__ == "__main__":
+    import time
+
+    from .words import MODES, Dictionary
+
+    d = Dictionary.load()
+    for mode in MODES:
+        start = time.perf_counter()
+        print(f"{mode}: open with {HintEngine(d, mode).best_guess().upper()} "
+              f"({time.perf_counter() - start:.2f}s)")
@@ -0,0 +1,325 @@
+"""SQLite leaderboard backend.
+
+Same interface as placemate.LeaderboardStore, backed by one table with
+the best time per (name, mode).  The primary key indexes (name, mode) for
+personal-best lookups and a second index on (mode, time) serves the
+top-N query, so neither has to read the whole board.  Ranks come from a
+``rank_tree`` table: a Fenwick tree per mode over RANK_BUCKETS time
+buckets of 1/BUCKETS_PER_SECOND s, updated in the same transaction as
+every new best time.  A rank is then a sum over at most 16 tree rows plus
+an indexed count of the players in the player's own bucket, so it needs
+no warm cache and never reads the whole board (or another mode).  Every
+write bumps the database's user_version, so other processes can tell
+that the board changed.
+Per-player statistics live in a ``stats`` table keyed by (name, mode)
+and are updated in place, one row write per finished game.
+
+Select it with ``WORDLE_LEADERBOARD=sqlite`` (see placemate.open_leaderboard);
+on first use the database is filled from placemate.json.  To import by
+hand: ``python -m wordle_core.leaderboard_db placemate.json placemate.sqlite3``
+"""
+import json
+import sqlite3
+from collections import defaultdict
+from contextlib import closing
+from datetime import datetime
+from pathlib import Path
+
+from .metrics import timed
+from .stats import PlayerStats
+
+# Rank buckets: tenths of a second, times past RANK_BUCKETS / 10 s share the last
+BUCKETS_PER_SECOND = 10
+RANK_BUCKETS = 1 << 16
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS records (
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    time REAL NOT NULL,
+    date TEXT,
+    PRIMARY KEY (name, mode)
+);
+CREATE INDEX IF NOT EXISTS records_mode_time ON records (mode, time);
+CREATE TABLE IF NOT EXISTS stats (
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    played INTEGER NOT NULL,
+    wins INTEGER NOT NULL,
+    streak INTEGER NOT NULL,
+    max_streak INTEGER NOT NULL,
+    distribution TEXT NOT NULL,
+    PRIMARY KEY (name, mode)
+);
+CREATE TABLE IF NOT EXISTS rank_tree (
+    mode TEXT NOT NULL,
+    node INTEGER NOT NULL,
+    players INTEGER NOT NULL,
+    PRIMARY KEY (mode, node)
+);
+"""
+
+TREE_ADD = """
+INSERT INTO rank_tree (mode, node, players) VALUES (?, ?, ?)
+ON CONFLICT (mode, node) DO UPDATE SET players = players + excluded.players
+"""
+
+UPSERT = """
+INSERT INTO records (name, mode, time, date) VALUES (?, ?, ?, ?)
+ON CONFLICT (name, mode) DO UPDATE SET time = excluded.time, date = excluded.date
+WHERE excluded.time < records.time
+"""
+
+STATS_UPSERT = """
+INSERT OR REPLACE INTO stats (name, mode, played, wins, streak, max_streak, distribution)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+class SQLiteLeaderboard:
+    """Best time per (player, mode) in an SQLite database."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        with self._connect() as db, db:
+            db.executescript(SCHEMA)
+            # Databases from before rank_tree: build it once
+            if (db.execute("SELECT EXISTS (SELECT 1 FROM records)").fetchone()[0]
+                    and not db.execute("SELECT EXISTS (SELECT 1 FROM rank_tree)").fetchone()[0]):
+                _rebuild_tree(db)
+
+    def _connect(self):
+        # A short-lived connection per call keeps the store usable from any thread
+        db = sqlite3.connect(self.path, timeout=30)
+        return closing(db)
+
+    @timed("leaderboard_load", backend="sqlite", op="entries")
+    def entries(self):
+        with self._connect() as db:
+            rows = db.execute("SELECT name, time, date, mode FROM records").fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    @timed("leaderboard_load", backend="sqlite", op="top")
+    def top(self, mode, n=10):
+        """The ``n`` fastest records of ``mode``, fastest first."""
+        with self._connect() as db:
+            rows = db.execute(
+                "SELECT name, time, date, mode FROM records WHERE mode = ? ORDER BY time LIMIT ?",
+                (mode, n),
+            ).fetchall()
+        return [_row_to_entry(row) for row in rows]
+
+    @timed("leaderboard_load", backend="sqlite", op="best")
+    def best(self, name, mode):
+        """The player's best time in ``mode``, or None."""
+        with self._connect() as db:
+            row = db.execute(
+                "SELECT time FROM records WHERE name = ? AND mode = ?", (name, mode)
+            ).fetchone()
+        return row[0] if row else None
+
+    @timed("leaderboard_load", backend="sqlite", op="rank")
+    def rank(self, name, mode):
+        """(rank, players) of the player's best time in ``mode``, or None."""
+        with self._connect() as db, db:
+            # One read transaction, so the tree and the records agree
+            db.execute("BEGIN")
+            row = db.execute(
+                "SELECT time FROM records WHERE name = ? AND mode = ?", (name, mode)
+            ).fetchone()
+            if row is None:
+                return None
+            time = row[0]
+            bucket = _bucket(time)
+            faster = _tree_prefix(db, mode, bucket)
+            # Faster players in the same bucket; ties share the best rank.  The
+            # last bucket holds every time past RANK_BUCKETS / 10 s, so this
+            # count is only unbounded for those rare, very slow games.
+            faster += db.execute(
+                "SELECT COUNT(*) FROM records WHERE mode = ? AND time >= ? AND time < ?"
+                " AND MIN(CAST(time * ? AS INTEGER), ?) = ?",
+                (mode, (bucket - 1) / BUCKETS_PER_SECOND, time, BUCKETS_PER_SECOND,
+                 RANK_BUCKETS - 1, bucket),
+            ).fetchone()[0]
+            total = _tree_prefix(db, mode, RANK_BUCKETS)
+        return faster + 1, total
+
+    @timed("leaderboard_save", backend="sqlite", op="record")
+    def record(self, name, seconds, mode):
+        """Store a finished game; only faster times change the board."""
+        entry = {
+            "name": name,
+            "time": float(seconds),
+            "date": datetime.utcnow().isoformat() + "Z",
+            "mode": mode,
+        }
+        with self._connect() as db, db:
+            # BEGIN IMMEDIATE: read the old time and write under one lock
+            db.execute("BEGIN IMMEDIATE")
+            if _store(db, entry):
+                self._bump_version(db)
+        return entry
+
+    @timed("stats_save", backend="sqlite")
+    def record_game(self, name, mode, won, tries):
+        """Count a finished game (won or lost) in the player's stats; returns them."""
+        with self._connect() as db, db:
+            db.execute("BEGIN IMMEDIATE")
+            stats = self._player_stats(db, name, mode) or PlayerStats()
+            stats.add(won, tries)
+            db.execute(STATS_UPSERT, (name, mode, stats.played, stats.wins, stats.streak,
+                                      stats.max_streak, json.dumps(stats.distribution)))
+        return stats
+
+    @timed("stats_load", backend="sqlite")
+    def player_stats(self, name, mode):
+        """The player's PlayerStats in ``mode``, or None before their first game."""
+        with self._connect() as db:
+            return self._player_stats(db, name, mode)
+
+    @staticmethod
+    def _player_stats(db, name, mode):
+        row = db.execute(
+            "SELECT played, wins, streak, max_streak, distribution FROM stats WHERE name = ? AND mode = ?",
+            (name, mode),
+        ).fetchone()
+        if row is None:
+            return None
+        played, wins, streak, max_streak, distribution = row
+        return PlayerStats(played, wins, streak, max_streak, json.loads(distribution))
+
+    @timed("leaderboard_save", backend="sqlite", op="record_many")
+    def record_many(self, results):
+        """Store several (name, seconds, mode) results in one transaction."""
+        date = datetime.utcnow().isoformat() + "Z"
+        entries = [
+            {"name": name, "time": float(seconds), "date": date, "mode": mode}
+            for name, seconds, mode in results
+        ]
+        if entries:
+            with self._connect() as db, db:
+                db.execute("BEGIN IMMEDIATE")
+                if sum(_store(db, entry) for entry in entries):
+                    self._bump_version(db)
+        return entries
+
+    @staticmethod
+    def _bump_version(db):
+        version = db.execute("PRAGMA user_version").fetchone()[0] + 1
+        db.execute(f"PRAGMA user_version = {version}")
+        return version
+
+    def import_entries(self, entries):
+        """Merge records (dicts as in placemate.json) into the database.
+
+        A bulk merge, so the rank tree is rebuilt once afterwards instead
+        of being updated record by record.
+        """
+        rows = (
+            (e.get("name"), e.get("mode", "Easy"), float(e.get("time", float("inf"))), e.get("date"))
+            for e in entries
+            if isinstance(e, dict) and e.get("name") is not None
+        )
+        with self._connect() as db, db:
+            db.execute("BEGIN IMMEDIATE")
+            db.executemany(UPSERT, rows)
+            _rebuild_tree(db)
+            self._bump_version(db)
+
+    def import_placemate(self, json_path):
+        """Merge placemate.json (and its journal) into the database."""
+        from .placemate import LeaderboardStore
+
+        self.import_entries(LeaderboardStore(json_path).entries())
+
+
+def _store(db, entry):
+    """Write ``entry`` if it beats the player's best; returns whether it did."""
+    name, mode, time = entry["name"], entry["mode"], entry["time"]
+    row = db.execute("SELECT time FROM records WHERE name = ? AND mode = ?", (name, mode)).fetchone()
+    old = row[0] if row else None
+    if old is not None and time >= old:
+        return False
+    db.execute(UPSERT, (name, mode, time, entry["date"]))
+    _tree_move(db, mode, time, old)
+    return True
+
+
+def _bucket(time):
+    """Rank bucket of a time (SQL computes the same with CAST in rank())."""
+    if time >= RANK_BUCKETS / BUCKETS_PER_SECOND:
+        return RANK_BUCKETS - 1
+    return min(int(time * BUCKETS_PER_SECOND), RANK_BUCKETS - 1)
+
+
+def _tree_prefix(db, mode, bucket):
+    """Players of ``mode`` whose best time falls in a bucket below ``bucket``."""
+    nodes = []
+    while bucket > 0:
+        nodes.append(bucket)
+        bucket -= bucket & -bucket
+    if not nodes:
+        return 0
+    marks = ", ".join("?" * len(nodes))
+    return db.execute(
+        f"SELECT COALESCE(SUM(players), 0) FROM rank_tree WHERE mode = ? AND node IN ({marks})",
+        (mode, *nodes),
+    ).fetchone()[0]
+
+
+def _tree_add(db, mode, bucket, delta):
+    node = bucket + 1
+    rows = []
+    while node <= RANK_BUCKETS:
+        rows.append((mode, node, delta))
+        node += node & -node
+    db.executemany(TREE_ADD, rows)
+
+
+def _tree_move(db, mode, time, old_time=None):
+    """Count a player's new best ``time``, replacing ``old_time`` if any."""
+    bucket = _bucket(time)
+    if old_time is not None:
+        old_bucket = _bucket(old_time)
+        if old_bucket == bucket:
+            return
+        _tree_add(db, mode, old_bucket, -1)
+    _tree_add(db, mode, bucket, 1)
+
+
+def _rebuild_tree(db):
+    """Rebuild rank_tree from the records, one grouped scan of the board."""
+    counts = defaultdict(lambda: [0] * (RANK_BUCKETS + 1))
+    rows = db.execute(
+        "SELECT mode, MIN(CAST(time * ? AS INTEGER), ?), COUNT(*) FROM records GROUP BY 1, 2",
+        (BUCKETS_PER_SECOND, RANK_BUCKETS - 1),
+    )
+    for mode, bucket, players in rows:
+        counts[mode][bucket + 1] += players
+    db.execute("DELETE FROM rank_tree")
+    for mode, tree in counts.items():
+        # Standard O(n) Fenwick build: push every node's sum to its parent
+        for node in range(1, RANK_BUCKETS + 1):
+            parent = node + (node & -node)
+            if parent <= RANK_BUCKETS:
+                tree[parent] += tree[node]
+        db.executemany(
+            "INSERT INTO rank_tree (mode, node, players) VALUES (?, ?, ?)",
+            ((mode, node, n) for node, n in enumerate(tree) if n),
+        )
+
+
+def _row_to_entry(row):
+    name, time, date, mode = row
+    return {"name": name, "time": time, "date": date, "mode": mode}
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python -m wordle_core.leaderboard_db placemate.json placemate.sqlite3")
+        sys.exit(1)
+    db = SQLiteLeaderboard(sys.argv[2])
+    db.import_placemate(sys.argv[1])
+    print(f"Imported {len(db.entries())} records into {sys.argv[2]}")
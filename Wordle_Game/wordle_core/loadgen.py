@@ -0,0 +1,193 @@
+"""Load generator for the game server.
+
+Simulates many players, multiplexed over a few connections, each playing
+game after game with random answer words as guesses.  Prints guesses/sec
+every second and a latency summary at the end.
+
+    python -m wordle_core.loadgen --spawn --players 10000 --duration 30
+
+``--spawn`` starts a private server (with a throw-away leaderboard) for
+the run; without it the generator connects to ``--host``/``--port``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from .server import DEFAULT_HOST, DEFAULT_PORT
+from .words import MODES, Dictionary
+
+
+class Connection:
+    """One TCP connection with any number of requests in flight."""
+
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self._ids = itertools.count(1)
+        self._waiting = {}
+        self._outbox = []
+        self._reader_task = asyncio.create_task(self._read_replies())
+
+    @classmethod
+    async def open(cls, host, port):
+        reader, writer = await asyncio.open_connection(host, port)
+        return cls(reader, writer)
+
+    async def request(self, op, **fields):
+        rid = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[rid] = future
+        fields.update(id=rid, op=op)
+        if not self._outbox:
+            asyncio.get_running_loop().call_soon(self._send)
+        self._outbox.append(json.dumps(fields).encode() + b"\n")
+        return await future
+
+    def _send(self):
+        # Requests made in the same loop iteration go out in one write
+        self.writer.write(b"".join(self._outbox))
+        self._outbox.clear()
+
+    async def _read_replies(self):
+        while True:
+            line = await self.reader.readline()
+            if not line:
+                break
+            reply = json.loads(line)
+            future = self._waiting.pop(reply.get("id"), None)
+            if future is not None and not future.done():
+                future.set_result(reply)
+        for future in self._waiting.values():
+            future.set_exception(ConnectionError("server closed the connection"))
+
+    async def close(self):
+        self._reader_task.cancel()
+        self.writer.close()
+
+
+class Stats:
+    """Counters shared by all simulated players."""
+
+    def __init__(self):
+        self.latencies = []
+        self.guesses = 0
+        self.rejected = 0
+        self.games = 0
+        self.wins = 0
+
+
+async def play(conn, player, words, mode, stats, deadline, think, rng):
+    """Keep playing games until ``deadline``."""
+    while time.perf_counter() < deadline:
+        reply = await conn.request("new", mode=mode, name=player)
+        sid = reply["session"]
+        over = False
+        while not over and time.perf_counter() < deadline:
+            if think:
+                await asyncio.sleep(rng.uniform(0, 2 * think))
+            start = time.perf_counter()
+            reply = await conn.request("guess", session=sid, word=rng.choice(words))
+            stats.latencies.append(time.perf_counter() - start)
+            stats.guesses += 1
+            if not reply["ok"]:
+                stats.rejected += 1
+                continue
+            over = reply["over"]
+            if over:
+                stats.games += 1
+                stats.wins += reply["solved"]
+        await conn.request("end", session=sid)
+
+
+async def report_progress(stats, interval=1.0):
+    last = 0
+    while True:
+        await asyncio.sleep(interval)
+        print(f"  {(stats.guesses - last) / interval:10,.0f} guesses/s")
+        last = stats.guesses
+
+
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return 0.0
+    i = min(len(sorted_values) - 1, int(p / 100 * len(sorted_values)))
+    return sorted_values[i]
+
+
+async def run(host, port, players, connections, duration, mode, think, seed):
+    words = list(Dictionary.load().targets(mode))
+    conns = [await Connection.open(host, port) for _ in range(connections)]
+    stats = Stats()
+    rng = random.Random(seed)
+    start = time.perf_counter()
+    deadline = start + duration
+    progress = asyncio.create_task(report_progress(stats))
+    await asyncio.gather(*(
+        play(conns[i % connections], f"bot{i}", words, mode, stats, deadline, think,
+             random.Random(rng.random()))
+        for i in range(players)
+    ))
+    took = time.perf_counter() - start
+    progress.cancel()
+    for conn in conns:
+        await conn.close()
+
+    lat = sorted(stats.latencies)
+    print(f"{players:,} players on {connections} connections, {took:.1f}s")
+    print(f"  guesses:   {stats.guesses:,} ({stats.guesses / took:,.0f}/s sustained, {stats.rejected:,} rejected)")
+    print(f"  games:     {stats.games:,} finished, {stats.wins:,} won")
+    print("  latency:   p50 {:.2f} ms, p99 {:.2f} ms, max {:.2f} ms".format(
+        percentile(lat, 50) * 1000, percentile(lat, 99) * 1000, (lat[-1] if lat else 0) * 1000))
+
+
+def spawn_server(port, leaderboard):
+    """Start ``python -m wordle_core.server`` and wait until it listens."""
+    cwd = Path(__file__).resolve().parent.parent
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "wordle_core.server", "--port", str(port), "--leaderboard", str(leaderboard)],
+        cwd=cwd, stdout=subprocess.PIPE, text=True,
+    )
+    line = proc.stdout.readline()
+    if not line.startswith("Serving"):
+        proc.kill()
+        raise SystemExit("The server did not start.")
+    return proc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load-test the Wordle game server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--players", type=int, default=10_000)
+    parser.add_argument("--connections", type=int, default=50)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--mode", choices=list(MODES), default="Medium")
+    parser.add_argument("--think", type=float, default=0.0,
+                        help="mean pause in seconds before each guess")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true", help="start a private server for the run")
+    args = parser.parse_args(argv)
+
+    proc = None
+    with tempfile.TemporaryDirectory() as tmp:
+        if args.spawn:
+            args.host = DEFAULT_HOST
+            proc = spawn_server(args.port, Path(tmp) / "placemate.json")
+        try:
+            asyncio.run(run(args.host, args.port, args.players, args.connections,
+                            args.duration, args.mode, args.think, args.seed))
+        finally:
+            if proc is not None:
+                proc.terminate()
+                proc.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,217 @@
+"""Vectorised guess x answer feedback-pattern matrix.
+
+Every (guess, answer) pair is scored at once with NumPy and stored as a
+base-3 pattern code (see feedback.pattern_code) in a uint8 matrix (uint16
+for words longer than 5 letters), one row per allowed guess and one
+column per answer.  The matrix is saved as a
+``.npy`` file in the word-list cache and memory-mapped on later runs, so
+bulk analysis becomes array indexing instead of millions of calls to
+score_guess.  Rows follow the sorted guess list, so a set of guesses
+gives the same file (and cache key) in every process.  When a list
+changes, building the new matrix removes the matrices and opening tables
+that no mode of the dictionary uses any more.
+
+NumPy is optional for playing the game; it is only needed here.
+Run ``python -m wordle_core.matrix`` to build the matrix of every mode.
+"""
+import hashlib
+import os
+from bisect import bisect_left
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:  # the game itself runs without NumPy
+    np = None
+
+from .cache import CACHE_DIR, PackedWordList
+from .feedback import CORRECT, PRESENT
+
+# Guess rows scored per batch; bounds the (batch, answers) temporaries
+BATCH_SIZE = 128
+
+
+def require_numpy():
+    if np is None:
+        raise RuntimeError("NumPy is required for the feedback matrix (pip install numpy)")
+
+
+def code_dtype(length):
+    """Smallest unsigned dtype holding every pattern code of ``length`` letters."""
+    return np.uint8 if 3 ** length <= 256 else np.uint16
+
+
+def encode_words(words, alphabet=None):
+    """Words as an (n, length) uint8 array of their letters.
+
+    ASCII words use their byte values.  Other alphabets need the
+    ``alphabet`` mapping (letter -> 0..255) shared by every list that
+    will be compared; see letter_alphabet().
+    """
+    require_numpy()
+    words = list(words)
+    length = len(words[0]) if words else 0
+    if alphabet is not None:
+        data = bytes(alphabet[ch] for w in words for ch in w)
+    else:
+        data = "".join(words).encode("utf-8")
+    return np.frombuffer(data, dtype=np.uint8).reshape(len(words), length)
+
+
+def letter_alphabet(*word_lists):
+    """Letter -> small code mapping for lists that are not all ASCII, else None."""
+    letters = set()
+    for words in word_lists:
+        for w in words:
+            letters.update(w)
+    if all(ch.isascii() for ch in letters):
+        return None
+    return {ch: i for i, ch in enumerate(sorted(letters))}
+
+
+def pattern_codes(guesses, answers):
+    """Pattern codes for every guess (rows) against every answer (columns).
+
+    ``guesses`` and ``answers`` are (n, length) arrays from encode_words.
+    Duplicate letters follow score_guess exactly: the k-th non-green copy
+    of a letter in the guess is yellow only while the answer still has
+    more than k non-green copies of that letter.  Everything is done with
+    (guesses, answers) uint8 arrays; nothing loops over word pairs.
+    """
+    require_numpy()
+    n, length = guesses.shape
+    # letter_counts[c, a]: copies of byte c in answer a
+    letter_counts = np.zeros((256, answers.shape[0]), dtype=np.uint8)
+    for p in range(length):
+        np.add.at(letter_counts, (answers[:, p], np.arange(answers.shape[0])), 1)
+    # same[g, i, p]: guess g has the same letter at positions i and p
+    same = guesses[:, :, None] == guesses[:, None, :]
+    greens = [guesses[:, p, None] == answers[None, :, p] for p in range(length)]
+
+    dtype = code_dtype(length)
+    codes = np.zeros((n, answers.shape[0]), dtype=dtype)
+    for i in range(length):
+        # Copies of letter i left in the answer once greens are taken
+        available = letter_counts[guesses[:, i]]
+        # Non-green copies of letter i earlier in the guess
+        earlier = np.zeros_like(available)
+        for p in range(length):
+            available -= greens[p] & same[:, i, p, None]
+            if p < i:
+                earlier += ~greens[p] & same[:, i, p, None]
+        yellow = ~greens[i] & (earlier < available)
+        codes += greens[i] * dtype(CORRECT * 3 ** i) + yellow * dtype(PRESENT * 3 ** i)
+    return codes
+
+
+def compute_matrix(guesses, answers, batch_size=BATCH_SIZE):
+    """Full pattern matrix for two word lists, computed in row batches."""
+    alphabet = letter_alphabet(guesses, answers)
+    g = encode_words(guesses, alphabet)
+    a = encode_words(answers, alphabet)
+    out = np.empty((len(g), len(a)), dtype=code_dtype(g.shape[1]))
+    for start in range(0, len(g), batch_size):
+        out[start:start + batch_size] = pattern_codes(g[start:start + batch_size], a)
+    return out
+
+
+def _lists_key(guesses, answers):
+    h = hashlib.sha1()
+    for words in (guesses, answers):
+        h.update(len(words).to_bytes(4, "little"))
+        for w in words:
+            h.update(w.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+class FeedbackMatrix:
+    """Pattern codes for a fixed guess list and answer list.
+
+    ``codes[g, a]`` is the pattern of guesses[g] against answers[a].
+    The guesses are a sorted sequence (PackedWordList or list) and the
+    answers support index().
+    """
+
+    def __init__(self, codes, guesses, answers, key=None):
+        self.codes = codes
+        self.guesses = guesses
+        self.answers = answers
+        self.key = key or _lists_key(guesses, answers)
+
+    @classmethod
+    def load(cls, guesses, answers, cache_dir=CACHE_DIR):
+        """Memory-map the cached matrix for these lists, building it if needed.
+
+        The file name is derived from a hash of both word lists, so a
+        change to either list produces a fresh matrix.  Guesses given in
+        any other form than a PackedWordList are sorted first.
+        """
+        require_numpy()
+        if not isinstance(guesses, PackedWordList):
+            guesses = sorted(guesses)
+        key = _lists_key(guesses, answers)
+        path = Path(cache_dir) / f"patterns-{key}.npy"
+        if not path.exists():
+            codes = compute_matrix(guesses, answers)
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+                with tmp.open("wb") as f:
+                    np.save(f, codes)
+                os.replace(tmp, path)
+            except OSError:
+                return cls(codes, guesses, answers, key)
+        return cls(np.load(path, mmap_mode="r"), guesses, answers, key)
+
+    @classmethod
+    def for_mode(cls, dictionary, mode, cache_dir=CACHE_DIR):
+        """Matrix of every valid guess against the answers of ``mode``.
+
+        A newly built matrix prunes the cache (see prune_cache).
+        """
+        guesses, answers = dictionary.guess_list(mode), dictionary.targets(mode)
+        built = not (Path(cache_dir) / f"patterns-{_lists_key(guesses, answers)}.npy").exists()
+        matrix = cls.load(guesses, answers, cache_dir)
+        if built:
+            prune_cache(dictionary, cache_dir)
+        return matrix
+
+    def guess_row(self, guess):
+        """Row of ``guess``, by binary search over the sorted guesses."""
+        i = bisect_left(self.guesses, guess)
+        if i == len(self.guesses) or self.guesses[i] != guess:
+            raise ValueError(f"{guess!r} is not in the guess list")
+        return i
+
+    def pattern(self, guess, answer):
+        """Pattern code of a single pair, by lookup."""
+        return int(self.codes[self.guess_row(guess), self.answers.index(answer)])
+
+    def row(self, guess):
+        """Pattern codes of ``guess`` against every answer."""
+        return self.codes[self.guess_row(guess)]
+
+
+def prune_cache(dictionary, cache_dir=CACHE_DIR):
+    """Delete the matrices and opening tables of lists no mode of ``dictionary`` uses."""
+    live = {_lists_key(dictionary.guess_list(mode), dictionary.targets(mode)) for mode in dictionary.specs}
+    for pattern in ("patterns-*.npy", "opener-*.json"):
+        for path in Path(cache_dir).glob(pattern):
+            if path.stem.partition("-")[2] not in live:
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+
+if __name__ == "__main__":
+    import time
+
+    from .words import MODES, Dictionary
+
+    d = Dictionary.load()
+    for mode in MODES:
+        start = time.perf_counter()
+        m = FeedbackMatrix.for_mode(d, mode)
+        print(f"{mode}: {m.codes.shape[0]} x {m.codes.shape[1]} patterns "
+              f"ready in {time.perf_counter() - start:.2f}s")
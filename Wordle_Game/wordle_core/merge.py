@@ -0,0 +1,264 @@
+"""Merge leaderboards collected from many machines into one.
+
+Each input is a placemate.json (a JSON list of records) or a journal
+(one record per line); a placemate.json's own ``.journal`` is read with
+it, as load_placemate does.  A malformed record is skipped and counted
+without losing the rest of its file.  Records without a mode count as Easy and
+the result keeps every player's best time per mode, ties going to the
+record read first, just as save_placemate would have kept it.
+
+Memory stays bounded however many records come in: inputs are parsed
+incrementally, best times are gathered for at most RUN_RECORDS players
+at a time and each such run is written, sorted by (mode, name), to a
+temporary file.  The runs are then k-way merged with heapq.merge and the
+merged board is written out record by record - as a placemate.json, or
+straight into a leaderboard database when the output ends in .sqlite3.
+
+    python -m wordle_core.merge merged.json kiosk1/placemate.json kiosk2/placemate.json ...
+"""
+import argparse
+import collections
+import heapq
+import itertools
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from .placemate import _normalise
+
+# Distinct (mode, player) bests held in memory before a run is written
+RUN_RECORDS = 200_000
+# Characters read from an input at a time
+READ_CHUNK = 1 << 16
+
+
+def _resync(buf, pos):
+    """Where to resume after the malformed list element at ``buf[pos]``.
+
+    Scans the element, tracking strings and brackets, up to the "}" or
+    "]" that closes it (returning the index after it) or to a "," at its
+    top level that starts the next record ("{" follows; returning its
+    index), so an element left open does not swallow the records after
+    it.  A line break ends an unterminated string, as JSON strings cannot
+    hold one.  Returns -1 if ``buf`` ends first.
+    """
+    depth, in_string, escaped = 0, False, False
+    for i in range(pos, len(buf)):
+        ch = buf[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif ch == "\\":
+                escaped = True
+            elif ch == '"' or ch == "\n":
+                in_string = False
+        elif ch == '"':
+            in_string = True
+        elif ch in "[{":
+            depth += 1
+        elif ch in "]}":
+            if depth <= 1:
+                return i + 1
+            depth -= 1
+        elif ch == "," and depth <= 1:
+            rest = buf[i + 1:i + 64].lstrip()
+            if not rest:
+                return -1  # the next element is not read yet
+            if rest[0] == "{":
+                return i
+    return -1
+
+
+def _iter_array(f):
+    """Elements of a JSON list read from text file ``f`` one at a time.
+
+    An element that is not valid JSON gives None, and reading goes on
+    after it (see _resync).
+    """
+    decoder = json.JSONDecoder()
+    buf, pos, eof = "", 0, False
+
+    def fill():
+        nonlocal buf, pos, eof
+        data = f.read(READ_CHUNK)
+        eof = not data
+        buf = buf[pos:] + data
+        pos = 0
+
+    def skip(chars):
+        nonlocal pos
+        while True:
+            while pos < len(buf) and buf[pos] in chars:
+                pos += 1
+            if pos < len(buf) or eof:
+                return
+            fill()
+
+    skip(" \t\r\n")
+    if buf[pos:pos + 1] != "[":
+        return
+    pos += 1
+    while True:
+        skip(" \t\r\n,")
+        if pos >= len(buf) or buf[pos] == "]":
+            return
+        try:
+            value, end = decoder.raw_decode(buf, pos)
+        except ValueError:
+            end = _resync(buf, pos)
+            if end < 0:
+                if eof:
+                    return  # truncated file: keep what was read
+                fill()
+                continue
+            pos = end
+            yield None
+            continue
+        pos = end
+        yield value
+
+
+def iter_records(path):
+    """Records of a placemate.json (and its journal) or of a journal file.
+
+    Unreadable elements and journal lines give None.
+    """
+    path = Path(path)
+    with path.open(encoding="utf-8") as f:
+        first = f.read(1)
+        while first.isspace():
+            first = f.read(1)
+        f.seek(0)
+        if first == "[":
+            yield from _iter_array(f)
+        else:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    yield None  # torn line after a crash
+    journal = path.with_name(path.name + ".journal")
+    if first == "[" and journal.exists():
+        yield from iter_records(journal)
+
+
+def _keyed(records, skipped=None, source=None):
+    """(mode, name, time, date) of every usable record, legacy modes filled in.
+
+    The others are counted under ``source`` in the Counter ``skipped``, if given.
+    """
+    for entry in records:
+        if not isinstance(entry, dict) or not isinstance(entry.get("name"), str):
+            if skipped is not None:
+                skipped[source] += 1
+            continue
+        entry = _normalise(entry)
+        try:
+            time = float(entry["time"])
+        except (KeyError, TypeError, ValueError):
+            if skipped is not None:
+                skipped[source] += 1
+            continue
+        yield str(entry["mode"]), entry["name"], time, entry.get("date")
+
+
+def _write_run(best, directory):
+    """Write one sorted run of best times; returns its path."""
+    fd, name = tempfile.mkstemp(suffix=".run", dir=directory)
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        for (mode, name_), (time, seq, date) in sorted(best.items()):
+            f.write(json.dumps([mode, name_, time, seq, date]) + "\n")
+    return name
+
+
+def _read_run(path):
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            yield json.loads(line)
+
+
+def merge_records(paths, run_records=RUN_RECORDS, tmp_dir=None, skipped=None):
+    """Best record per (mode, player) over all inputs, sorted by mode then name.
+
+    A generator of placemate-style dicts; temporary run files live in
+    ``tmp_dir`` (the system default if None) until it is exhausted.
+    ``skipped``, a collections.Counter if given, gets the number of
+    malformed or unusable records of each input path.
+    """
+    seq = itertools.count()
+    with tempfile.TemporaryDirectory(dir=tmp_dir, prefix="wordle-merge-") as directory:
+        runs = []
+        best = {}
+        for path in paths:
+            for mode, name, time, date in _keyed(iter_records(path), skipped, str(path)):
+                n = next(seq)
+                old = best.get((mode, name))
+                if old is None:
+                    if len(best) >= run_records:
+                        runs.append(_write_run(best, directory))
+                        best = {}
+                    best[(mode, name)] = (time, n, date)
+                elif time < old[0]:
+                    best[(mode, name)] = (time, n, date)
+        # The last run stays in memory
+        last = [[mode, name, time, n, date] for (mode, name), (time, n, date) in sorted(best.items())]
+        best = None
+        # Sorted by (mode, name, time, seq): the first row of a player is their best
+        merged = heapq.merge(*map(_read_run, runs), last, key=lambda row: row[:4])
+        for (mode, name), rows in itertools.groupby(merged, key=lambda row: (row[0], row[1])):
+            _, _, time, _, date = next(rows)
+            yield {"name": name, "time": time, "date": date, "mode": mode}
+
+
+def write_json(records, path):
+    """Stream records into a placemate.json, replacing it atomically; returns the count."""
+    path = Path(path)
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    count = 0
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write("[")
+        for entry in records:
+            f.write(("," if count else "") + "\n  " + json.dumps(entry))
+            count += 1
+        f.write("\n]\n")
+    os.replace(tmp, path)
+    return count
+
+
+def write_sqlite(records, path):
+    """Merge records into a leaderboard database; returns the count."""
+    from .leaderboard_db import SQLiteLeaderboard
+
+    count = itertools.count()
+    # zip() draws from count once per record, so it ends at the number written
+    SQLiteLeaderboard(path).import_entries(e for e, _ in zip(records, count))
+    return next(count)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Merge leaderboards from many machines into one.")
+    parser.add_argument("output", help="merged placemate.json (or a .sqlite3 leaderboard)")
+    parser.add_argument("inputs", nargs="+", help="placemate.json or journal files")
+    parser.add_argument("--run-records", type=int, default=RUN_RECORDS,
+                        help="player bests held in memory before a sorted run is spilled to disk")
+    parser.add_argument("--tmp-dir", default=None, help="directory for the sorted runs")
+    args = parser.parse_args(argv)
+    missing = [p for p in args.inputs if not Path(p).is_file()]
+    if missing:
+        parser.exit(1, f"Input not found: {', '.join(missing)}\n")
+    skipped = collections.Counter()
+    records = merge_records(args.inputs, args.run_records, args.tmp_dir, skipped)
+    if Path(args.output).suffix == ".sqlite3":
+        count = write_sqlite(records, args.output)
+    else:
+        count = write_json(records, args.output)
+    print(f"Merged {len(args.inputs)} leaderboards into {args.output}: {count} records")
+    for path, n in skipped.items():
+        print(f"Skipped {n} malformed {'record' if n == 1 else 'records'} in {path}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""Opt-in timings and counters for the hot paths.
+
+Set WORDLE_METRICS to turn instrumentation on for any front-end (CLI,
+GUI, server, simulator):
+
+    WORDLE_METRICS=1 python Wordle.py              # wordle_metrics.json/.prom
+    WORDLE_METRICS=/tmp/run1 python wordle_gui.py  # /tmp/run1.json/.prom
+
+Timings go into fixed-bucket histograms (1 us to 10 s) and are written
+as JSON and as Prometheus text format when the process exits, and also
+every WORDLE_METRICS_INTERVAL seconds when that is set.  The JSON file
+also carries a p50/p99 estimate per histogram.  Functions are wrapped
+with @timed when their module is imported, so with metrics off they are
+the original functions and cost nothing; timer() and counter() hand out
+shared no-op objects instead.
+"""
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from datetime import datetime
+from pathlib import Path
+
+METRICS_ENV = "WORDLE_METRICS"
+INTERVAL_ENV = "WORDLE_METRICS_INTERVAL"
+# Used when WORDLE_METRICS is just switched on ("1", "yes", ...)
+DEFAULT_PATH = Path(__file__).resolve().parent.parent / "wordle_metrics"
+
+# Upper bounds (seconds) of the histogram buckets: 1, 2.5, 5 per decade
+BUCKETS = tuple(float(f"{m}e{e}") for e in range(-6, 1) for m in (1, 2.5, 5)) + (10.0,)
+# Prefix of every exported Prometheus metric
+PREFIX = "wordle_"
+
+_OFF = {"", "0", "false", "no", "off"}
+_ON = {"1", "true", "yes", "on"}
+
+
+def _output_path():
+    """Path stem to export to, or None when metrics are off."""
+    value = os.environ.get(METRICS_ENV, "").strip()
+    if value.lower() in _OFF:
+        return None
+    if value.lower() in _ON:
+        return DEFAULT_PATH
+    path = Path(value)
+    return path.with_suffix("") if path.suffix in (".json", ".prom") else path
+
+
+OUTPUT = _output_path()
+ENABLED = OUTPUT is not None
+
+
+class Histogram:
+    """Sum and bucket counts of observed durations.
+
+    Updates take no lock (a lock would double the cost of timing a
+    feedback score); under the GIL a count can only be lost when two
+    threads finish timing the same histogram at the same moment.
+    """
+
+    __slots__ = ("name", "labels", "sum", "buckets")
+
+    def __init__(self, name, labels=()):
+        self.name = name
+        self.labels = labels
+        self.sum = 0.0
+        self.buckets = [0] * (len(BUCKETS) + 1)  # last one is +Inf
+
+    @property
+    def count(self):
+        return sum(self.buckets)
+
+    def observe(self, seconds):
+        self.buckets[bisect_left(BUCKETS, seconds)] += 1
+        self.sum += seconds
+
+    def quantile(self, q, buckets=None):
+        """Estimate of the ``q`` quantile, interpolated inside its bucket."""
+        buckets = buckets or self.buckets
+        count = sum(buckets)
+        if not count:
+            return None
+        rank = q * count
+        seen = 0
+        for i, n in enumerate(buckets):
+            if n and seen + n >= rank:
+                lo = BUCKETS[i - 1] if i else 0.0
+                hi = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+                return lo + (hi - lo) * (rank - seen) / n
+            seen += n
+        return BUCKETS[-1]
+
+    def snapshot(self):
+        buckets = list(self.buckets)
+        return {
+            "name": self.name,
+            "labels": dict(self.labels),
+            "count": sum(buckets),
+            "sum": self.sum,
+            "buckets": buckets,
+            "p50": self.quantile(0.5, buckets),
+            "p99": self.quantile(0.99, buckets),
+        }
+
+
+class Counter:
+    """Monotonic event count (unlocked, like Histogram)."""
+
+    __slots__ = ("name", "labels", "value")
+
+    def __init__(self, name, labels=()):
+        self.name = name
+        self.labels = labels
+        self.value = 0
+
+    def inc(self, n=1):
+        self.value += n
+
+
+class _Timer:
+    __slots__ = ("observe", "start")
+
+    def __init__(self, histogram):
+        self.observe = histogram.observe
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.observe(time.perf_counter() - self.start)
+
+
+class _Noop:
+    """Stands in for timers and counters while metrics are off."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def inc(self, n=1):
+        pass
+
+    def observe(self, seconds):
+        pass
+
+
+_NOOP = _Noop()
+_histograms = {}
+_counters = {}
+_registry_lock = threading.Lock()
+
+
+def _key(name, labels):
+    return name, tuple(sorted(labels.items()))
+
+
+def histogram(name, **labels):
+    """The histogram ``name`` with ``labels``, created on first use."""
+    if not ENABLED:
+        return _NOOP
+    key = _key(name, labels)
+    hist = _histograms.get(key)
+    if hist is None:
+        with _registry_lock:
+            hist = _histograms.setdefault(key, Histogram(*key))
+    return hist
+
+
+def counter(name, **labels):
+    """The counter ``name`` with ``labels``, created on first use."""
+    if not ENABLED:
+        return _NOOP
+    key = _key(name, labels)
+    c = _counters.get(key)
+    if c is None:
+        with _registry_lock:
+            c = _counters.setdefault(key, Counter(*key))
+    return c
+
+
+def timer(name, **labels):
+    """Context manager timing its block into histogram ``name``."""
+    if not ENABLED:
+        return _NOOP
+    return _Timer(histogram(name, **labels))
+
+
+def timed(name, **labels):
+    """Decorator timing every call into histogram ``name``.
+
+    With metrics off the function is returned unchanged.
+    """
+    def decorate(func):
+        if not ENABLED:
+            return func
+        hist = histogram(name, **labels)
+        buckets = hist.buckets
+        clock = time.perf_counter
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                # Histogram.observe inlined: this wraps calls of a few us
+                elapsed = clock() - start
+                buckets[bisect_left(BUCKETS, elapsed)] += 1
+                hist.sum += elapsed
+        return wrapper
+    return decorate
+
+
+def snapshot():
+    """Every metric recorded so far, as JSON-ready dicts."""
+    with _registry_lock:
+        histograms = list(_histograms.values())
+        counters = list(_counters.values())
+    return {
+        "generated": datetime.utcnow().isoformat() + "Z",
+        "pid": os.getpid(),
+        "buckets": list(BUCKETS),
+        "histograms": [h.snapshot() for h in histograms],
+        "counters": [{"name": c.name, "labels": dict(c.labels), "value": c.value} for c in counters],
+    }
+
+
+def _labels_text(labels, extra=None):
+    items = list(labels.items()) + ([extra] if extra else [])
+    if not items:
+        return ""
+    return "{" + ",".join(f'{k}="{v}"' for k, v in items) + "}"
+
+
+def prometheus_text(data):
+    """Prometheus text exposition format of a snapshot()."""
+    lines = []
+    typed = set()
+    # Samples of one metric family must be adjacent
+    for h in sorted(data["histograms"], key=lambda h: h["name"]):
+        name = PREFIX + h["name"] + "_seconds"
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} histogram")
+        cumulative = 0
+        for bound, n in zip(data["buckets"] + ["+Inf"], h["buckets"]):
+            cumulative += n
+            le = bound if isinstance(bound, str) else repr(bound)
+            lines.append(f"{name}_bucket{_labels_text(h['labels'], ('le', le))} {cumulative}")
+        lines.append(f"{name}_sum{_labels_text(h['labels'])} {h['sum']!r}")
+        lines.append(f"{name}_count{_labels_text(h['labels'])} {h['count']}")
+    for c in sorted(data["counters"], key=lambda c: c["name"]):
+        name = PREFIX + c["name"] + "_total"
+        if name not in typed:
+            typed.add(name)
+            lines.append(f"# TYPE {name} counter")
+        lines.append(f"{name}{_labels_text(c['labels'])} {c['value']}")
+    return "\n".join(lines) + "\n"
+
+
+def _write(path, text):
+    tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def export(path=None):
+    """Write <path>.json and <path>.prom (OUTPUT by default)."""
+    path = Path(path or OUTPUT)
+    data = snapshot()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write(path.with_name(path.name + ".json"), json.dumps(data, indent=2))
+    _write(path.with_name(path.name + ".prom"), prometheus_text(data))
+
+
+def _export_quietly():
+    try:
+        export()
+    except OSError:
+        print("Warning: could not write metrics.")
+
+
+def _export_every(seconds):
+    while True:
+        time.sleep(seconds)
+        _export_quietly()
+
+
+def _install():
+    atexit.register(_export_quietly)
+    try:
+        interval = float(os.environ.get(INTERVAL_ENV, "0"))
+    except ValueError:
+        interval = 0
+    if interval > 0:
+        threading.Thread(target=_export_every, args=(interval,), name="metrics-export",
+                         daemon=True).start()
+
+
+if ENABLED:
+    _install()
+
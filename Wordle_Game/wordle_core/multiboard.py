@@ -0,0 +1,174 @@
+"""Multi-board games (Dordle, Quordle, Octordle).
+
+A MultiBoardSession plays 2, 4 or 8 different targets at once from the
+answer list of BASE_MODE.  Every guess is validated once and scored
+against all the boards that are still unsolved with a single
+feedback.score_many() call; a board stops taking guesses once it is
+solved.  The game is won when every board is solved within the attempt
+limit (the number of boards plus 5).
+
+Like GameSession the state is compact: guess ids and the time of every
+guess (ms since the start) in two arrays, and per board an array of
+pattern codes (one per guess it took) and the attempt that solved it (0
+while unsolved).
+"""
+import random
+import time
+from array import array
+from collections import namedtuple
+
+from .feedback import decode_pattern, pattern_code, score_many
+from .metrics import counter
+from .session import InvalidGuess
+
+# Mode name -> number of boards
+BOARD_MODES = {"Dordle": 2, "Quordle": 4, "Octordle": 8}
+# Answer list the targets are drawn from
+BASE_MODE = "Easy"
+# Attempts on top of one per board
+EXTRA_ATTEMPTS = 5
+
+# Outcome of one guess: marks has one tuple per board (None for boards
+# solved earlier), solved the boards this guess solved
+MultiTurn = namedtuple("MultiTurn", "guess marks solved over")
+
+# Shared with single-board games
+_accepted = counter("guesses_accepted")
+
+
+def board_attempts(boards):
+    """Attempt limit of a game with ``boards`` boards."""
+    return boards + EXTRA_ATTEMPTS
+
+
+class MultiBoardSession:
+    """One multi-board game of ``mode`` (a BOARD_MODES name)."""
+
+    __slots__ = ("dictionary", "mode", "max_attempts", "start_time", "end_time",
+                 "_targets", "_guesses", "_codes", "_times", "_solved_at")
+
+    def __init__(self, dictionary, mode, targets, max_attempts=None):
+        if len(targets) != BOARD_MODES[mode]:
+            raise ValueError(f"{mode} needs {BOARD_MODES[mode]} targets")
+        self.dictionary = dictionary
+        self.mode = mode
+        self.max_attempts = max_attempts or board_attempts(len(targets))
+        answers = dictionary.targets(BASE_MODE)
+        self._targets = array("I", (answers.index(t) for t in targets))
+        self._guesses = array("H" if len(dictionary.guesses(BASE_MODE)) <= 0xFFFF else "I")
+        self._codes = [array("H") for _ in targets]
+        self._times = array("I")
+        self._solved_at = array("B", bytes(len(targets)))
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @classmethod
+    def start(cls, dictionary, mode, rng=None, targets=None, max_attempts=None):
+        """New game with distinct random targets from the answers of BASE_MODE."""
+        if targets is None:
+            targets = (rng or random).sample(list(dictionary.targets(BASE_MODE)), BOARD_MODES[mode])
+        return cls(dictionary, mode, targets, max_attempts)
+
+    @property
+    def boards(self):
+        return len(self._targets)
+
+    @property
+    def targets(self):
+        answers = self.dictionary.targets(BASE_MODE)
+        return [answers[t] for t in self._targets]
+
+    @property
+    def length(self):
+        """Letters per word in this game."""
+        return self.dictionary.length(BASE_MODE)
+
+    @property
+    def attempt(self):
+        """Number of the next guess (1-based)."""
+        return len(self._guesses) + 1
+
+    @property
+    def solved(self):
+        """Whether each board is solved."""
+        return [bool(n) for n in self._solved_at]
+
+    @property
+    def won(self):
+        return all(self._solved_at)
+
+    @property
+    def over(self):
+        return self.won or len(self._guesses) >= self.max_attempts
+
+    def history(self, board):
+        """(guess, marks) of every guess ``board`` took, up to the one that solved it."""
+        word, length = self.dictionary.word, self.length
+        return [(word(g, BASE_MODE), decode_pattern(c, length))
+                for g, c in zip(self._guesses, self._codes[board])]
+
+    def packed(self):
+        """(target ids, guess ids, pattern codes per board, ms since the start of each guess).
+
+        Target ids index the answer list of BASE_MODE and guess ids are its
+        Dictionary.word_id() values; a board's codes stop at the guess that
+        solved it.  wordle_core.replay logs games in this form.
+        """
+        return self._targets, self._guesses, self._codes, self._times
+
+    def validate(self, guess):
+        """Normalise ``guess`` or raise InvalidGuess."""
+        guess = guess.strip().lower()
+        length = self.length
+        if len(guess) != length or not guess.isalpha():
+            raise InvalidGuess("length", f"Please enter exactly {length} letters.")
+        if not self.dictionary.is_valid(guess, BASE_MODE):
+            raise InvalidGuess("unknown", "Word not in list.", self.dictionary.suggestions(guess, BASE_MODE))
+        return guess
+
+    def guess(self, word):
+        """Validate a guess and score it against every unsolved board; returns a MultiTurn."""
+        if self.over:
+            raise RuntimeError("the game is over")
+        try:
+            word = self.validate(word)
+        except InvalidGuess as e:
+            counter("guesses_rejected", reason=e.reason).inc()
+            raise
+        _accepted.inc()
+        self._guesses.append(self.dictionary.word_id(word, BASE_MODE))
+        self._times.append(int((time.perf_counter() - self.start_time) * 1000))
+        attempt = len(self._guesses)
+        open_boards = [b for b, n in enumerate(self._solved_at) if not n]
+        answers = self.dictionary.targets(BASE_MODE)
+        scores = score_many(word, [answers[self._targets[b]] for b in open_boards])
+        marks = [None] * self.boards
+        solved = []
+        for b, board_marks in zip(open_boards, scores):
+            code = pattern_code(board_marks)
+            self._codes[b].append(code)
+            marks[b] = board_marks
+            if code == 3 ** self.length - 1:
+                self._solved_at[b] = attempt
+                solved.append(b)
+        if self.over:
+            self.end_time = time.perf_counter()
+        return MultiTurn(word, marks, solved, self.over)
+
+    def elapsed(self):
+        """Seconds since the start, frozen once the game is over."""
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+
+    def result(self):
+        """Final outcome, or None while the game is still running."""
+        if not self.over:
+            return None
+        return {
+            "mode": self.mode,
+            "targets": self.targets,
+            "won": self.won,
+            "tries": len(self._guesses),
+            "solved": sum(1 for n in self._solved_at if n),
+            "seconds": self.elapsed(),
+        }
@@ -0,0 +1,339 @@
+"""Leaderboard (placemate.json) persistence.
+
+placemate.json stays a plain JSON list of records, but new results no
+longer rewrite it.  Each result is appended as one JSON line to
+``placemate.json.journal`` (O(1) per game).  Once the journal grows past
+COMPACT_BYTES it is folded back into placemate.json by a background
+thread: the merged list is written to a temporary file, renamed over the
+snapshot atomically and the journal is emptied.  Appends and compaction
+hold an advisory lock on ``placemate.json.lock`` so several CLI and GUI
+processes can save at the same time without losing records.
+
+Per-player statistics (games played, wins, streaks, guess counts) are
+kept next to the records in ``placemate.stats.json`` under the same lock;
+see wordle_core.stats.
+
+Legacy records without a "mode" are read as Easy records and are written
+back with the mode filled in at the next compaction.
+"""
+import heapq
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from .metrics import timed
+from .ranking import RankIndex
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Journal size that triggers a background compaction
+COMPACT_BYTES = 64 * 1024
+
+# Leaderboard backend: "json" (placemate.json) or "sqlite"
+BACKEND_ENV = "WORDLE_LEADERBOARD"
+
+
+class _FileLock:
+    """Advisory, cross-process lock held on a small side file.
+
+    Threads of one process (e.g. a background compaction) are serialised
+    by an ordinary lock first, since they share the one side file handle.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._f = None
+        self._thread_lock = threading.Lock()
+
+    def __enter__(self):
+        self._thread_lock.acquire()
+        self._f = open(self.path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._f.fileno(), fcntl.LOCK_EX)
+        else:
+            self._f.seek(0)
+            msvcrt.locking(self._f.fileno(), msvcrt.LK_LOCK, 1)
+        return self
+
+    def __exit__(self, *exc):
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._f.fileno(), fcntl.LOCK_UN)
+            else:
+                self._f.seek(0)
+                msvcrt.locking(self._f.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._f.close()
+            self._f = None
+            self._thread_lock.release()
+
+
+def _stat(path):
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def read_journal(path, start=0):
+    """JSON lines of a journal from byte offset ``start``, plus the offset reached."""
+    try:
+        with path.open("rb") as f:
+            f.seek(start)
+            data = f.read()
+    except OSError:
+        return [], 0
+    # Leave a line that is still being written for the next read
+    data = data[:data.rfind(b"\n") + 1]
+    entries = []
+    for line in data.splitlines():
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue  # torn line after a crash
+    return entries, start + len(data)
+
+
+def _normalise(entry):
+    """Copy of a record with the legacy default mode filled in."""
+    if "mode" in entry:
+        return entry
+    entry = dict(entry)
+    entry["mode"] = "Easy"
+    return entry
+
+
+class LeaderboardStore:
+    """Best time per (player, mode), stored as snapshot plus journal."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.journal = self.path.with_name(self.path.name + ".journal")
+        self.lock = _FileLock(self.path.with_name(self.path.name + ".lock"))
+        self._compactor = None
+        # Best times and rank index, caught up incrementally (see _sync)
+        self._best = None
+        self._ranks = None
+        self._snapshot_stat = None
+        self._journal_offset = 0
+        self._stats = None
+
+    @property
+    def stats(self):
+        """The StatsStore kept next to this leaderboard."""
+        if self._stats is None:
+            from .stats import StatsStore
+
+            self._stats = StatsStore(self.path.with_name(self.path.stem + ".stats.json"), self.lock.path)
+        return self._stats
+
+    def record_game(self, name, mode, won, tries):
+        """Count a finished game (won or lost) in the player's stats; returns them."""
+        return self.stats.record(name, mode, won, tries)
+
+    def player_stats(self, name, mode):
+        """The player's PlayerStats in ``mode``, or None before their first game."""
+        return self.stats.get(name, mode)
+
+    def _read_journal(self, start=0):
+        """Journal records from byte offset ``start``, plus the offset reached."""
+        return read_journal(self.journal, start)
+
+    def _read_snapshot(self):
+        if not self.path.exists():
+            return []
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except Exception:
+            return []
+        return data if isinstance(data, list) else []
+
+    @timed("leaderboard_load", backend="json", op="entries")
+    def entries(self):
+        """All records, one per (name, mode) with the best time."""
+        # Journal first: a compaction renames the snapshot before it
+        # empties the journal, so this order never misses a record.
+        journal, _ = self._read_journal()
+        best = {}
+        for entry in self._read_snapshot() + journal:
+            if not isinstance(entry, dict):
+                continue
+            entry = _normalise(entry)
+            key = (entry.get("name"), entry["mode"])
+            current = best.get(key)
+            if current is None or entry.get("time", float("inf")) < current.get("time", float("inf")):
+                best[key] = entry
+        return list(best.values())
+
+    def top(self, mode, n=10):
+        """The ``n`` fastest records of ``mode``, fastest first."""
+        board = (e for e in self.entries() if e["mode"] == mode)
+        return heapq.nsmallest(n, board, key=lambda e: e.get("time", float("inf")))
+
+    def best(self, name, mode):
+        """The player's best time in ``mode``, or None."""
+        self._sync()
+        return self._best.get((name, mode))
+
+    def rank(self, name, mode):
+        """(rank, players) of the player's best time in ``mode``, or None."""
+        self._sync()
+        time = self._best.get((name, mode))
+        if time is None:
+            return None
+        if mode not in self._ranks:
+            # Sorted on first use, so a rebuild never sorts modes nobody asks about
+            self._ranks.load(mode, (t for (_, m), t in self._best.items() if m == mode))
+        return self._ranks.rank(mode, time), self._ranks.total(mode)
+
+    @timed("leaderboard_load", backend="json", op="sync")
+    def _sync(self):
+        """Catch the in-memory best times and rank index up with the files.
+
+        Normally only journal lines appended since the last call are read
+        (by this or any other process).  After a compaction replaced the
+        snapshot the best times are read again once; the rank index of a
+        mode is only sorted again when that mode is next ranked.
+        """
+        snapshot_stat = _stat(self.path)
+        if self._best is not None and snapshot_stat == self._snapshot_stat:
+            new, offset = self._read_journal(self._journal_offset)
+            if offset >= self._journal_offset:
+                self._journal_offset = offset
+                for entry in new:
+                    self._apply(entry)
+                return
+        journal, offset = self._read_journal()
+        best = {}
+        for entry in self._read_snapshot() + journal:
+            if isinstance(entry, dict):
+                entry = _normalise(entry)
+                key = (entry.get("name"), entry["mode"])
+                time = entry.get("time", float("inf"))
+                if time < best.get(key, float("inf")):
+                    best[key] = time
+        self._best = best
+        self._ranks = RankIndex()
+        self._snapshot_stat = snapshot_stat
+        self._journal_offset = offset
+
+    def _apply(self, entry):
+        if not isinstance(entry, dict):
+            return
+        entry = _normalise(entry)
+        key = (entry.get("name"), entry["mode"])
+        time = entry.get("time", float("inf"))
+        old = self._best.get(key)
+        if old is None or time < old:
+            self._best[key] = time
+            if entry["mode"] in self._ranks:
+                self._ranks.update(entry["mode"], time, old)
+
+    @timed("leaderboard_save", backend="json", op="record")
+    def record(self, name, seconds, mode):
+        """Append a finished game; only faster times change the board."""
+        entry = {
+            "name": name,
+            "time": float(seconds),
+            "date": datetime.utcnow().isoformat() + "Z",
+            "mode": mode,
+        }
+        line = json.dumps(entry) + "\n"
+        with self.lock:
+            with self.journal.open("a", encoding="utf-8") as f:
+                f.write(line)
+                size = f.tell()
+        if size >= COMPACT_BYTES:
+            self.compact_in_background()
+        return entry
+
+    @timed("leaderboard_save", backend="json", op="record_many")
+    def record_many(self, results):
+        """Append several (name, seconds, mode) results under one lock."""
+        date = datetime.utcnow().isoformat() + "Z"
+        entries = [
+            {"name": name, "time": float(seconds), "date": date, "mode": mode}
+            for name, seconds, mode in results
+        ]
+        if not entries:
+            return entries
+        data = "".join(json.dumps(entry) + "\n" for entry in entries)
+        with self.lock:
+            with self.journal.open("a", encoding="utf-8") as f:
+                f.write(data)
+                size = f.tell()
+        if size >= COMPACT_BYTES:
+            self.compact_in_background()
+        return entries
+
+    @timed("leaderboard_save", backend="json", op="compact")
+    def compact(self):
+        """Fold the journal into placemate.json with an atomic rename."""
+        with self.lock:
+            entries = self.entries()
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(entries, f, indent=2)
+            os.replace(tmp, self.path)
+            # Truncate rather than delete so concurrent appenders keep a valid file
+            with self.journal.open("w", encoding="utf-8"):
+                pass
+
+    def compact_in_background(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_quietly, name="placemate-compact")
+        self._compactor.start()
+
+    def _compact_quietly(self):
+        try:
+            self.compact()
+        except Exception:
+            print("Warning: could not compact placemate records.")
+
+
+def open_leaderboard(path: Path, backend=None):
+    """Open the configured leaderboard store for placemate.json at ``path``.
+
+    ``backend`` defaults to the WORDLE_LEADERBOARD environment variable.
+    The SQLite database lives next to placemate.json and is filled from it
+    the first time it is created.
+    """
+    if backend is None:
+        backend = os.environ.get(BACKEND_ENV, "json")
+    if backend.lower() != "sqlite":
+        return LeaderboardStore(path)
+
+    from .leaderboard_db import SQLiteLeaderboard
+
+    path = Path(path)
+    db_path = path.with_suffix(".sqlite3")
+    is_new = not db_path.exists()
+    store = SQLiteLeaderboard(db_path)
+    if is_new:
+        store.import_placemate(path)
+    return store
+
+
+def load_placemate(path: Path):
+    """Load the leaderboard from placemate.json and its journal.
+
+    Returns a list of dicts, every one with a "mode".
+    """
+    return LeaderboardStore(path).entries()
+
+
+def save_placemate(path: Path, name: str, seconds: float, mode: str):
+    """Save or update a player's best time in the leaderboard for a specific mode."""
+    try:
+        LeaderboardStore(path).record(name, seconds, mode)
+    except Exception:
+        print("Warning: could not save placemate record.")
@@ -0,0 +1,50 @@
+"""Rank and percentile queries over the leaderboard.
+
+RankIndex keeps the best time of every player as one sorted list per
+mode, sorted once when the mode is first ranked.  A player's rank is a
+binary search (bisect) in that list, and a new personal best moves a
+single value, so later queries never sort the board again.
+"""
+import bisect
+
+
+class RankIndex:
+    """Sorted best times per mode."""
+
+    def __init__(self):
+        self._times = {}
+
+    def __contains__(self, mode):
+        return mode in self._times
+
+    def load(self, mode, times):
+        """Set the best times of ``mode`` (any order), replacing what it held."""
+        self._times[mode] = sorted(times)
+
+    def update(self, mode, time, old_time=None):
+        """Insert a best time, replacing the player's previous one."""
+        times = self._times.setdefault(mode, [])
+        if old_time is not None:
+            i = bisect.bisect_left(times, old_time)
+            if i < len(times) and times[i] == old_time:
+                del times[i]
+        bisect.insort(times, time)
+
+    def total(self, mode):
+        return len(self._times.get(mode, ()))
+
+    def rank(self, mode, time):
+        """1-based rank of ``time`` in ``mode`` (ties share the best rank)."""
+        return bisect.bisect_left(self._times.get(mode, []), time) + 1
+
+
+def format_rank(rank, total):
+    """Rank as shown to players, e.g. "#1,204 of 380,000 (top 0.3%)"."""
+    percent = 100.0 * rank / total
+    if percent < 0.1:
+        shown = "<0.1"
+    elif percent < 10:
+        shown = f"{percent:.1f}"
+    else:
+        shown = f"{percent:.0f}"
+    return f"#{rank:,} of {total:,} (top {shown}%)"
@@ -0,0 +1,326 @@
+"""Binary game-replay log and streaming analytics.
+
+Every finished game (won or lost) is appended to ``replays.wrl`` as one
+packed record, so the log keeps each guess, not just the winning times
+that go to placemate.json.  After a 4-byte MAGIC the file is a sequence
+of records:
+
+    GAME header   record size, mode name length, flags (bit 0 = won,
+                  bit 1 = multi-board), attempt limit, tries, target id
+                  (number of boards n for multi-board games), start (Unix ms)
+    mode name     UTF-8
+    TURN * tries  guess id, pattern code, ms since the start
+
+Multi-board games (Dordle, Quordle, Octordle) carry n target ids after
+the mode name, then per turn a MULTI_TURN (guess id, ms since the start)
+followed by n pattern codes, NO_CODE for boards solved earlier; their
+ids refer to the lists of multiboard.BASE_MODE.
+
+The target id indexes the mode's answer list and guess ids are
+Dictionary.word_id() values, so a log is read back with the same word
+lists it was written with.  A 4-guess Medium game takes 64 bytes.
+Records are appended with one write each under the log's own file lock
+(``replays.wrl.lock``); a record torn by a crash is ignored by the reader.
+
+iter_games() streams records from disk in chunks and analyze() folds
+them into counters whose size depends on the word lists, never on the
+number of games, so millions of games are summarised in constant memory:
+
+    python -m wordle_core.replay --top 10
+"""
+import argparse
+import heapq
+import struct
+import time
+from bisect import bisect_left
+from collections import Counter, namedtuple
+from pathlib import Path
+
+from .multiboard import BASE_MODE, BOARD_MODES
+from .placemate import _FileLock
+from .words import DATA_DIR, MODES, Dictionary, WordListError
+
+REPLAY_FILE = DATA_DIR / "replays.wrl"
+
+MAGIC = b"WRL1"
+# size, mode length, flags, max attempts, tries, target id, start (Unix ms)
+GAME = struct.Struct("<HBBBBIQ")
+# guess id, pattern code, ms since the start of the game
+TURN = struct.Struct("<IHI")
+# guess id, ms since the start; followed by one pattern code per board
+MULTI_TURN = struct.Struct("<II")
+# Pattern code of a board that an earlier guess solved
+NO_CODE = 0xFFFF
+WON = 0x01
+MULTI = 0x02
+# Bytes read from the log at a time
+CHUNK = 1 << 20
+
+# Upper bounds (seconds) of the time-per-guess buckets
+GUESS_BUCKETS = (1, 2, 5, 10, 15, 30, 60, 120, 300)
+
+# One logged game; guesses, codes and times are tuples of equal length.
+# In a multi-board game target is a tuple of target ids and every code a
+# tuple with one code per board.
+GameRecord = namedtuple("GameRecord", "mode target won max_attempts started guesses codes times")
+
+
+class ReplayLogError(Exception):
+    """Raised when a file is not a replay log."""
+
+
+def encode(session, started=None):
+    """Packed record of a finished GameSession or MultiBoardSession.
+
+    ``started`` is the Unix time the game began (by default now minus
+    the game's elapsed time).
+    """
+    target, guesses, codes, times = session.packed()
+    if started is None:
+        started = time.time() - session.elapsed()
+    mode = session.mode.encode("utf-8")
+    flags = WON if session.won else 0
+    if session.mode in BOARD_MODES:
+        flags |= MULTI
+        boards = struct.Struct(f"<{len(target)}H")
+        body = struct.pack(f"<{len(target)}I", *target) + b"".join(
+            MULTI_TURN.pack(g, t) + boards.pack(*(c[i] if i < len(c) else NO_CODE for c in codes))
+            for i, (g, t) in enumerate(zip(guesses, times))
+        )
+        target = len(target)
+    else:
+        body = b"".join(TURN.pack(g, c, t) for g, c, t in zip(guesses, codes, times))
+    size = GAME.size + len(mode) + len(body)
+    header = GAME.pack(size, len(mode), flags, session.max_attempts,
+                       len(guesses), target, int(started * 1000))
+    return header + mode + body
+
+
+def _decode(buf, pos):
+    size, mode_len, flags, max_attempts, tries, target, started = GAME.unpack_from(buf, pos)
+    start = pos + GAME.size
+    mode = bytes(buf[start:start + mode_len]).decode("utf-8")
+    start += mode_len
+    if flags & MULTI:
+        boards = target
+        target = struct.unpack_from(f"<{boards}I", buf, start)
+        start += 4 * boards
+        step = MULTI_TURN.size + 2 * boards
+        turns = [
+            MULTI_TURN.unpack_from(buf, p) + (struct.unpack_from(f"<{boards}H", buf, p + MULTI_TURN.size),)
+            for p in range(start, pos + size, step)
+        ]
+        guesses, times, codes = zip(*turns) if turns else ((), (), ())
+    else:
+        turns = list(TURN.iter_unpack(buf[start:pos + size]))
+        guesses, codes, times = zip(*turns) if turns else ((), (), ())
+    return GameRecord(mode, target, bool(flags & WON), max_attempts, started / 1000.0,
+                      guesses, codes, times)
+
+
+class ReplayLog:
+    """Append-only replay log at ``path``."""
+
+    def __init__(self, path=REPLAY_FILE):
+        self.path = Path(path)
+        self.lock = _FileLock(self.path.with_name(self.path.name + ".lock"))
+
+    def append(self, session):
+        """Log one finished game."""
+        self.write([encode(session)])
+
+    def append_many(self, sessions):
+        """Log several finished games with one write."""
+        self.write([encode(session) for session in sessions])
+
+    def write(self, records):
+        """Append already encoded records."""
+        if not records:
+            return
+        data = b"".join(records)
+        with self.lock:
+            with self.path.open("ab") as f:
+                if f.tell() == 0:
+                    data = MAGIC + data
+                f.write(data)
+
+    def __iter__(self):
+        return iter_games(self.path)
+
+
+def iter_games(path=REPLAY_FILE, chunk=CHUNK):
+    """Yield every GameRecord in the log, reading ``chunk`` bytes at a time."""
+    try:
+        f = Path(path).open("rb")
+    except FileNotFoundError:
+        return
+    with f:
+        magic = f.read(len(MAGIC))
+        if not magic:
+            return
+        if magic != MAGIC:
+            raise ReplayLogError(f"{path} is not a replay log")
+        buf = b""
+        while True:
+            data = f.read(chunk)
+            if not data:
+                break  # anything left over is a torn record
+            buf += data
+            pos, end = 0, len(buf)
+            view = memoryview(buf)
+            while pos + GAME.size <= end:
+                size = GAME.unpack_from(view, pos)[0]
+                if size < GAME.size:
+                    raise ReplayLogError(f"corrupt record in {path}")
+                if pos + size > end:
+                    break
+                yield _decode(view, pos)
+                pos += size
+            view.release()
+            buf = buf[pos:]
+
+
+def save_replay(path, session):
+    """Log a finished game; a failure only prints a warning."""
+    try:
+        ReplayLog(path).append(session)
+    except Exception:
+        print("Warning: could not save the game replay.")
+
+
+def analyze(games, top=10, min_games=1):
+    """Fold GameRecords into a report dict in one pass.
+
+    The report has, per mode, the games, wins and average tries of won
+    games; the ``top`` hardest targets (highest failure rate, then most
+    tries, among targets played at least ``min_games`` times; a failed
+    game counts as attempt limit + 1 tries; single-board games only);
+    the ``top`` most common first guesses; and a histogram of the
+    seconds between guesses (GUESS_BUCKETS, last bucket unbounded).
+    """
+    modes = {}
+    # (mode, target id) -> [games, failures, tries]
+    targets = {}
+    openers = Counter()
+    buckets = [0] * (len(GUESS_BUCKETS) + 1)
+    guess_seconds = 0.0
+    for game in games:
+        mode = modes.get(game.mode)
+        if mode is None:
+            mode = modes[game.mode] = {"games": 0, "wins": 0, "win_tries": 0}
+        tries = len(game.codes)
+        mode["games"] += 1
+        if game.won:
+            mode["wins"] += 1
+            mode["win_tries"] += tries
+        else:
+            tries = game.max_attempts + 1
+        if isinstance(game.target, int):
+            stats = targets.get((game.mode, game.target))
+            if stats is None:
+                stats = targets[(game.mode, game.target)] = [0, 0, 0]
+            stats[0] += 1
+            stats[1] += not game.won
+            stats[2] += tries
+        if game.guesses:
+            openers[(game.mode, game.guesses[0])] += 1
+        last = 0
+        for ms in game.times:
+            seconds = (ms - last) / 1000.0
+            last = ms
+            guess_seconds += seconds
+            buckets[bisect_left(GUESS_BUCKETS, seconds)] += 1
+
+    hardest = heapq.nlargest(top, (
+        (stats[1] / stats[0], stats[2] / stats[0], stats[0], mode, target)
+        for (mode, target), stats in targets.items() if stats[0] >= min_games
+    ))
+    guesses = sum(buckets)
+    return {
+        "games": sum(m["games"] for m in modes.values()),
+        "modes": {
+            name: {
+                "games": m["games"],
+                "wins": m["wins"],
+                "average_tries": m["win_tries"] / m["wins"] if m["wins"] else None,
+            }
+            for name, m in sorted(modes.items())
+        },
+        "hardest": [
+            {"mode": mode, "target": target, "games": games, "failure_rate": failures, "average_tries": tries}
+            for failures, tries, games, mode, target in hardest
+        ],
+        "openers": [{"mode": mode, "guess": guess, "games": n} for (mode, guess), n in openers.most_common(top)],
+        "guess_time": {
+            "guesses": guesses,
+            "mean": guess_seconds / guesses if guesses else None,
+            "buckets": buckets,
+        },
+    }
+
+
+def _word(dictionary, mode, word_id, answer=False):
+    """Guess (or answer) for an id in a report, or "#id" when the word lists changed."""
+    if mode in BOARD_MODES:
+        mode = BASE_MODE
+    try:
+        if answer:
+            return dictionary.targets(mode)[word_id].upper()
+        return dictionary.word(word_id, mode).upper()
+    except (KeyError, IndexError):
+        return f"#{word_id}"
+
+
+def print_report(report, dictionary):
+    print(f"{report['games']} logged games")
+    for name, m in report["modes"].items():
+        average = f"{m['average_tries']:.2f}" if m["average_tries"] is not None else "-"
+        print(f"  {name:8s} {m['games']:9d} games  won {100.0 * m['wins'] / m['games']:5.1f}%  "
+              f"average tries {average}")
+
+    if report["hardest"]:
+        print("\nHardest targets:")
+        for h in report["hardest"]:
+            word = _word(dictionary, h["mode"], h["target"], answer=True)
+            print(f"  {word:10s} {h['mode']:8s} failed {100.0 * h['failure_rate']:5.1f}%  "
+                  f"average tries {h['average_tries']:.2f}  ({h['games']} games)")
+
+    if report["openers"]:
+        print("\nMost common openers:")
+        for o in report["openers"]:
+            print(f"  {_word(dictionary, o['mode'], o['guess']):10s} {o['mode']:8s} {o['games']:9d} games")
+
+    timing = report["guess_time"]
+    if timing["guesses"]:
+        print(f"\nTime per guess (mean {timing['mean']:.1f}s over {timing['guesses']} guesses):")
+        labels = [f"<= {b}s" for b in GUESS_BUCKETS] + [f" > {GUESS_BUCKETS[-1]}s"]
+        for label, n in zip(labels, timing["buckets"]):
+            bar = "#" * round(40 * n / timing["guesses"])
+            print(f"  {label:>7}: {n:9d} {bar}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Summarise the game replay log.")
+    parser.add_argument("--log", default=str(REPLAY_FILE), help="replay log to read")
+    parser.add_argument("--top", type=int, default=10, help="targets and openers to list")
+    parser.add_argument("--min-games", type=int, default=1,
+                        help="games a target needs to be listed as hard")
+    parser.add_argument("--mode", choices=sorted(MODES) + sorted(BOARD_MODES), action="append",
+                        help="only count games of this mode (repeatable)")
+    args = parser.parse_args(argv)
+    try:
+        dictionary = Dictionary.load()
+    except WordListError as e:
+        parser.exit(1, f"{e}\n")
+    games = iter_games(args.log)
+    if args.mode:
+        games = (g for g in games if g.mode in args.mode)
+    try:
+        report = analyze(games, args.top, args.min_games)
+    except ReplayLogError as e:
+        parser.exit(1, f"{e}\n")
+    print_report(report, dictionary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""Per-player target rotation: no repeated word until the list is used up.
+
+Every (player, mode) walks its own shuffled order of the mode's answer
+list.  The order is never stored: position i maps to answer
+``permute(i)``, a keyed pseudo-random permutation of 0..n-1 (a small
+Feistel network, cycle-walked into range), so the next target is found
+in O(1) from a seed and a cursor.  Which answers the player has already
+had is kept as a bitset of n bits, so a Medium or Hard rotation takes
+about 700 bytes and an Easy one 8.  Once every word has been played the
+bitset is cleared and a new order is drawn.
+
+Bit i stands for answer i, so the state also records a digest of the
+answer list it indexes.  When the list changes (words added, removed or
+replaced, even at the same length) the seen bits are remapped word by
+word onto the new list, which the store looks up by the old digest in a
+``lists`` table holding each answer list once, and the walk restarts
+with a new order that skips the words already seen.
+
+States are stored as one BLOB per (name, mode) in an SQLite database
+(``rotation.sqlite3`` next to placemate.json), so drawing a target reads
+and rewrites a single row through the primary key, however many players
+there are.
+"""
+import hashlib
+import random
+import sqlite3
+import struct
+from contextlib import closing
+from pathlib import Path
+
+from .metrics import timed
+
+# answers in the list, permutation seed, cursor, answer list digest; followed by the bitset
+STATE = struct.Struct("<III8s")
+# Feistel rounds of the permutation, and the salt of each round's hash
+ROUNDS = 4
+_SALTS = [bytes([r]) * 16 for r in range(ROUNDS)]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rotation (
+    name TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    state BLOB NOT NULL,
+    PRIMARY KEY (name, mode)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS lists (
+    digest BLOB PRIMARY KEY,
+    words TEXT NOT NULL
+) WITHOUT ROWID;
+"""
+
+
+def list_digest(words):
+    """8-byte digest of an answer list, in order."""
+    return hashlib.blake2b("\n".join(words).encode("utf-8"), digest_size=8).digest()
+
+
+def permute(i, n, seed):
+    """Position ``i`` of the seed's shuffled order of 0..n-1."""
+    half = max(1, ((n - 1).bit_length() + 1) // 2)
+    mask = (1 << half) - 1
+    key = seed.to_bytes(4, "little")
+    while True:
+        left, right = i >> half, i & mask
+        for salt in _SALTS:
+            h = hashlib.blake2b(right.to_bytes(4, "little"), digest_size=4, key=key, salt=salt)
+            left, right = right, left ^ (int.from_bytes(h.digest(), "little") & mask)
+        i = (left << half) | right
+        # The network permutes 0..4^half-1 (under 4n); walk until back in range
+        if i < n:
+            return i
+
+
+class Rotation:
+    """One player's rotation through an answer list of ``n`` words."""
+
+    __slots__ = ("n", "seed", "cursor", "seen", "digest")
+
+    def __init__(self, n, seed=None, cursor=0, seen=None, digest=bytes(8)):
+        self.n = n
+        self.seed = random.getrandbits(32) if seed is None else seed
+        self.cursor = cursor
+        self.seen = bytearray((n + 7) // 8) if seen is None else seen
+        self.digest = digest
+
+    @classmethod
+    def from_bytes(cls, data):
+        """Rotation stored by to_bytes(), or None for a state of another layout."""
+        if len(data) < STATE.size:
+            return None
+        n, seed, cursor, digest = STATE.unpack_from(data)
+        seen = bytearray(data[STATE.size:])
+        if len(seen) != (n + 7) // 8:
+            return None
+        return cls(n, seed, cursor, seen, digest)
+
+    def to_bytes(self):
+        return STATE.pack(self.n, self.seed, self.cursor, self.digest) + bytes(self.seen)
+
+    def carried_over(self, old_words, words, digest):
+        """New rotation over ``words`` keeping the words seen in ``old_words``.
+
+        ``old_words`` is the list this rotation indexes (None if it is not
+        known, which carries nothing over); the new rotation walks a fresh
+        order.
+        """
+        rotation = Rotation(len(words), digest=digest)
+        if old_words is not None and len(old_words) == self.n:
+            ids = {w: i for i, w in enumerate(words)}
+            seen = rotation.seen
+            for i, word in enumerate(old_words):
+                j = ids.get(word)
+                if j is not None and self.seen[i >> 3] & (1 << (i & 7)):
+                    seen[j >> 3] |= 1 << (j & 7)
+        return rotation
+
+    def _new_round(self):
+        self.seed = random.getrandbits(32)
+        self.cursor = 0
+        self.seen = bytearray(len(self.seen))
+
+    def next(self):
+        """Answer index of the next unseen target, marked as seen."""
+        seen = self.seen
+        for _ in range(2):
+            while self.cursor < self.n:
+                target = permute(self.cursor, self.n, self.seed)
+                self.cursor += 1
+                if not seen[target >> 3] & (1 << (target & 7)):
+                    seen[target >> 3] |= 1 << (target & 7)
+                    return target
+            # Every word played (or skipped as seen): start over
+            self._new_round()
+            seen = self.seen
+        raise ValueError("empty answer list")
+
+    def take(self, k):
+        """``k`` different answer indices (k <= n)."""
+        if k > self.n:
+            raise ValueError(f"{k} targets asked from a list of {self.n}")
+        targets = []
+        for _ in range(k):
+            cursor = self.cursor
+            target = self.next()
+            if self.cursor <= cursor:
+                # A new round began: this game's earlier targets stay seen in it
+                for t in targets:
+                    self.seen[t >> 3] |= 1 << (t & 7)
+                while target in targets:
+                    target = self.next()
+            targets.append(target)
+        return targets
+
+
+class RotationStore:
+    """Rotations per (player, mode) in an SQLite database."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._created = False
+
+    def _connect(self):
+        db = sqlite3.connect(self.path, timeout=30)
+        if not self._created:
+            # On first use, so opening the store never fails
+            db.executescript(SCHEMA)
+            self._created = True
+        return closing(db)
+
+    @timed("rotation")
+    def draw(self, name, mode, words, k=1):
+        """The player's next ``k`` different targets of ``mode`` from ``words``."""
+        with self._connect() as db, db:
+            # BEGIN IMMEDIATE: two games of one player never draw the same word
+            db.execute("BEGIN IMMEDIATE")
+            row = db.execute("SELECT state FROM rotation WHERE name = ? AND mode = ?", (name, mode)).fetchone()
+            rotation = Rotation.from_bytes(row[0]) if row else None
+            digest = list_digest(words)
+            if rotation is None or rotation.digest != digest:
+                if rotation is None:
+                    rotation = Rotation(len(words), digest=digest)
+                else:
+                    old = db.execute("SELECT words FROM lists WHERE digest = ?", (rotation.digest,)).fetchone()
+                    rotation = rotation.carried_over(old[0].split("\n") if old else None, words, digest)
+                # Keep this list so a later change can be remapped from it
+                db.execute("INSERT OR IGNORE INTO lists (digest, words) VALUES (?, ?)",
+                           (digest, "\n".join(words)))
+            targets = rotation.take(k)
+            db.execute("INSERT OR REPLACE INTO rotation (name, mode, state) VALUES (?, ?, ?)",
+                       (name, mode, rotation.to_bytes()))
+        return [words[t] for t in targets]
+
+
+def next_targets(store, name, mode, words, k=1):
+    """store.draw(), or None (a random pick) if the rotation can't be read or saved."""
+    try:
+        return store.draw(name, mode, words, k)
+    except (sqlite3.Error, OSError, ValueError, struct.error):
+        print("Warning: could not use the target rotation; picking a random word.")
+        return None
@@ -0,0 +1,255 @@
+"""Asyncio game server.
+
+Hosts any number of independent GameSessions over TCP.  The protocol is
+newline-delimited JSON: every request is one object with an "op" and an
+optional "id" that is echoed in the reply, so a client can keep many
+requests in flight on one connection.
+
+    {"id": 1, "op": "new", "mode": "Medium", "name": "alice"}
+    -> {"id": 1, "ok": true, "session": 7, "mode": "Medium", "length": 5, "max_attempts": 4}
+    {"id": 2, "op": "guess", "session": 7, "word": "crane"}
+    -> {"id": 2, "ok": true, "word": "crane", "marks": [0, 2, 0, 1, 0],
+        "tries": 1, "solved": false, "over": false}
+    {"id": 3, "op": "state", "session": 7}
+    {"id": 4, "op": "end", "session": 7}
+    {"id": 5, "op": "top", "mode": "Medium"}
+
+Marks are the same ABSENT/PRESENT/CORRECT values the CLI colours.  When a
+game is over the reply also carries "target" and "seconds".  Errors come
+back as {"ok": false, "error": <reason>, "message": <text>}, where reason
+is one of InvalidGuess's reasons or "request"; an "unknown" word also
+gets "suggestions", the nearest valid words.
+
+The word lists are loaded once and shared by every session.  Wins of
+named players are queued and written to the leaderboard in batches from
+a worker thread, and so are finished games to the replay log (when one
+is given), so disk I/O never blocks the event loop.  Sessions live
+as long as the connection that created them.
+
+Run ``python -m wordle_core.server`` and drive it with
+``python -m wordle_core.loadgen``.
+"""
+import argparse
+import asyncio
+import itertools
+import json
+import signal
+import sys
+
+from .placemate import open_leaderboard
+from .replay import ReplayLog
+from .session import GameSession, InvalidGuess
+from .words import DATA_DIR, MODES, Dictionary
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+# Seconds between leaderboard writes
+BATCH_INTERVAL = 0.5
+# Longest request line accepted
+MAX_LINE = 64 * 1024
+
+
+class RequestError(Exception):
+    """A malformed request; reported to the client, never fatal."""
+
+
+class ResultBatcher:
+    """Collects won games and writes them with board.record_many().
+
+    Finished games for the replay log (``replays``, a ReplayLog or None)
+    are collected and written the same way.
+    """
+
+    def __init__(self, board, interval=BATCH_INTERVAL, replays=None):
+        self.board = board
+        self.interval = interval
+        self.replays = replays
+        self.pending = []
+        self.pending_games = []
+        self.written = 0
+
+    def post(self, name, seconds, mode):
+        self.pending.append((name, seconds, mode))
+
+    def post_game(self, session):
+        if self.replays is not None:
+            self.pending_games.append(session)
+
+    async def flush(self):
+        loop = asyncio.get_running_loop()
+        if self.pending_games:
+            games, self.pending_games = self.pending_games, []
+            await loop.run_in_executor(None, self.replays.append_many, games)
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+        await loop.run_in_executor(None, self.board.record_many, batch)
+        self.written += len(batch)
+
+    async def run(self):
+        """Flush every ``interval`` seconds until cancelled, then once more."""
+        try:
+            while True:
+                await asyncio.sleep(self.interval)
+                await self.flush()
+        finally:
+            await asyncio.shield(self.flush())
+
+
+class GameServer:
+    """Session bookkeeping and request dispatch for all connections."""
+
+    def __init__(self, dictionary, board, batch_interval=BATCH_INTERVAL, replays=None):
+        self.dictionary = dictionary
+        self.board = board
+        self.batcher = ResultBatcher(board, batch_interval, replays)
+        self._ids = itertools.count(1)
+        self.sessions = {}  # id -> (session, player name)
+        self.guesses = 0
+
+    # -- requests --------------------------------------------------------
+
+    def op_new(self, request, owned):
+        mode = request.get("mode", "Easy")
+        if mode not in MODES:
+            raise RequestError(f"Unknown mode {mode!r}.")
+        session = GameSession.start(self.dictionary, mode)
+        sid = next(self._ids)
+        self.sessions[sid] = (session, request.get("name"))
+        owned.add(sid)
+        return {"session": sid, "mode": mode, "length": session.length, "max_attempts": session.max_attempts}
+
+    def op_guess(self, request, owned):
+        session, name = self._session(request, owned)
+        if session.over:
+            raise RequestError("The game is over.")
+        turn = session.guess(str(request.get("word", "")))
+        self.guesses += 1
+        reply = {
+            "word": turn.guess,
+            "marks": list(turn.marks),
+            "tries": len(session.history),
+            "solved": turn.solved,
+            "over": turn.over,
+        }
+        if turn.over:
+            reply["target"] = session.target
+            reply["seconds"] = session.elapsed()
+            self.batcher.post_game(session)
+            if turn.solved and name:
+                self.batcher.post(name, reply["seconds"], session.mode)
+        return reply
+
+    def op_state(self, request, owned):
+        session, _ = self._session(request, owned)
+        return session.state()
+
+    def op_end(self, request, owned):
+        sid = request.get("session")
+        self._session(request, owned)
+        owned.discard(sid)
+        del self.sessions[sid]
+        return {}
+
+    async def op_top(self, request, owned):
+        mode = request.get("mode", "Easy")
+        loop = asyncio.get_running_loop()
+        entries = await loop.run_in_executor(None, self.board.top, mode, int(request.get("n", 10)))
+        return {"mode": mode, "entries": entries}
+
+    def _session(self, request, owned):
+        sid = request.get("session")
+        if sid not in owned:
+            raise RequestError("Unknown session.")
+        return self.sessions[sid]
+
+    async def dispatch(self, request, owned):
+        if not isinstance(request, dict):
+            raise RequestError("Requests must be JSON objects.")
+        handler = getattr(self, f"op_{request.get('op')}", None)
+        if handler is None:
+            raise RequestError(f"Unknown op {request.get('op')!r}.")
+        reply = handler(request, owned)
+        if asyncio.iscoroutine(reply):
+            reply = await reply
+        return reply
+
+    # -- connections -----------------------------------------------------
+
+    async def handle(self, reader, writer):
+        owned = set()
+        pending = b""
+        try:
+            while True:
+                # Answer every complete line of a chunk with one write, so
+                # pipelined requests don't cost a send() each
+                data = await reader.read(MAX_LINE)
+                if not data:
+                    break
+                *lines, pending = (pending + data).split(b"\n")
+                if len(pending) > MAX_LINE:
+                    break
+                replies = [await self._answer(line, owned) for line in lines if line.strip()]
+                if replies:
+                    writer.write(b"".join(json.dumps(r).encode() + b"\n" for r in replies))
+                    await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for sid in owned:
+                self.sessions.pop(sid, None)
+            writer.close()
+
+    async def _answer(self, line, owned):
+        request = None
+        try:
+            request = json.loads(line)
+            reply = await self.dispatch(request, owned)
+            reply["ok"] = True
+        except InvalidGuess as e:
+            reply = {"ok": False, "error": e.reason, "message": str(e)}
+            if e.suggestions:
+                reply["suggestions"] = e.suggestions
+        except (RequestError, ValueError, TypeError) as e:
+            reply = {"ok": False, "error": "request", "message": str(e)}
+        if isinstance(request, dict) and "id" in request:
+            reply["id"] = request["id"]
+        return reply
+
+    async def serve(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        server = await asyncio.start_server(self.handle, host, port)
+        flusher = asyncio.create_task(self.batcher.run())
+        if hasattr(signal, "SIGTERM") and sys.platform != "win32":
+            # Stop like on Ctrl+C so pending results are still written
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, asyncio.current_task().cancel)
+        try:
+            async with server:
+                print(f"Serving Wordle on {host}:{port}", flush=True)
+                await server.serve_forever()
+        finally:
+            flusher.cancel()
+            await asyncio.gather(flusher, return_exceptions=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the Wordle game server.")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--leaderboard", default=str(DATA_DIR / "placemate.json"),
+                        help="placemate.json to post wins to")
+    parser.add_argument("--batch-interval", type=float, default=BATCH_INTERVAL,
+                        help="seconds between leaderboard writes")
+    parser.add_argument("--replays", default=None,
+                        help="replay log to append finished games to (default: none)")
+    args = parser.parse_args(argv)
+
+    replays = ReplayLog(args.replays) if args.replays else None
+    server = GameServer(Dictionary.load(), open_leaderboard(args.leaderboard), args.batch_interval, replays)
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except (KeyboardInterrupt, asyncio.CancelledError):
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Headless game engine.
+
+GameSession holds one game: the target, the guesses so far and the
+attempt limit of its mode.  It validates and scores guesses but never
+prints or reads input, so the CLI, the GUI, the simulator and any other
+caller drive the same rules.
+"""
+import random
+import time
+from array import array
+from collections import namedtuple
+
+from .feedback import CORRECT, decode_pattern, pattern_code, score_guess
+from .hardmode import HardModeRules
+from .metrics import counter, timed
+from .words import HARD_MODE
+
+# Accepted guesses (rejections are counted per InvalidGuess reason)
+_accepted = counter("guesses_accepted")
+
+# Outcome of one accepted guess
+Turn = namedtuple("Turn", "guess marks solved over")
+
+
+class InvalidGuess(ValueError):
+    """A rejected guess.
+
+    ``reason`` is "length", "unknown" or "hard"; str() is a message that
+    can be shown to the player as is.  Unknown words carry the nearest
+    valid guesses in ``suggestions`` (possibly none).
+    """
+
+    def __init__(self, reason, message, suggestions=()):
+        super().__init__(message)
+        self.reason = reason
+        self.suggestions = list(suggestions)
+
+
+class GameSession:
+    """One game of ``mode`` against a fixed target word.
+
+    The state is kept compact so one process can hold hundreds of
+    thousands of games: the target is its index in the mode's answer
+    list, every guess is a word id (Dictionary.word_id) in an
+    array('H') (array('I') past 65535 guesses), its feedback a pattern_code in another array('H') (up to
+    3**8 patterns for 8-letter modes), and the keyboard is a
+    bytearray(26) holding 1 + the best mark seen for each letter a-z (0 =
+    not guessed yet), and the time of every guess is kept in
+    milliseconds since the start in an array('I').  The (guess, marks)
+    history is rebuilt from those on demand; Hard games also keep a
+    HardModeRules, a bytearray of the revealed constraints updated after
+    each guess.  A game in progress costs about 500 bytes
+    (``python -m benchmarks.run --only session`` measures it).
+    """
+
+    __slots__ = ("dictionary", "mode", "max_attempts", "start_time", "end_time",
+                 "_target", "_guesses", "_codes", "_times", "_keys", "_rules")
+
+    def __init__(self, dictionary, mode, target, max_attempts=None):
+        self.dictionary = dictionary
+        self.mode = mode
+        self.max_attempts = max_attempts or dictionary.max_attempts(mode)
+        self._target = dictionary.targets(mode).index(target)
+        # Guess ids fit in 16 bits unless the guess list is very large
+        self._guesses = array("H" if len(dictionary.guesses(mode)) <= 0xFFFF else "I")
+        self._codes = array("H")
+        self._times = array("I")
+        self._keys = bytearray(26)
+        self._rules = HardModeRules() if mode == HARD_MODE else None
+        self.start_time = time.perf_counter()
+        self.end_time = None
+
+    @classmethod
+    def start(cls, dictionary, mode, rng=None, target=None, max_attempts=None):
+        """New game with a random target from the answers of ``mode``."""
+        if target is None:
+            target = (rng or random).choice(dictionary.targets(mode))
+        return cls(dictionary, mode, target, max_attempts)
+
+    @property
+    def target(self):
+        return self.dictionary.targets(self.mode)[self._target]
+
+    @property
+    def length(self):
+        """Letters per word in this game."""
+        return self.dictionary.length(self.mode)
+
+    @property
+    def history(self):
+        """(guess, marks) of every accepted guess."""
+        word, mode, length = self.dictionary.word, self.mode, self.length
+        return [(word(g, mode), decode_pattern(c, length)) for g, c in zip(self._guesses, self._codes)]
+
+    def packed(self):
+        """(target id, guess ids, pattern codes, ms since the start of each guess).
+
+        The target id indexes the mode's answer list and the guess ids are
+        Dictionary.word_id() values; wordle_core.replay logs games in this form.
+        """
+        return self._target, self._guesses, self._codes, self._times
+
+    @property
+    def rules(self):
+        """HardModeRules for the guesses so far, or None outside Hard mode."""
+        return self._rules
+
+    @property
+    def attempt(self):
+        """Number of the next guess (1-based)."""
+        return len(self._codes) + 1
+
+    @property
+    def won(self):
+        # All greens: 2 * (1 + 3 + 9 + ...) == 3**length - 1
+        return bool(self._codes) and self._codes[-1] == 3 ** self.length - 1
+
+    @property
+    def over(self):
+        return self.won or len(self._codes) >= self.max_attempts
+
+    def letter_mark(self, letter):
+        """Best mark ``letter`` got so far, or None if it was not guessed."""
+        letter = letter.lower()
+        i = ord(letter) - 97
+        if 0 <= i < 26:
+            state = self._keys[i]
+            return state - 1 if state else None
+        # Letters outside a-z are looked up in the history
+        marks = [m for guess, ms in self.history for ch, m in zip(guess, ms) if ch == letter]
+        return max(marks) if marks else None
+
+    @timed("validate_guess")
+    def validate(self, guess):
+        """Normalise ``guess`` or raise InvalidGuess."""
+        guess = guess.strip().lower()
+        length = self.length
+        if len(guess) != length or not guess.isalpha():
+            raise InvalidGuess("length", f"Please enter exactly {length} letters.")
+        if not self.dictionary.is_valid(guess, self.mode):
+            raise InvalidGuess("unknown", "Word not in list.", self.dictionary.suggestions(guess, self.mode))
+        if self._rules is not None:
+            reason = self._rules.check(guess)
+            if reason:
+                raise InvalidGuess("hard", f"Hard mode: {reason}.")
+        return guess
+
+    def guess(self, word):
+        """Validate, score and record a guess; returns a Turn."""
+        if self.over:
+            raise RuntimeError("the game is over")
+        try:
+            word = self.validate(word)
+        except InvalidGuess as e:
+            counter("guesses_rejected", reason=e.reason).inc()
+            raise
+        _accepted.inc()
+        marks = score_guess(word, self.target)
+        code = pattern_code(marks)
+        now = time.perf_counter()
+        self._guesses.append(self.dictionary.word_id(word, self.mode))
+        self._codes.append(code)
+        self._times.append(int((now - self.start_time) * 1000))
+        keys = self._keys
+        for ch, mark in zip(word, marks):
+            i = ord(ch) - 97
+            if 0 <= i < 26 and keys[i] <= mark:
+                keys[i] = mark + 1
+        if self._rules is not None:
+            self._rules.update(word, marks)
+        solved = all(m == CORRECT for m in marks)
+        if solved or len(self._codes) >= self.max_attempts:
+            self.end_time = now
+        return Turn(word, marks, solved, self.over)
+
+    def elapsed(self):
+        """Seconds since the start, frozen once the game is over."""
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+
+    def state(self):
+        """Snapshot of the game for display or serialisation."""
+        return {
+            "mode": self.mode,
+            "attempt": self.attempt,
+            "max_attempts": self.max_attempts,
+            "history": [(g, list(m)) for g, m in self.history],
+            "over": self.over,
+            "won": self.won,
+        }
+
+    def result(self):
+        """Final outcome, or None while the game is still running."""
+        if not self.over:
+            return None
+        return {
+            "mode": self.mode,
+            "target": self.target,
+            "won": self.won,
+            "tries": len(self._codes),
+            "seconds": self.elapsed(),
+        }
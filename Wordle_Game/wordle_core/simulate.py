@@ -0,0 +1,128 @@
+"""Batch simulator: play many headless games with a guessing strategy.
+
+A strategy is any object with reset(), best_guess() and
+update(guess, marks) - the interface of hints.HintEngine.  Targets and
+any randomness in the strategy come from one seeded random.Random, so a
+run is reproducible.
+
+    python -m wordle_core.simulate --games 1000 --mode Medium --strategy entropy --seed 1
+
+With ``--log`` every game is also appended to a replay log
+(wordle_core.replay), e.g. to try the analytics on a large log.
+"""
+import argparse
+import random
+import time
+from collections import Counter
+
+from .candidates import CandidateTracker
+from .hints import HintEngine
+from .replay import ReplayLog
+from .session import GameSession
+from .words import HARD_MODE, MODES, Dictionary
+
+
+class RandomCandidateStrategy:
+    """Guess a random word still consistent with the feedback."""
+
+    def __init__(self, dictionary, mode, rng):
+        self.index = dictionary.candidate_index(mode)
+        self.rng = rng
+        self.reset()
+
+    def reset(self):
+        self.tracker = CandidateTracker(self.index)
+
+    def update(self, guess, marks):
+        self.tracker.update(guess, marks)
+
+    def best_guess(self):
+        words = self.tracker.sample(None)
+        return self.rng.choice(words) if words else None
+
+
+STRATEGIES = {
+    "entropy": lambda dictionary, mode, rng: HintEngine(dictionary, mode, hard=mode == HARD_MODE),
+    "random": RandomCandidateStrategy,
+}
+
+# Games written to the replay log at a time
+LOG_BATCH = 1000
+
+
+def simulate(dictionary, mode, games, strategy="entropy", seed=0, max_attempts=None, log=None):
+    """Play ``games`` games and return a report dict.
+
+    The report has the number of games and wins, wall time, games/sec and
+    the guess distribution (tries -> games; failures under "X").  Every
+    game is appended to ``log`` (a ReplayLog) if one is given.
+    """
+    rng = random.Random(seed)
+    player = STRATEGIES[strategy](dictionary, mode, rng) if isinstance(strategy, str) else strategy
+    distribution = Counter()
+    wins = 0
+    finished = []
+    start = time.perf_counter()
+    for _ in range(games):
+        session = GameSession.start(dictionary, mode, rng=rng, max_attempts=max_attempts)
+        player.reset()
+        while not session.over:
+            guess = player.best_guess()
+            if guess is None:
+                break
+            turn = session.guess(guess)
+            player.update(turn.guess, turn.marks)
+        if session.won:
+            wins += 1
+            distribution[len(session.history)] += 1
+        else:
+            distribution["X"] += 1
+        if log is not None:
+            finished.append(session)
+            if len(finished) >= LOG_BATCH:
+                log.append_many(finished)
+                finished = []
+    if finished:
+        log.append_many(finished)
+    seconds = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "strategy": strategy if isinstance(strategy, str) else type(strategy).__name__,
+        "seed": seed,
+        "games": games,
+        "wins": wins,
+        "seconds": seconds,
+        "games_per_sec": games / seconds if seconds else float("inf"),
+        "distribution": dict(distribution),
+    }
+
+
+def print_report(report):
+    print(f"{report['games']} {report['mode']} games with '{report['strategy']}' "
+          f"(seed {report['seed']}): {report['games_per_sec']:.1f} games/sec")
+    won = report["wins"]
+    print(f"Won {won}/{report['games']} ({100.0 * won / max(report['games'], 1):.1f}%)")
+    dist = report["distribution"]
+    total = max(report["games"], 1)
+    for key in sorted((k for k in dist if k != "X")) + (["X"] if "X" in dist else []):
+        bar = "#" * round(40 * dist[key] / total)
+        print(f"  {key!s:>2}: {dist[key]:6d} {bar}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulate Wordle games headlessly.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--mode", choices=sorted(MODES), default="Medium")
+    parser.add_argument("--strategy", choices=sorted(STRATEGIES), default="entropy")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--attempts", type=int, default=None,
+                        help="attempt limit (default: the mode's own)")
+    parser.add_argument("--log", default=None, help="replay log to append every game to")
+    args = parser.parse_args(argv)
+    log = ReplayLog(args.log) if args.log else None
+    report = simulate(Dictionary.load(), args.mode, args.games, args.strategy, args.seed, args.attempts, log)
+    print_report(report)
+
+
+if __name__ == "__main__":
+    main()
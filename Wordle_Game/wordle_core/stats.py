@@ -0,0 +1,189 @@
+"""Per-player statistics: games played, wins, streaks and guess counts.
+
+Every finished game updates a running PlayerStats of (player, mode) in
+O(1); nothing is ever recomputed from the game history.  Both
+leaderboard backends keep them next to their records:
+
+* JSON (StatsStore): ``placemate.stats.json`` holds one aggregate per
+  (player, mode).  A finished game is appended to
+  ``placemate.stats.json.journal`` as one small event line and folded
+  into the in-memory aggregates as it is read; like the leaderboard
+  journal it is compacted into the snapshot in the background once it
+  passes placemate.COMPACT_BYTES, under the same lock file.
+* SQLite: a ``stats`` table keyed by (name, mode) in placemate.sqlite3,
+  updated in place (see leaderboard_db).
+"""
+import json
+import os
+import threading
+from pathlib import Path
+
+from .metrics import timed
+from .placemate import COMPACT_BYTES, _FileLock, _stat, read_journal
+
+
+class PlayerStats:
+    """Running totals of one player in one mode.
+
+    ``distribution[n - 1]`` counts the games won in n guesses; lost
+    games are ``played - wins``.
+    """
+
+    __slots__ = ("played", "wins", "streak", "max_streak", "distribution")
+
+    def __init__(self, played=0, wins=0, streak=0, max_streak=0, distribution=()):
+        self.played = played
+        self.wins = wins
+        self.streak = streak
+        self.max_streak = max_streak
+        self.distribution = list(distribution)
+
+    def add(self, won, tries):
+        """Count one finished game."""
+        self.played += 1
+        if not won:
+            self.streak = 0
+            return
+        self.wins += 1
+        self.streak += 1
+        if self.streak > self.max_streak:
+            self.max_streak = self.streak
+        if tries > len(self.distribution):
+            self.distribution.extend([0] * (tries - len(self.distribution)))
+        self.distribution[tries - 1] += 1
+
+    @property
+    def win_rate(self):
+        return self.wins / self.played if self.played else 0.0
+
+    def to_dict(self):
+        return {
+            "played": self.played,
+            "wins": self.wins,
+            "streak": self.streak,
+            "max_streak": self.max_streak,
+            "distribution": self.distribution,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data.get("played", 0), data.get("wins", 0), data.get("streak", 0),
+                   data.get("max_streak", 0), data.get("distribution", ()))
+
+
+def format_stats(stats, width=20):
+    """Stats as lines of text for the CLI and the GUI."""
+    lines = [
+        f"Played {stats.played}  Won {100.0 * stats.win_rate:.0f}%  "
+        f"Streak {stats.streak}  Best streak {stats.max_streak}",
+    ]
+    most = max(stats.distribution, default=0)
+    for tries, n in enumerate(stats.distribution, 1):
+        bar = "#" * (round(width * n / most) if most else 0)
+        lines.append(f"{tries:2d}: {n:5d} {bar}")
+    return lines
+
+
+class StatsStore:
+    """PlayerStats per (player, mode), stored as snapshot plus journal."""
+
+    def __init__(self, path, lock_path=None):
+        self.path = Path(path)
+        self.journal = self.path.with_name(self.path.name + ".journal")
+        self.lock = _FileLock(lock_path or self.path.with_name(self.path.name + ".lock"))
+        self._compactor = None
+        # Aggregates, caught up incrementally (see _sync)
+        self._stats = None
+        self._snapshot_stat = None
+        self._journal_offset = 0
+
+    def _read_snapshot(self):
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        stats = {}
+        for entry in data if isinstance(data, list) else ():
+            if isinstance(entry, dict):
+                stats[(entry.get("name"), entry.get("mode"))] = PlayerStats.from_dict(entry)
+        return stats
+
+    @staticmethod
+    def _apply(stats, event):
+        if not isinstance(event, dict):
+            return
+        key = (event.get("name"), event.get("mode"))
+        player = stats.get(key)
+        if player is None:
+            player = stats[key] = PlayerStats()
+        player.add(bool(event.get("won")), int(event.get("tries", 0)))
+
+    def _load(self):
+        """Aggregates from the snapshot and the whole journal, plus the journal offset."""
+        # Journal first, as in LeaderboardStore.entries()
+        events, offset = read_journal(self.journal)
+        stats = self._read_snapshot()
+        for event in events:
+            self._apply(stats, event)
+        return stats, offset
+
+    @timed("stats_load", backend="json")
+    def _sync(self):
+        """Fold journal lines appended since the last call into the aggregates.
+
+        Unlike best times, counts must not see a game twice, so this runs
+        under the lock: a compaction never sits between reading the
+        snapshot and reading the journal.
+        """
+        with self.lock:
+            snapshot_stat = _stat(self.path)
+            if self._stats is not None and snapshot_stat == self._snapshot_stat:
+                events, offset = read_journal(self.journal, self._journal_offset)
+                self._journal_offset = offset
+                for event in events:
+                    self._apply(self._stats, event)
+                return
+            self._stats, self._journal_offset = self._load()
+            self._snapshot_stat = snapshot_stat
+
+    def get(self, name, mode):
+        """The player's PlayerStats in ``mode``, or None before their first game."""
+        self._sync()
+        return self._stats.get((name, mode))
+
+    @timed("stats_save", backend="json")
+    def record(self, name, mode, won, tries):
+        """Count a finished game and return the player's updated PlayerStats."""
+        line = json.dumps({"name": name, "mode": mode, "won": bool(won), "tries": int(tries)}) + "\n"
+        with self.lock:
+            with self.journal.open("a", encoding="utf-8") as f:
+                f.write(line)
+                size = f.tell()
+        if size >= COMPACT_BYTES:
+            self.compact_in_background()
+        return self.get(name, mode)
+
+    def compact(self):
+        """Fold the journal into the snapshot with an atomic rename."""
+        with self.lock:
+            stats, _ = self._load()
+            entries = [dict(name=name, mode=mode, **s.to_dict()) for (name, mode), s in stats.items()]
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            with tmp.open("w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self.path)
+            with self.journal.open("w", encoding="utf-8"):
+                pass
+
+    def compact_in_background(self):
+        if self._compactor is not None and self._compactor.is_alive():
+            return
+        self._compactor = threading.Thread(target=self._compact_quietly, name="stats-compact")
+        self._compactor.start()
+
+    def _compact_quietly(self):
+        try:
+            self.compact()
+        except Exception:
+            print("Warning: could not compact player stats.")
@@ -0,0 +1,166 @@
+"""'Did you mean' suggestions for rejected guesses.
+
+Every valid guess is indexed under its deletion neighbourhood: the
+words left after dropping one of its letters ("crane" -> "rane",
+"cane", "crne", "crae", "cran").  Two words of the same length that
+share such a key are at most two edits apart, and every word one
+substitution or one swap of neighbouring letters away shares a key with
+it, so looking up the keys of a rejected guess finds its nearest valid
+words without looking at the rest of the list.
+
+The index of a guess list is built once and saved in the word-list
+cache as ``neighbours-<key>.bin`` (the key is a hash of the list, so a
+changed list gets a fresh index).  Like the ``.words`` files it is a
+sorted array of fixed-width records - here the deletion key followed by
+the word's index as a big-endian uint32 - that is memory-mapped and
+binary-searched, so a lookup is a handful of searches (tens of
+microseconds) and loading builds no Python objects per word.
+"""
+import hashlib
+import mmap
+import os
+import struct
+from pathlib import Path
+
+from .cache import CACHE_DIR
+from .metrics import timed
+
+MAGIC = b"WNB1"
+# magic, key letters, bytes per letter, record count
+HEADER = struct.Struct("<4sBBI")
+# Suggestions returned by default
+LIMIT = 3
+
+
+def _list_key(words):
+    h = hashlib.sha1()
+    h.update(len(words).to_bytes(4, "little"))
+    for w in words:
+        h.update(w.encode("utf-8"))
+    return h.hexdigest()[:16]
+
+
+def deletions(word):
+    """Keys of ``word``: the word without each one of its letters."""
+    return {word[:i] + word[i + 1:] for i in range(len(word))}
+
+
+def distance(a, b):
+    """Edit distance of two different words of the same length sharing a deletion key.
+
+    1 for one substitution or one swap of neighbouring letters, else 2.
+    """
+    diffs = [i for i, (x, y) in enumerate(zip(a, b)) if x != y]
+    if len(diffs) == 1:
+        return 1
+    if len(diffs) == 2 and diffs[1] == diffs[0] + 1 and a[diffs[0]] == b[diffs[1]] and a[diffs[1]] == b[diffs[0]]:
+        return 1
+    return 2
+
+
+class NeighbourIndex:
+    """Sorted (deletion key, word index) records for one word list."""
+
+    def __init__(self, words, buf, width, char_size, count, offset=HEADER.size):
+        self.words = words
+        self._buf = buf
+        self._key_size = width * char_size
+        self._size = self._key_size + 4
+        self._count = count
+        self._offset = offset
+        self._encoding = "utf-8" if char_size == 1 else "utf-32-be"
+
+    def _ids(self, key):
+        """Word indices filed under ``key``."""
+        try:
+            k = key.encode(self._encoding)
+        except UnicodeEncodeError:
+            return []
+        if len(k) != self._key_size:
+            return []
+        buf, off, size, ks = self._buf, self._offset, self._size, self._key_size
+        lo, hi = 0, self._count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            start = off + mid * size
+            if buf[start:start + ks] < k:
+                lo = mid + 1
+            else:
+                hi = mid
+        ids = []
+        start = off + lo * size
+        while lo < self._count and buf[start:start + ks] == k:
+            ids.append(int.from_bytes(buf[start + ks:start + size], "big"))
+            lo += 1
+            start += size
+        return ids
+
+    @timed("suggest")
+    def nearest(self, word):
+        """(distance, word) of every indexed word sharing a key with ``word``."""
+        ids = set()
+        for key in deletions(word):
+            ids.update(self._ids(key))
+        found = []
+        for i in ids:
+            candidate = self.words[i]
+            if candidate != word and len(candidate) == len(word):
+                found.append((distance(word, candidate), candidate))
+        return found
+
+    def suggest(self, word, limit=LIMIT, prefer=()):
+        """Up to ``limit`` nearest words, closest first.
+
+        Among words at the same distance those in ``prefer`` (e.g. the
+        answer list, which holds the common words) come first.
+        """
+        found = sorted(self.nearest(word), key=lambda dw: (dw[0], dw[1] not in prefer, dw[1]))
+        return [w for _, w in found[:limit]]
+
+
+def _records(words):
+    """Sorted index records of ``words``, plus key letters, bytes per letter and count."""
+    width = max(len(words[0]) - 1, 0) if len(words) else 0
+    encoding = "utf-8" if all(w.isascii() for w in words) else "utf-32-be"
+    records = set()
+    for i, w in enumerate(words):
+        tail = i.to_bytes(4, "big")
+        for key in deletions(w):
+            records.add(key.encode(encoding) + tail)
+    return b"".join(sorted(records)), width, 1 if encoding == "utf-8" else 4, len(records)
+
+
+def _open(path, words):
+    """Memory-map a saved index, or None if the file is missing or not an index."""
+    try:
+        with path.open("rb") as f:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, width, char_size, count = HEADER.unpack_from(buf, 0)
+    except (OSError, ValueError, struct.error):
+        return None
+    if magic != MAGIC:
+        return None
+    return NeighbourIndex(words, buf, width, char_size, count)
+
+
+def load_index(words, cache_dir=CACHE_DIR):
+    """Neighbour index of ``words``, memory-mapped from the cache or built and saved.
+
+    Falls back to an in-memory index when the cache directory is not
+    writable.
+    """
+    path = Path(cache_dir) / f"neighbours-{_list_key(words)}.bin"
+    index = _open(path, words)
+    if index is not None:
+        return index
+    data, width, char_size, count = _records(words)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(path.name + f".{os.getpid()}.tmp")
+        with tmp.open("wb") as f:
+            f.write(HEADER.pack(MAGIC, width, char_size, count))
+            f.write(data)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+    return _open(path, words) or NeighbourIndex(words, data, width, char_size, count, 0)
@@ -0,0 +1,292 @@
+"""Word list loading and the shared in-memory dictionary."""
+from pathlib import Path
+
+from .candidates import CandidateIndex
+from .dawg import Dawg
+from .metrics import timed
+
+# Data files live next to the front-end scripts
+DATA_DIR = Path(__file__).resolve().parent.parent
+WORDS_EASY_FILE = DATA_DIR / "words_easy_mode.txt"
+WORDS_MEDIUM_FILE = DATA_DIR / "words_medium_mode.txt"
+ALL_WORDS_FILE = DATA_DIR / "All_the_Words.txt"
+
+WORD_LENGTH = 5
+# Word lengths a mode may use
+MIN_LENGTH = 4
+MAX_LENGTH = 8
+LENGTHS = range(MIN_LENGTH, MAX_LENGTH + 1)
+DEFAULT_LANGUAGE = "en"
+
+# Difficulty name -> (answer list file, attempts allowed)
+MODES = {
+    "Easy": (WORDS_EASY_FILE, 6),
+    "Medium": (WORDS_MEDIUM_FILE, 4),
+    "Hard": (WORDS_MEDIUM_FILE, 6),
+}
+# Mode whose guesses must reuse every revealed hint (see hardmode.py)
+HARD_MODE = "Hard"
+
+
+class WordListError(Exception):
+    """Raised when a word list is missing or holds no usable words."""
+
+
+def read_header(path):
+    """Settings from a ``# length=6 language=de`` first line, as a dict.
+
+    Word lists without such a line give {}.  Unknown keys are kept as
+    strings; ``length`` is checked against MIN_LENGTH..MAX_LENGTH.
+    """
+    path = Path(path)
+    try:
+        with path.open(encoding="utf-8") as f:
+            first = f.readline().strip()
+    except OSError:
+        return {}
+    if not first.startswith("#"):
+        return {}
+    settings = {}
+    for item in first[1:].split():
+        key, sep, value = item.partition("=")
+        if sep:
+            settings[key.lower()] = value
+    if "length" in settings:
+        try:
+            settings["length"] = int(settings["length"])
+        except ValueError:
+            raise WordListError(f"Bad length {settings['length']!r} in {path.name}") from None
+        if settings["length"] not in LENGTHS:
+            raise WordListError(f"Word length in {path.name} must be {MIN_LENGTH}-{MAX_LENGTH}")
+    return settings
+
+
+def mode_spec(path):
+    """(word length, language) named by a mode file, with the defaults."""
+    settings = read_header(path)
+    return settings.get("length", WORD_LENGTH), settings.get("language", DEFAULT_LANGUAGE)
+
+
+def lexicon_file(language, all_words_file=ALL_WORDS_FILE):
+    """Full word list of ``language``: All_the_Words.txt for English,
+    All_the_Words.<language>.txt next to it otherwise."""
+    all_words_file = Path(all_words_file)
+    if language == DEFAULT_LANGUAGE:
+        return all_words_file
+    return all_words_file.with_name(f"{all_words_file.stem}.{language}{all_words_file.suffix}")
+
+
+def describe_lengths(length):
+    """``length`` (one length or a collection of them) for messages: "5" or "4-8"."""
+    if isinstance(length, int):
+        return str(length)
+    return f"{min(length)}-{max(length)}"
+
+
+@timed("load_words")
+def load_words(path, length=None, allow_empty=False):
+    """Read a word list, keeping lowercase alphabetic words of ``length`` letters.
+
+    ``length`` is one length or a collection of them; by default the
+    length named in the file's header line, else WORD_LENGTH.  Lines
+    starting with "#" are comments.  Raises WordListError if the file
+    is missing or, unless ``allow_empty``, holds no such words.
+    """
+    path = Path(path)
+    if not path.exists():
+        raise WordListError(f"words file not found: {path}")
+    if length is None:
+        length = read_header(path).get("length", WORD_LENGTH)
+    lengths = {length} if isinstance(length, int) else set(length)
+    words = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            w = line.strip().lower()
+            if len(w) in lengths and w.isalpha():
+                words.append(w)
+    if not words and not allow_empty:
+        raise WordListError(f"No valid {describe_lengths(length)}-letter words found in {path.name}")
+    return words
+
+
+class Dictionary:
+    """Allowed guesses plus the answer list of every mode.
+
+    Every mode plays words of one length in one language (its ``spec``,
+    read from the header line of its answer file; 5-letter English by
+    default).  The valid guesses of a spec are the words of that length
+    in the language's full list plus every answer of the modes using it.
+
+    Built from plain lists, membership checks go through frozensets, so
+    validating a guess is a hash lookup instead of a scan over the ~15k
+    word list.  Dictionary.load() instead maps the compiled word lists
+    from wordle_core.cache: one packed list per spec, where membership is
+    a binary search over fixed-width records, and one DAWG per language
+    (``words``) holding the full list of every length.  Answer words are
+    always accepted as guesses, even if All_the_Words.txt lacks them.
+    """
+
+    def __init__(self, all_words, answers, valid=None, specs=None, attempts=None):
+        # all_words: the English word list, or {language: word list}
+        # valid: optional {(length, language): guess list}
+        # attempts: optional {mode: guesses allowed}, else those of MODES (6 for others)
+        if not isinstance(all_words, dict):
+            all_words = {DEFAULT_LANGUAGE: all_words}
+        self.words = {
+            language: ws if isinstance(ws, (frozenset, Dawg)) else frozenset(ws)
+            for language, ws in all_words.items()
+        }
+        self.answers = dict(answers)
+        specs = specs or {}
+        self.specs = {mode: specs.get(mode, (WORD_LENGTH, DEFAULT_LANGUAGE)) for mode in self.answers}
+        attempts = attempts or {}
+        self.attempts = {
+            mode: attempts.get(mode) or (MODES[mode][1] if mode in MODES else 6) for mode in self.answers
+        }
+        self._valid = dict(valid or {})
+        for spec in set(self.specs.values()):
+            if spec not in self._valid:
+                length, language = spec
+                guesses = {w for w in self.words.get(language, ()) if len(w) == length}
+                for mode, mode_spec in self.specs.items():
+                    if mode_spec == spec:
+                        guesses.update(self.answers[mode])
+                self._valid[spec] = frozenset(guesses)
+        self._candidate_indexes = {}
+        # spec -> (sorted words, word -> id), built on first use for set guess lists
+        self._ids = {}
+        # mode -> (suggest.NeighbourIndex, answers for ranking), built on first use
+        self._neighbours = {}
+
+    @classmethod
+    @timed("dictionary_load")
+    def load(cls, all_words_file=ALL_WORDS_FILE, modes=None, use_cache=True):
+        """Load the full word lists and the answer list of every mode.
+
+        With ``use_cache`` the lists come from the memory-mapped cache,
+        which is recompiled whenever one of the text files changes.
+        """
+        if modes is None:
+            modes = MODES
+        specs = {mode: mode_spec(path) for mode, (path, _) in modes.items()}
+        attempts = {mode: n for mode, (_, n) in modes.items()}
+        sources = {language: lexicon_file(language, all_words_file) for _, language in specs.values()}
+        if not use_cache:
+            answers = {mode: load_words(path, specs[mode][0]) for mode, (path, _) in modes.items()}
+            all_words = {language: load_words(path, LENGTHS) for language, path in sources.items()}
+            return cls(all_words, answers, specs=specs, attempts=attempts)
+
+        from .cache import load_dawg, load_packed
+
+        answers = {
+            mode: load_packed(path, Path(path).stem, width=specs[mode][0])
+            for mode, (path, _) in modes.items()
+        }
+        all_words = {language: load_dawg(path, Path(path).stem) for language, path in sources.items()}
+        valid = {}
+        for spec in set(specs.values()):
+            length, language = spec
+            files = [sources[language]]
+            for mode, (path, _) in modes.items():
+                if specs[mode] == spec and path not in files:
+                    files.append(path)
+            name = "valid" if spec == (WORD_LENGTH, DEFAULT_LANGUAGE) else f"valid-{language}-{length}"
+            valid[spec] = load_packed(files, name, width=length)
+        return cls(all_words, answers, valid, specs, attempts)
+
+    def length(self, mode):
+        """Word length of ``mode``."""
+        return self.specs[mode][0]
+
+    def language(self, mode):
+        return self.specs[mode][1]
+
+    def max_attempts(self, mode):
+        """Guesses allowed in ``mode``, as given by the modes it was loaded with."""
+        return self.attempts[mode]
+
+    def guesses(self, mode):
+        """Every valid guess of ``mode``."""
+        return self._valid[self.specs[mode]]
+
+    def guess_list(self, mode):
+        """Valid guesses of ``mode`` as a sorted sequence, indexed like word_id().
+
+        The packed list itself when loaded from the cache, else the
+        sorted words of the guess set (not its hash-seed dependent order).
+        """
+        guesses = self.guesses(mode)
+        if hasattr(guesses, "index"):
+            return guesses
+        return self._sorted_ids(self.specs[mode])[0]
+
+    def __contains__(self, word):
+        return any(word in guesses for guesses in self._valid.values())
+
+    def is_valid(self, word, mode=None):
+        """Whether ``word`` is a valid guess in ``mode`` (in any mode if None)."""
+        if mode is None:
+            return word in self
+        return word in self.guesses(mode)
+
+    def word_id(self, word, mode):
+        """Small integer id of a valid guess of ``mode`` (its index in the guess list)."""
+        guesses = self.guesses(mode)
+        if hasattr(guesses, "index"):
+            return guesses.index(word)
+        return self._sorted_ids(self.specs[mode])[1][word]
+
+    def word(self, word_id, mode):
+        """Inverse of word_id()."""
+        guesses = self.guesses(mode)
+        if hasattr(guesses, "index"):
+            return guesses[word_id]
+        return self._sorted_ids(self.specs[mode])[0][word_id]
+
+    def _sorted_ids(self, spec):
+        if spec not in self._ids:
+            words = sorted(self._valid[spec])
+            self._ids[spec] = (words, {w: i for i, w in enumerate(words)})
+        return self._ids[spec]
+
+    def suggestions(self, word, mode, limit=3):
+        """Valid guesses of ``mode`` nearest to ``word``, for "did you mean".
+
+        Uses the cached deletion-neighbourhood index of wordle_core.suggest;
+        among equally close words the mode's answers come first.
+        """
+        entry = self._neighbours.get(mode)
+        if entry is None:
+            from .suggest import load_index
+
+            answers = self.answers[mode]
+            entry = self._neighbours[mode] = (
+                load_index(self.guess_list(mode)),
+                frozenset(answers) if isinstance(answers, list) else answers,
+            )
+        index, answers = entry
+        return index.suggest(word.lower(), limit, prefer=answers)
+
+    def targets(self, mode):
+        """Answer list for a difficulty mode."""
+        return self.answers[mode]
+
+    def candidate_index(self, mode):
+        """Bitmask index over the answers of ``mode``, built on first use."""
+        index = self._candidate_indexes.get(mode)
+        if index is None:
+            index = self._candidate_indexes[mode] = CandidateIndex(self.answers[mode])
+        return index
+
+    def missing_answers(self):
+        """Answer words absent from their language's full word list, per mode.
+
+        An empty dict means every answer list is a subset of the full list.
+        """
+        missing = {}
+        for mode, words in self.answers.items():
+            full = self.words.get(self.language(mode), ())
+            extra = sorted({w for w in words if w not in full})
+            if extra:
+                missing[mode] = extra
+        return missing
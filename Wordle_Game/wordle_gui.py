@@ -1,18 +1,40 @@
-import tkinter as tk 
-from tkinter import messagebox, simpledialog
-import json
-import random
 import time
-from datetime import datetime
-from pathlib import Path
+
+# Taken before the other imports so --timing includes them; hence the
+# E402 exemptions below.
+START_TIME = time.perf_counter()
+
+import tkinter as tk  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor  # noqa: E402
+from tkinter import messagebox  # noqa: E402
+from pathlib import Path  # noqa: E402
+
+from wordle_core import (  # noqa: E402
+    ABSENT,
+    PRESENT,
+    CORRECT,
+    MAX_LENGTH,
+    MODES,
+    Dictionary,
+    LeaderboardStore,
+    WordListError,
+    open_leaderboard,
+)
+from wordle_core.candidates import CandidateTracker  # noqa: E402
+from wordle_core.metrics import timed, timer  # noqa: E402
+from wordle_core.multiboard import BASE_MODE, BOARD_MODES, MultiBoardSession, board_attempts  # noqa: E402
+from wordle_core.ranking import format_rank  # noqa: E402
+from wordle_core.replay import save_replay  # noqa: E402
+from wordle_core.rotation import RotationStore, next_targets  # noqa: E402
+from wordle_core.session import GameSession, InvalidGuess  # noqa: E402
+from wordle_core.stats import format_stats  # noqa: E402
 
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).parent
 
-WORDS_EASY_FILE = SCRIPT_DIR / "words_easy_mode.txt"
-WORDS_MEDIUM_FILE = SCRIPT_DIR / "words_medium_mode.txt"
-ALL_WORDS_FILE = SCRIPT_DIR / "All_the_Words.txt"
 PLACEMATE_FILE = SCRIPT_DIR / "placemate.json"
+REPLAY_FILE = SCRIPT_DIR / "replays.wrl"
+ROTATION_FILE = SCRIPT_DIR / "rotation.sqlite3"
 
 # Window size
 WINDOW_WIDTH = 500
@@ -23,77 +45,65 @@ COLOR_GREEN = "#6aaa64"
 COLOR_YELLOW = "#c9b458"
 COLOR_GRAY = "#787c7e"
 COLOR_DEFAULT = "#d3d6da"
+MARK_COLORS = {CORRECT: COLOR_GREEN, PRESENT: COLOR_YELLOW, ABSENT: COLOR_GRAY}
 
-def load_words(path):
-    if not path.exists():
-        messagebox.showerror("Error", f"words file not found: {path}")
-        return []
-    words = []
-    with path.open(encoding="utf-8") as f:
-        for line in f:
-            w = line.strip().lower()
-            if len(w) == 5 and w.isalpha():
-                words.append(w)
-    if not words:
-        messagebox.showerror("Error", f"No valid 5-letter words found in {path.name}")
-    return words
-
-def load_placemate(path):
-    if not path.exists():
-        return []
-    try:
-        with path.open(encoding="utf-8") as f:
-            data = json.load(f)
-        if isinstance(data, list):
-            return data
-        return []
-    except Exception:
-        return []
-
-def save_placemate(path, name, seconds, mode):
-    leaderboard = load_placemate(path)
-    player_index = None
-    
-    # Check for player entry specifically for this mode
-    for i, entry in enumerate(leaderboard):
-        entry_mode = entry.get("mode", "Easy") # Default to Easy if missing
-        if entry.get("name") == name and entry_mode == mode:
-            player_index = i
-            break
-            
-    new_entry = {
-        "name": name,
-        "time": float(seconds),
-        "date": datetime.utcnow().isoformat() + "Z",
-        "mode": mode
-    }
-    
-    if player_index is not None:
-        if seconds < leaderboard[player_index].get("time", float("inf")):
-            leaderboard[player_index] = new_entry
-    else:
-        leaderboard.append(new_entry)
-        
+# Boards per row of the multi-board screen
+BOARDS_PER_ROW = 4
+
+# How often the UI thread checks whether loading has finished (ms)
+LOAD_POLL_MS = 30
+
+@timed("gui_load_resources")
+def load_resources():
+    """Word lists, leaderboard and hint engine; runs in a worker thread.
+
+    Returns (dictionary, board, error message or None).  Nothing here may
+    touch Tk: the UI thread picks the result up in _poll_loading.
+    """
+    error = None
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(leaderboard, f, indent=2)
-    except Exception:
-        print("Warning: could not save placemate record.")
+        dictionary = Dictionary.load()
+    except WordListError as e:
+        error = str(e)
+        dictionary = Dictionary([], {mode: [] for mode in MODES})
+    for mode in MODES:
+        dictionary.candidate_index(mode)
+    # JSON or SQLite, chosen by WORDLE_LEADERBOARD
+    board = open_leaderboard(PLACEMATE_FILE)
+    import wordle_core.hints  # noqa: F401  (pulls in NumPy, off the UI thread)
+    return dictionary, board, error
+
+
+def unknown_word_message(error):
+    """Feedback for a word that is not in the list, with the nearest valid words."""
+    text = "Word doesn't exist in the database."
+    if error.suggestions:
+        text += "\nDid you mean " + ", ".join(w.upper() for w in error.suggestions) + "?"
+    return text
+
  
 class WordleGUI(tk.Tk):         # Main application class
-    def __init__(self):
+    def __init__(self, timing=False):
         super().__init__()
         self.title("Wordle Game")
         self.geometry(f"{WINDOW_WIDTH}x{WINDOW_HEIGHT}")
         self.resizable(False, False)
+        self.timing = timing  # print startup and screen-switch latency (--timing)
+        self.first_frame = False
         
-        # Load two word lists
-        self.target_words = load_words(WORDS_EASY_FILE)
-        self.valid_words = load_words(ALL_WORDS_FILE)
+        # Load every word list once, in the background so the menu paints
+        # right away; new games only pick from them
+        self.dictionary = None
+        self.board = None
+        self.target_words = []
+        self.rotation = RotationStore(ROTATION_FILE)  # each player's unseen targets
+        loader = ThreadPoolExecutor(max_workers=1)
+        self.ready = loader.submit(load_resources)
+        loader.shutdown(wait=False)
+        self.pending_action = None  # run once loading has finished
+        self.status_var = tk.StringVar()
         self.player_name = ""
-        self.target = ""
-        self.start_time = 0.0
-        self.attempt = 1
+        self.session = None  # headless GameSession (or MultiBoardSession) of the current game
         
         # Game Settings
         self.selected_difficulty = tk.StringVar(value="Easy") # Default to Easy
@@ -102,21 +112,81 @@ class WordleGUI(tk.Tk):         # Main application class
         self.guess_rows = []
         self.details_label = None
         self.keyboard_buttons = {}
-        self.letter_status = {}
+        self.key_colors = {}  # letter -> colour currently shown on its key
+        self.hints = None
+        self.hint_future = None  # HintEngine being prepared for the current game
+        self.hint_pending = False  # a hint is waiting for hint_future
         
+        # Every screen is built once and swapped in and out
+        self.screens = {}
+        self.current_screen = None
+        self.timer_job = None  # pending after() id of the on-screen timer
+        self.timer_shown = None  # whole seconds currently displayed
+        # Stop redrawing the timer while the window is minimized
+        self.bind("<Unmap>", self._on_unmap)
+        self.bind("<Map>", self._on_map)
         self._build_main_screen()
+        self._build_name_screen()
+        self._build_game_screen()
+        self._build_leaderboard_screen()
+        self._show_screen("main")
+        self.after(LOAD_POLL_MS, self._poll_loading)
+    
+    def _poll_loading(self):
+        if not self.ready.done():
+            self.after(LOAD_POLL_MS, self._poll_loading)
+            return
+        try:
+            self.dictionary, self.board, error = self.ready.result()
+        except Exception as e:
+            # Anything load_resources does not handle itself (a broken cache
+            # file, an unreadable leaderboard, ...): report it and drop the
+            # waiting action instead of showing "Loading word lists..." forever.
+            messagebox.showerror("Error", f"Could not load the game data:\n{e}")
+            self.status_var.set("")
+            self.pending_action = None
+            # Empty lists: starting a game reports that no words are available
+            self.dictionary = Dictionary([], {mode: [] for mode in MODES})
+            self.board = LeaderboardStore(PLACEMATE_FILE)
+            return
+        if self.timing:
+            print(f"[timing] word lists and leaderboard ready: {(time.perf_counter() - START_TIME) * 1000:.0f} ms")
+        if error:
+            messagebox.showerror("Error", error)
+        self.status_var.set("")
+        action, self.pending_action = self.pending_action, None
+        if action is not None:
+            action()
+    
+    def _when_ready(self, action):
+        # Run action now, or as soon as the background loading is done
+        if self.dictionary is not None:
+            action()
+        else:
+            self.status_var.set("Loading word lists...")
+            self.pending_action = action
     
-    def _clear_screen(self):
-        for widget in self.winfo_children():
-            widget.destroy()
+    def _show_screen(self, name):
+        start = time.perf_counter()
+        frame = self.screens[name]
+        with timer("gui_switch", screen=name):
+            if self.current_screen is not None and self.current_screen is not frame:
+                self.current_screen.pack_forget()
+                self._stop_timer()
+            frame.pack(fill="both", expand=True)
+            self.current_screen = frame
+        if self.timing:
+            self.update_idletasks()
+            print(f"[timing] switch to {name}: {(time.perf_counter() - start) * 1000:.1f} ms")
     
+    @timed("gui_build", screen="main")
     def _build_main_screen(self):       # Main menu
-        self._clear_screen()
-        title = tk.Label(self, text="WORDLE", font=("Arial", 32, "bold"))
+        screen = self.screens["main"] = tk.Frame(self)
+        title = tk.Label(screen, text="WORDLE", font=("Arial", 32, "bold"))
         title.pack(pady=40)
         
         # Difficulty Selection
-        diff_frame = tk.Frame(self)
+        diff_frame = tk.Frame(screen)
         diff_frame.pack(pady=10)
         tk.Label(diff_frame, text="Select Difficulty:", font=("Arial", 14)).pack(anchor="w")
         
@@ -124,37 +194,57 @@ class WordleGUI(tk.Tk):         # Main application class
                       value="Easy", font=("Arial", 12)).pack(anchor="w")
         tk.Radiobutton(diff_frame, text="Medium (4 Attempts)", variable=self.selected_difficulty, 
                       value="Medium", font=("Arial", 12)).pack(anchor="w")
+        tk.Radiobutton(diff_frame, text="Hard (6 Attempts, use every hint)", variable=self.selected_difficulty, 
+                      value="Hard", font=("Arial", 12)).pack(anchor="w")
+        for name, boards in BOARD_MODES.items():
+            tk.Radiobutton(diff_frame, text=f"{name} ({boards} words, {board_attempts(boards)} Attempts)",
+                           variable=self.selected_difficulty, value=name, font=("Arial", 12)).pack(anchor="w")
 
-        start_btn = tk.Button(self, text="Start", font=("Arial", 18), width=16, command=self._prompt_name)
+        start_btn = tk.Button(screen, text="Start", font=("Arial", 18), width=16, command=self._prompt_name)
         start_btn.pack(pady=18)
         
-        leaderboard_btn = tk.Button(self, text="Leaderboard", font=("Arial", 18), width=16, command=self._show_leaderboard_screen)
+        leaderboard_btn = tk.Button(screen, text="Leaderboard", font=("Arial", 18), width=16,
+                                    command=lambda: self._when_ready(self._show_leaderboard_screen))
         leaderboard_btn.pack(pady=18)
         
-        exit_btn = tk.Button(self, text="Exit", font=("Arial", 18), width=16, command=self.quit)
+        exit_btn = tk.Button(screen, text="Exit", font=("Arial", 18), width=16, command=self.quit)
         exit_btn.pack(pady=18)
+        tk.Label(screen, textvariable=self.status_var, font=("Arial", 12), fg="#555").pack()
     
-    def _prompt_name(self):            # Prompt for player name
-        self._clear_screen()
-        lbl = tk.Label(self, text="Enter your name:", font=("Arial", 20))
+    def _show_main_screen(self):
+        if self.pending_action is not None:
+            # Going back cancels a Play or Leaderboard that was still waiting
+            self.pending_action = None
+            self.status_var.set("")
+        self._show_screen("main")
+    
+    @timed("gui_build", screen="name")
+    def _build_name_screen(self):
+        screen = self.screens["name"] = tk.Frame(self)
+        lbl = tk.Label(screen, text="Enter your name:", font=("Arial", 20))
         lbl.pack(pady=50)
-        name_var = tk.StringVar()
-        name_entry = tk.Entry(self, textvariable=name_var, font=("Arial", 16), justify="center")
-        name_entry.pack(pady=16) 
-        name_entry.focus_set()
-        
+        self.name_var = tk.StringVar()
+        self.name_entry = tk.Entry(screen, textvariable=self.name_var, font=("Arial", 16), justify="center")
+        self.name_entry.pack(pady=16) 
+        # Play waits for the word lists if they are still loading
+        play = lambda: self._when_ready(lambda: self._start_game(self.name_var.get()))
+        self.name_entry.bind("<Return>", lambda e: play())
+        self.join_btn = tk.Button(screen, text="Play", font=("Arial", 18), width=12, command=play)
+        self.join_btn.pack(pady=24)
+        back_btn = tk.Button(screen, text="Back", font=("Arial", 15), command=self._show_main_screen)
+        back_btn.pack(pady=8)
+        tk.Label(screen, textvariable=self.status_var, font=("Arial", 12), fg="#555").pack()
+    
+    def _prompt_name(self):            # Prompt for player name
         # Set attempts based on selection
         mode = self.selected_difficulty.get()
-        if mode == "Medium":
-            self.max_attempts = 4
+        if mode in BOARD_MODES:
+            self.max_attempts = board_attempts(BOARD_MODES[mode])
         else:
-            self.max_attempts = 6
-
-        name_entry.bind("<Return>", lambda e: self._start_game(name_var.get()))
-        join_btn = tk.Button(self, text=f"Play ({mode})", font=("Arial", 18), width=12, command=lambda: self._start_game(name_var.get()))
-        join_btn.pack(pady=24)
-        back_btn = tk.Button(self, text="Back", font=("Arial", 15), command=self._build_main_screen)
-        back_btn.pack(pady=8)
+            self.max_attempts = MODES[mode][1]
+        self.join_btn.config(text=f"Play ({mode})")
+        self._show_screen("name")
+        self.name_entry.focus_set()
 
     def _start_game(self, player_name):     # Start the game
         player_name = player_name.strip()
@@ -162,74 +252,126 @@ class WordleGUI(tk.Tk):         # Main application class
             player_name = "Anonymous"
         self.player_name = player_name
         
-        # Load the correct word list based on difficulty
+        # Pick the answer list for the selected difficulty
         mode = self.selected_difficulty.get()
-        if mode == "Medium":
-            self.target_words = load_words(WORDS_MEDIUM_FILE)
-        else:  # Easy
-            self.target_words = load_words(WORDS_EASY_FILE)
-        
-        # Load all valid words for guess validation
-        self.valid_words = load_words(ALL_WORDS_FILE)
+        if mode in BOARD_MODES:
+            self._start_multi_game(mode)
+            return
+        self.target_words = self.dictionary.targets(mode)
         
         if not self.target_words:
             messagebox.showerror("Error", "No target words available. Cannot start game.")
-            self._build_main_screen()
+            self._show_main_screen()
             return
         
-        self.target = random.choice(self.target_words)
-        self.start_time = time.perf_counter()
-        self.attempt = 1
-        self.letter_status = {}
-        self._build_game_screen()
+        self.timer_label = self.game_timer_label
+        targets = next_targets(self.rotation, self.player_name, mode, self.target_words)
+        self.session = GameSession.start(self.dictionary, mode, target=targets[0] if targets else None,
+                                         max_attempts=self.max_attempts)
+        from wordle_core.hints import prepare_in_background  # already imported by load_resources
+
+        # The matrix and opening table build off the UI thread while the player types
+        self.hint_future = prepare_in_background(self.dictionary, mode, hard=self.session.rules is not None)
+        self.hints = None  # taken from hint_future on the first hint request
+        self.remaining = CandidateTracker(self.dictionary.candidate_index(mode))
+        self.show_sample = False
+        self._reset_game_screen()
+        self._show_screen("game")
+        self.guess_entry.focus_set()
+        self._start_timer()
     
+    @timed("gui_build", screen="game")
     def _build_game_screen(self):                # Build the game screen
-        self._clear_screen()
-        top = tk.Frame(self)
+        screen = self.screens["game"] = tk.Frame(self)
+        top = tk.Frame(screen)
         top.pack(anchor="center", pady=8)
         
-        mode = self.selected_difficulty.get()
-        details = f"Player: {self.player_name} ({mode})  Attempts: {self.attempt}/{self.max_attempts}"
-        self.details_label = tk.Label(top, text=details, font=("Arial", 14))
+        self.details_label = tk.Label(top, text="", font=("Arial", 14))
         self.details_label.pack()
-        
-        self._update_timer()
+        self.game_timer_label = self.timer_label = tk.Label(top, text="", font=("Consolas", 14))
+        self.timer_label.pack()
 
-        game_frame = tk.Frame(self)
+        game_frame = tk.Frame(screen)
         game_frame.pack(pady=16)
         self.guess_rows = []
+        self.row_frames = []
         
-        # Create dynamic number of rows based on max_attempts
-        for i in range(self.max_attempts):
+        # Enough rows for the longest mode; _reset_game_screen hides the rest
+        for i in range(max(attempts for _, attempts in MODES.values())):
             row = []
             f = tk.Frame(game_frame)
             f.pack(pady=2)
-            for j in range(5):
+            for j in range(MAX_LENGTH):
                 lbl = tk.Label(f, text=" ", font=("Consolas", 18, "bold"), width=3, height=1, relief="ridge", bd=2, bg="white")
                 lbl.pack(side="left", padx=2)
                 row.append(lbl)
             self.guess_rows.append(row)
+            self.row_frames.append(f)
+        self.filled_rows = 0  # rows that show a guess and need clearing
+        self.row_length = MAX_LENGTH  # cells shown per row
 
-        entry_frame = tk.Frame(self)
+        entry_frame = tk.Frame(screen)
         entry_frame.pack(pady=12)
         self.guess_var = tk.StringVar()
-        guess_entry = tk.Entry(entry_frame, textvariable=self.guess_var, font=("Arial", 16), justify="center", width=8)
-        guess_entry.grid(row=0, column=0)
-        guess_entry.focus_set()
-        guess_entry.bind("<Return>", lambda e: self._handle_guess())
+        self.guess_entry = tk.Entry(entry_frame, textvariable=self.guess_var, font=("Arial", 16), justify="center", width=8)
+        self.guess_entry.grid(row=0, column=0)
+        self.guess_entry.bind("<Return>", lambda e: self._handle_guess())
         guess_btn = tk.Button(entry_frame, text="Guess", font=("Arial", 16), width=8, command=self._handle_guess)
         guess_btn.grid(row=0, column=1, padx=6)
+        hint_btn = tk.Button(entry_frame, text="Hint", font=("Arial", 16), width=5, command=self._show_hint)
+        hint_btn.grid(row=0, column=2)
         
-        self.feedback_label = tk.Label(self, text="", font=("Arial", 13), fg="red")
+        self.feedback_label = tk.Label(screen, text="", font=("Arial", 13), fg="red")
         self.feedback_label.pack(pady=2)
+        self.hint_label = tk.Label(screen, text="", font=("Arial", 13), fg="#555")
+        self.hint_label.pack()
+        # Click the count to show or hide some of the possible words
+        self.remaining_label = tk.Label(screen, text="", font=("Arial", 11), fg="#555", cursor="hand2",
+                                        wraplength=WINDOW_WIDTH - 40)
+        self.remaining_label.pack()
+        self.remaining_label.bind("<Button-1>", lambda e: self._toggle_sample())
         
-        self._build_keyboard()
+        self._build_keyboard(screen)
         
-        back_btn = tk.Button(self, text="Main Menu", font=("Arial", 12), command=self._build_main_screen)
+        back_btn = tk.Button(screen, text="Main Menu", font=("Arial", 12), command=self._show_main_screen)
         back_btn.pack(side="bottom", pady=8)
     
-    def _build_keyboard(self):
-        keyboard_frame = tk.Frame(self)
+    @timed("gui_refresh", screen="game")
+    def _reset_game_screen(self):
+        # Clear only what the last game changed
+        for row in self.guess_rows[:self.filled_rows]:
+            for lbl in row:
+                lbl.config(text=" ", bg="white", fg="black")
+        self.filled_rows = 0
+        for i, f in enumerate(self.row_frames):
+            if i < self.max_attempts:
+                f.pack(pady=2)
+            else:
+                f.pack_forget()
+        # Show as many cells per row as the mode's words have letters
+        length = self.session.length
+        if length != self.row_length:
+            for row in self.guess_rows:
+                for j, lbl in enumerate(row):
+                    if j < length:
+                        lbl.pack(side="left", padx=2)
+                    else:
+                        lbl.pack_forget()
+            self.row_length = length
+        for letter in self.key_colors:
+            self.keyboard_buttons[letter].config(bg=COLOR_DEFAULT, fg="black")
+        self.key_colors = {}
+        
+        mode = self.selected_difficulty.get()
+        details = f"Player: {self.player_name} ({mode})  Attempts: {self.session.attempt}/{self.max_attempts}"
+        self.details_label.config(text=details)
+        self.guess_var.set("")
+        self.feedback_label.config(text="")
+        self.hint_label.config(text="")
+        self._update_remaining()
+    
+    def _build_keyboard(self, parent):
+        keyboard_frame = tk.Frame(parent)
         keyboard_frame.pack(pady=8)
         
         rows = [
@@ -256,111 +398,159 @@ class WordleGUI(tk.Tk):         # Main application class
                 btn.pack(side="left", padx=1)
                 self.keyboard_buttons[letter] = btn
     
-    def _update_keyboard_colors(self, guess, feedback_colors):  
-        for i, letter in enumerate(guess):
+    def _update_keyboard_colors(self, guess):
+        # The session keeps the best mark of every letter; only keys whose
+        # colour changed are reconfigured
+        for letter in set(guess):
             letter_upper = letter.upper()
-            color = feedback_colors[i]
-            
-            if letter_upper in self.letter_status:
-                current = self.letter_status[letter_upper]
-                if color == COLOR_GREEN:
-                    self.letter_status[letter_upper] = COLOR_GREEN
-                elif color == COLOR_YELLOW and current != COLOR_GREEN:
-                    self.letter_status[letter_upper] = COLOR_YELLOW
-                elif color == COLOR_GRAY and current == COLOR_DEFAULT:
-                    self.letter_status[letter_upper] = COLOR_GRAY
-            else:
-                self.letter_status[letter_upper] = color
-            
-            if letter_upper in self.keyboard_buttons:
-                btn = self.keyboard_buttons[letter_upper]
-                btn.config(bg=self.letter_status[letter_upper], fg="white")
+            color = MARK_COLORS[self.session.letter_mark(letter)]
+            if letter_upper in self.keyboard_buttons and self.key_colors.get(letter_upper) != color:
+                self.keyboard_buttons[letter_upper].config(bg=color, fg="white")
+                self.key_colors[letter_upper] = color
+    
+    def _start_timer(self):
+        self._stop_timer()
+        self.timer_shown = None
+        self._tick()
+    
+    def _tick(self):
+        # Redraw only when the shown second changes, then sleep until the
+        # next whole second instead of polling
+        self.timer_job = None
+        elapsed = self.session.elapsed()
+        seconds = int(elapsed)
+        if seconds != self.timer_shown:
+            self.timer_shown = seconds
+            self.timer_label.config(text=f"Time: {seconds // 60}:{seconds % 60:02d}")
+        if not self.session.over:
+            delay = int((seconds + 1 - elapsed) * 1000) + 1
+            self.timer_job = self.after(delay, self._tick)
+    
+    def _stop_timer(self):
+        if self.timer_job is not None:
+            self.after_cancel(self.timer_job)
+            self.timer_job = None
     
-    def _update_timer(self):
-        if self.start_time > 0:
-            elapsed = time.perf_counter() - self.start_time
-            # Keep calling recursively if we are still in game screen
-            # (simple check: if details_label exists)
-            if self.details_label and self.details_label.winfo_exists():
-                self.after(100, self._update_timer)
+    def _on_unmap(self, event):
+        # The game clock keeps running; only the redraws pause
+        if event.widget is self:
+            self._stop_timer()
     
+    def _on_map(self, event):
+        if event.widget is self and not self.first_frame:
+            self.first_frame = True
+            if self.timing:
+                self.after_idle(lambda: print(
+                    f"[timing] first interactive frame: {(time.perf_counter() - START_TIME) * 1000:.0f} ms"))
+        if (event.widget is self and self.timer_job is None and self.session is not None
+                and not self.session.over
+                and self.current_screen in (self.screens["game"], self.screens.get("multi"))):
+            self._tick()
+    
+    @timed("gui_guess")
     def _handle_guess(self):
-        guess = self.guess_var.get().strip().lower()
-        if len(guess) != 5 or not guess.isalpha():
-            self.feedback_label.config(text="Please enter exactly 5 letters.")
+        session = self.session
+        row_widgets = self.guess_rows[session.attempt - 1]
+        try:
+            result = session.guess(self.guess_var.get())
+        except InvalidGuess as e:
+            if e.reason == "unknown":
+                self.feedback_label.config(text=unknown_word_message(e))
+            else:
+                self.feedback_label.config(text=str(e))
             return
         
-        if guess not in self.valid_words:
-            self.feedback_label.config(text="Word doesn't exist in the database.")
-            return
-
-        row_widgets = self.guess_rows[self.attempt - 1]
-        feedback, colorings = self._format_feedback(guess, self.target)
-        for i in range(5):
+        guess, marks = result.guess, result.marks
+        colorings = [MARK_COLORS[m] for m in marks]
+        for i in range(len(guess)):
             row_widgets[i].config(text=guess[i].upper(),            
                                    bg=colorings[i],     
                                    fg="white" if colorings[i] != "white" else "black")
+        self.filled_rows = session.attempt - 1
+        
+        self._update_keyboard_colors(guess)
         
-        self._update_keyboard_colors(guess, colorings)
+        if self.hints is not None:
+            self.hints.update(guess, marks)
+        self.hint_label.config(text="")
+        self.remaining.update(guess, marks)
+        self._update_remaining()
         
         self.feedback_label.config(text="")
         self.guess_var.set("")
 
-        if guess == self.target:
-            elapsed = time.perf_counter() - self.start_time     
+        if result.over:
+            # Show the final time and stop the clock before any dialog
+            self._stop_timer()
+            self._tick()
+            save_replay(REPLAY_FILE, session)
+            self._record_game(result.solved, session.attempt - 1)
+
+        if result.solved:
+            elapsed = session.elapsed()
             self._record_result(elapsed)            
             return
-        self.attempt += 1
 
-        if self.attempt > self.max_attempts:
-            messagebox.showinfo("Wordle", f"Out of tries.\nThe word was: {self.target.upper()}")
-            self._build_main_screen()
+        if result.over:
+            messagebox.showinfo("Wordle", f"Out of tries.\nThe word was: {session.target.upper()}")
+            self._show_main_screen()
         else:
             mode = self.selected_difficulty.get()
-            details = f"Player: {self.player_name} ({mode})  Attempts: {self.attempt}/{self.max_attempts}"
+            details = f"Player: {self.player_name} ({mode})  Attempts: {session.attempt}/{self.max_attempts}"
             self.details_label.config(text=details)
 
-    def _format_feedback(self, guess, target):
-        feedback = [""] * 5
-        colors = ["white"] * 5
-        target_chars = list(target)
-        used = [False] * 5
-
-        # Greens
-        for i, ch in enumerate(guess):
-            if ch == target[i]:
-                feedback[i] = ch.upper()
-                colors[i] = COLOR_GREEN
-                used[i] = True
-                target_chars[i] = None
-
-        # Yellows and grays
-        for i, ch in enumerate(guess):
-            if feedback[i]:
-                continue
-            if ch in target_chars:
-                j = target_chars.index(ch)
-                target_chars[j] = None
-                feedback[i] = ch.upper()
-                colors[i] = COLOR_YELLOW
-            else:
-                feedback[i] = ch.upper()
-                colors[i] = COLOR_GRAY
-        return feedback, colors
+    def _update_remaining(self):
+        left = self.remaining.count()
+        text = f"{left} possible {'word' if left == 1 else 'words'} left"
+        if self.show_sample:
+            sample = self.remaining.sample(8)
+            text += ": " + ", ".join(w.upper() for w in sample) + (" ..." if left > len(sample) else "")
+        self.remaining_label.config(text=text)
+
+    def _toggle_sample(self):
+        self.show_sample = not self.show_sample
+        self._update_remaining()
+
+    def _show_hint(self):
+        if self.hints is None:
+            if not self.hint_future.done():
+                # Cold cache: poll instead of blocking the mainloop
+                self.hint_label.config(text="Preparing hints...")
+                if not self.hint_pending:
+                    self.hint_pending = True
+                    self.after(LOAD_POLL_MS, self._hint_ready, self.session)
+                return
+            try:
+                self.hints = self.hint_future.result()
+            except Exception:
+                self.hint_label.config(text="Hints are not available.")
+                return
+            for guess, marks in self.session.history:
+                self.hints.update(guess, marks)
+        suggestion = self.hints.best_guess()
+        if suggestion is None:
+            self.hint_label.config(text="No word matches the feedback so far.")
+            return
+        left = self.hints.remaining()
+        self.hint_label.config(text=f"Hint: try {suggestion.upper()} ({left} possible {'word' if left == 1 else 'words'} left)")
+
+    def _hint_ready(self, session):
+        self.hint_pending = False
+        # Drop the request if that game ended or another one started
+        if self.session is session and not session.over and self.current_screen is self.screens["game"]:
+            self._show_hint()
 
-    def _record_result(self, elapsed):
+    def _record_result(self, elapsed, found="the word"):
         mode = self.selected_difficulty.get()
-        leaderboard = load_placemate(PLACEMATE_FILE)
         
-        # Check PB for this mode
-        player_best = None
-        for entry in leaderboard:
-            entry_mode = entry.get("mode", "Easy")
-            if entry.get("name") == self.player_name and entry_mode == mode:
-                player_best = entry.get("time")
-                break
-                
-        save_placemate(PLACEMATE_FILE, self.player_name, elapsed, mode)
+        # Check PB for this mode (indexed lookup in the store)
+        player_best = self.board.best(self.player_name, mode)
+        
+        if player_best is None or elapsed < player_best:
+            try:
+                self.board.record(self.player_name, elapsed, mode)
+            except Exception:
+                print("Warning: could not save placemate record.")
         
         msg = ""
         if player_best is None:
@@ -369,67 +559,297 @@ class WordleGUI(tk.Tk):         # Main application class
             msg = f"New {mode} PB!\n{self.player_name} - {elapsed:.2f}s (was {player_best:.2f}s)"
         else:
             msg = f"Good game!\nYour {mode} best is still {player_best:.2f}s"
+        
+        rank = self.board.rank(self.player_name, mode)
+        if rank is not None:
+            msg += f"\nRank: {format_rank(*rank)}"
             
-        messagebox.showinfo("Wordle", f"Correct! You found the word.\nYour time: {elapsed:.2f} seconds\n{msg}")
-        self._build_main_screen()
+        messagebox.showinfo("Wordle", f"Correct! You found {found}.\nYour time: {elapsed:.2f} seconds\n{msg}")
+        self._show_main_screen()
 
-    def _show_leaderboard_screen(self, default_mode="Easy"):
-        self._clear_screen()
-        leaderboard = load_placemate(PLACEMATE_FILE)
+    def _record_game(self, won, tries):
+        # Every finished game counts in the stats, won or lost
+        try:
+            self.board.record_game(self.player_name, self.selected_difficulty.get(), won, tries)
+        except Exception:
+            print("Warning: could not save player stats.")
+
+    @timed("gui_build", screen="multi")
+    def _build_multi_screen(self):
+        # Built on the first multi-board game (8 boards of labels), then reused
+        screen = self.screens["multi"] = tk.Frame(self)
+        self.multi_details = tk.Label(screen, text="", font=("Arial", 14))
+        self.multi_details.pack(pady=(8, 0))
+        self.multi_timer_label = tk.Label(screen, text="", font=("Consolas", 14))
+        self.multi_timer_label.pack()
+
+        boards_frame = tk.Frame(screen)
+        boards_frame.pack(pady=8)
+        rows = board_attempts(max(BOARD_MODES.values()))
+        self.multi_frames = []   # one frame per board
+        self.multi_titles = []   # "#n" label above each board
+        self.multi_rows = []     # board -> row frames
+        self.multi_cells = []    # board -> row -> cell labels
+        for b in range(max(BOARD_MODES.values())):
+            frame = tk.Frame(boards_frame, bd=1, relief="groove")
+            frame.grid(row=b // BOARDS_PER_ROW, column=b % BOARDS_PER_ROW, padx=3, pady=3)
+            title = tk.Label(frame, text=f"#{b + 1}", font=("Arial", 9, "bold"), fg="#555")
+            title.pack()
+            row_frames, cells = [], []
+            for _ in range(rows):
+                f = tk.Frame(frame)
+                f.pack()
+                row = []
+                for _ in range(MAX_LENGTH):
+                    lbl = tk.Label(f, text=" ", font=("Consolas", 9, "bold"), width=2, relief="ridge", bd=1, bg="white")
+                    lbl.pack(side="left")
+                    row.append(lbl)
+                row_frames.append(f)
+                cells.append(row)
+            self.multi_frames.append(frame)
+            self.multi_titles.append(title)
+            self.multi_rows.append(row_frames)
+            self.multi_cells.append(cells)
+        self.multi_shown = (len(self.multi_frames), rows, MAX_LENGTH)  # boards, rows, cells visible
+        self.multi_used = 0  # rows (guesses plus the typing row) that need clearing
+        self.multi_typed = ""  # letters previewed in the typing row
+
+        entry_frame = tk.Frame(screen)
+        entry_frame.pack(pady=6)
+        self.multi_var = tk.StringVar()
+        self.multi_var.trace_add("write", self._on_multi_typing)
+        self.multi_entry = tk.Entry(entry_frame, textvariable=self.multi_var, font=("Arial", 16), justify="center", width=8)
+        self.multi_entry.grid(row=0, column=0)
+        self.multi_entry.bind("<Return>", lambda e: self._handle_multi_guess())
+        tk.Button(entry_frame, text="Guess", font=("Arial", 16), width=8,
+                  command=self._handle_multi_guess).grid(row=0, column=1, padx=6)
+        self.multi_feedback = tk.Label(screen, text="", font=("Arial", 13), fg="red")
+        self.multi_feedback.pack(pady=2)
+
+        back_btn = tk.Button(screen, text="Main Menu", font=("Arial", 12), command=self._show_main_screen)
+        back_btn.pack(side="bottom", pady=8)
+
+    def _start_multi_game(self, mode):
+        if "multi" not in self.screens:
+            self._build_multi_screen()
+        try:
+            targets = next_targets(self.rotation, self.player_name, mode,
+                                   self.dictionary.targets(BASE_MODE), BOARD_MODES[mode])
+            self.session = MultiBoardSession.start(self.dictionary, mode, targets=targets,
+                                                   max_attempts=self.max_attempts)
+        except ValueError:
+            messagebox.showerror("Error", "Not enough target words available. Cannot start game.")
+            self._show_main_screen()
+            return
+        self.timer_label = self.multi_timer_label
+        self._reset_multi_screen()
+        self._show_screen("multi")
+        self.multi_entry.focus_set()
+        self._start_timer()
+
+    @timed("gui_refresh", screen="multi")
+    def _reset_multi_screen(self):
+        session = self.session
+        # Clear only the rows the last game wrote to
+        for cells in self.multi_cells:
+            for row in cells[:self.multi_used]:
+                for lbl in row:
+                    lbl.config(text=" ", bg="white", fg="black")
+        self.multi_used = 0
+        self.multi_typed = ""
+        for b, title in enumerate(self.multi_titles):
+            title.config(text=f"#{b + 1}", fg="#555")
+        # Show as many boards, rows and cells as this game needs
+        boards, rows, length = self.multi_shown
+        if boards != session.boards:
+            for b, frame in enumerate(self.multi_frames):
+                if b < session.boards:
+                    frame.grid()
+                else:
+                    frame.grid_remove()
+        if rows != session.max_attempts:
+            for row_frames in self.multi_rows:
+                for r, f in enumerate(row_frames):
+                    if r < session.max_attempts:
+                        f.pack()
+                    else:
+                        f.pack_forget()
+        if length != session.length:
+            for cells in self.multi_cells:
+                for row in cells:
+                    for j, lbl in enumerate(row):
+                        if j < session.length:
+                            lbl.pack(side="left")
+                        else:
+                            lbl.pack_forget()
+        self.multi_shown = (session.boards, session.max_attempts, session.length)
+        self._update_multi_details()
+        self.multi_var.set("")
+        self.multi_feedback.config(text="")
+
+    def _update_multi_details(self):
+        session = self.session
+        solved = sum(session.solved)
+        self.multi_details.config(text=f"Player: {self.player_name} ({session.mode})  "
+                                       f"Attempts: {session.attempt}/{self.max_attempts}  "
+                                       f"Solved: {solved}/{session.boards}")
+
+    def _on_multi_typing(self, *args):
+        # Preview the typed letters in the current row of the unsolved
+        # boards, touching only the cells whose letter changed
+        session = self.session
+        if not isinstance(session, MultiBoardSession) or session.over:
+            return
+        typed = self.multi_var.get().strip().upper()[:session.length]
+        old = self.multi_typed
+        if typed == old:
+            return
+        changed = [i for i in range(max(len(old), len(typed))) if old[i:i + 1] != typed[i:i + 1]]
+        row = session.attempt - 1
+        for b, done in enumerate(session.solved):
+            if not done:
+                cells = self.multi_cells[b][row]
+                for i in changed:
+                    cells[i].config(text=typed[i:i + 1] or " ")
+        self.multi_typed = typed
+        self.multi_used = max(self.multi_used, row + 1)
+
+    @timed("gui_guess", screen="multi")
+    def _handle_multi_guess(self):
+        session = self.session
+        row = session.attempt - 1
+        try:
+            result = session.guess(self.multi_var.get())
+        except InvalidGuess as e:
+            if e.reason == "unknown":
+                self.multi_feedback.config(text=unknown_word_message(e))
+            else:
+                self.multi_feedback.config(text=str(e))
+            return
+
+        # One batched score covered every open board; boards solved
+        # earlier got None and are not touched
+        guess = result.guess.upper()
+        for b, marks in enumerate(result.marks):
+            if marks is None:
+                continue
+            for lbl, ch, mark in zip(self.multi_cells[b][row], guess, marks):
+                lbl.config(text=ch, bg=MARK_COLORS[mark], fg="white")
+        for b in result.solved:
+            self.multi_titles[b].config(text=f"#{b + 1} \u2713", fg=COLOR_GREEN)
+        self.multi_used = max(self.multi_used, row + 1)
+        self.multi_typed = ""
+        self.multi_feedback.config(text="")
+        self.multi_var.set("")
+
+        if result.over:
+            self._stop_timer()
+            self._tick()
+            save_replay(REPLAY_FILE, session)
+            self._record_game(session.won, session.attempt - 1)
+        if session.won:
+            self._record_result(session.elapsed(), found=f"all {session.boards} words")
+            return
+        if result.over:
+            words = ", ".join(w.upper() for w in session.targets)
+            messagebox.showinfo("Wordle", f"Out of tries. Solved {sum(session.solved)}/{session.boards}.\n"
+                                          f"The words were: {words}")
+            self._show_main_screen()
+        else:
+            self._update_multi_details()
+
+    @timed("gui_build", screen="leaderboard")
+    def _build_leaderboard_screen(self):
+        screen = self.screens["leaderboard"] = tk.Frame(self)
         
-        title = tk.Label(self, text="Leaderboard", font=("Arial", 25, "bold"))
+        title = tk.Label(screen, text="Leaderboard", font=("Arial", 25, "bold"))
         title.pack(pady=10)
         
         # Mode switch buttons
-        btn_frame = tk.Frame(self)
+        btn_frame = tk.Frame(screen)
         btn_frame.pack(pady=5)
-        
-        # Helper to refresh the list part only
-        def refresh_list(mode):
-            # Clear previous list
-            for widget in list_frame.winfo_children():
-                widget.destroy()
-                
-            # Filter and sort
-            filtered = [e for e in leaderboard if e.get("mode", "Easy") == mode]
-            filtered.sort(key=lambda x: x.get("time", float("inf")))
-            
-            header = tk.Label(list_frame, text=f"{mode.upper()} MODE", font=("Arial", 12, "bold"), fg="#555")
-            header.pack(pady=5)
-
-            if not filtered:
-                lbl = tk.Label(list_frame, text=f"No {mode} records yet.", font=("Arial", 14))
-                lbl.pack(pady=20)
-            else:
-                head_str = f"{'Rank':<5}{'Name':<14}{'Time(s)':<10}{'Date'}"
-                tk.Label(list_frame, text=head_str, font=("Consolas", 12, "bold")).pack()
-                
-                for i, entry in enumerate(filtered[:10], 1):
-                    name = entry.get("name", "Unknown")
-                    time_sec = entry.get("time", 0)
-                    date = entry.get("date", "")
-                    s = f"{i:>2}    {name:<14}{time_sec:7.2f}   {date[:10]}"
-                    lbl = tk.Label(list_frame, text=s, font=("Consolas", 12))
-                    lbl.pack(anchor="w", padx=20)
-
-        # Buttons
-        b1 = tk.Button(btn_frame, text="Easy (6)", command=lambda: refresh_list("Easy"))
+        b1 = tk.Button(btn_frame, text="Easy (6)", command=lambda: self._refresh_leaderboard("Easy"))
         b1.pack(side="left", padx=10)
-        b2 = tk.Button(btn_frame, text="Medium (4)", command=lambda: refresh_list("Medium"))
+        b2 = tk.Button(btn_frame, text="Medium (4)", command=lambda: self._refresh_leaderboard("Medium"))
         b2.pack(side="left", padx=10)
+        b3 = tk.Button(btn_frame, text="Hard (6)", command=lambda: self._refresh_leaderboard("Hard"))
+        b3.pack(side="left", padx=10)
+        multi_frame = tk.Frame(screen)
+        multi_frame.pack(pady=5)
+        for name in BOARD_MODES:
+            b = tk.Button(multi_frame, text=name, command=lambda name=name: self._refresh_leaderboard(name))
+            b.pack(side="left", padx=10)
 
-        list_frame = tk.Frame(self)
+        list_frame = tk.Frame(screen)
         list_frame.pack(pady=10, fill="both", expand=True)
+        self.board_header = tk.Label(list_frame, text="", font=("Arial", 12, "bold"), fg="#555")
+        self.board_header.pack(pady=5)
+        self.board_empty = tk.Label(list_frame, text="", font=("Arial", 14))
+        head_str = f"{'Rank':<5}{'Name':<14}{'Time(s)':<10}{'Date'}"
+        self.board_columns = tk.Label(list_frame, text=head_str, font=("Consolas", 12, "bold"))
+        self.board_rows = [tk.Label(list_frame, text="", font=("Consolas", 12)) for _ in range(10)]
+        self.board_names = [None] * len(self.board_rows)
+        for i, lbl in enumerate(self.board_rows):
+            lbl.bind("<Button-1>", lambda _e, i=i: self._show_player_stats(self.board_names[i]))
+        self.board_mode = None
+        self.stats_label = tk.Label(list_frame, text="", font=("Consolas", 11), justify="left")
 
-        # Show default
-        refresh_list(default_mode)
-
-        back_btn = tk.Button(self, text="Back", font=("Arial", 13), command=self._build_main_screen)
+        back_btn = tk.Button(screen, text="Back", font=("Arial", 13), command=self._show_main_screen)
         back_btn.pack(pady=16, side="bottom")
 
+    @timed("gui_refresh", screen="leaderboard")
+    def _refresh_leaderboard(self, mode):
+        # Ten fastest of this mode, straight from the store
+        top_10 = self.board.top(mode, 10)
+        self.board_header.config(text=f"{mode.upper()} MODE")
+        self.board_mode = mode
+        
+        # Same widgets every time; only their text and visibility change
+        for lbl in [self.board_empty, self.board_columns] + self.board_rows + [self.stats_label]:
+            lbl.pack_forget()
+        if not top_10:
+            self.board_empty.config(text=f"No {mode} records yet.")
+            self.board_empty.pack(pady=20)
+        else:
+            self.board_columns.pack()
+        for i, entry in enumerate(top_10, 1):
+            name = entry.get("name", "Unknown")
+            time_sec = entry.get("time", 0)
+            date = entry.get("date", "")
+            s = f"{i:>2}    {name:<14}{time_sec:7.2f}   {date[:10]}"
+            lbl = self.board_rows[i - 1]
+            lbl.config(text=s)
+            lbl.pack(anchor="w", padx=20)
+            self.board_names[i - 1] = name
+        self.stats_label.pack(pady=(12, 0))
+        self._show_player_stats(self.player_name)
+
+    def _show_player_stats(self, name):
+        # Running totals: one indexed lookup, however many games were played
+        if not name:
+            self.stats_label.config(text="Click a player to see their stats.")
+            return
+        mode = self.board_mode
+        try:
+            stats = self.board.player_stats(name, mode)
+        except Exception:
+            stats = None
+        if stats is None:
+            self.stats_label.config(text=f"No {mode} games played by {name} yet.")
+            return
+        self.stats_label.config(text="\n".join([f"{name} - {mode} stats"] + format_stats(stats)))
+
+    def _show_leaderboard_screen(self, default_mode="Easy"):
+        # Show default
+        self._refresh_leaderboard(default_mode)
+        self._show_screen("leaderboard")
+
 if __name__ == "__main__":
     import sys
     
+    timing = "--timing" in sys.argv
+    if timing:
+        sys.argv.remove("--timing")
     if len(sys.argv) >= 3:
         try:
             WINDOW_WIDTH = int(sys.argv[1])
@@ -437,5 +857,5 @@ if __name__ == "__main__":
         except ValueError:
             print("Invalid arguments. Usage: python wordle_gui.py [width] [height]")
     
-    app = WordleGUI()
-    app.mainloop()
\ No newline at end of file
+    app = WordleGUI(timing=timing)
+    app.mainloop()